@@ -12,8 +12,18 @@ import csv
 import re
 from multiprocessing import Process
 from MetaScripts import meta
+from MetaScripts import global_settings as gs
 from Evaluation import GraphDataOrganizer as gdo
 from TriangulationAlgorithms import TriangulationAlgorithm as ta
+from TriangulationAlgorithms import EG
+from TriangulationAlgorithms import LEX_M
+from TriangulationAlgorithms import MCS_M
+from TriangulationAlgorithms import MT
+from TriangulationAlgorithms import SMS
+from TriangulationAlgorithms import CMT
+
+# the modules that contain the triangulate_* functions, whose names are stored in the EvalData json files:
+ALGORITHM_MODULES = [EG, LEX_M, MCS_M, MT, SMS, CMT]
 
 class EvalData:
 	'''
@@ -35,6 +45,22 @@ class EvalData:
 		self.out_mean = None
 		self.out_var = None
 		self.running_time = None
+		# running times of the phases of the algorithm, see TriangulationAlgorithm.get_profile:
+		self.running_time_breakdown = None
+		# counts of the characteristic operations of the algorithm, if they were counted:
+		self.operation_counts = None
+		# the number of nodes removed by each reduction rule, if reduction rules were applied:
+		self.reduction_counts = None
+		# True, if the time limit was exceeded in anytime mode and the output is the best triangulation found until then:
+		self.partial = False
+		# the time in seconds until the output triangulation was found:
+		self.time_to_best = None
+		# the number of randomized repetitions that were actually run, which may differ from repetitions in adaptive mode:
+		self.achieved_repetitions = None
+		# a lower bound for the size of a minimum triangulation, if the algorithm computed one:
+		self.lower_bound = None
+		# the seed of the best randomized repetition, see replay_single_experiment:
+		self.seed = None
 		
 	def __json__(self):
 		return self.to_dict()
@@ -79,6 +105,19 @@ class EvalData:
 		if self.measurement_finished:
 			dict["output"] = self.output
 			dict["running_time"] = self.running_time
+			dict["running_time_breakdown"] = self.running_time_breakdown
+			dict["operation_counts"] = self.operation_counts
+			if not self.reduction_counts == None:
+				dict["reduction_counts"] = self.reduction_counts
+			dict["partial"] = self.partial
+			if not self.time_to_best == None:
+				dict["time_to_best"] = self.time_to_best
+			if not self.achieved_repetitions == None:
+				dict["achieved_repetitions"] = self.achieved_repetitions
+			if not self.lower_bound == None:
+				dict["lower_bound"] = self.lower_bound
+			if not self.seed == None:
+				dict["seed"] = self.seed
 			if not self.out_mean == None:
 				dict["output mean"] = self.out_mean
 			if not self.out_var == None:
@@ -88,10 +127,26 @@ class EvalData:
 	def set_results(self, output, running_time):
 		self.measurement_finished = True
 		self.running_time = running_time
-		if type(output) is dict:
+		if type(output) is dict or isinstance(output, ta.TriangulationResult):
 			self.output = output["size"]
 			self.out_mean = output["mean"]
 			self.out_var = output["variance"]
+			if "profile" in output:
+				self.running_time_breakdown = output["profile"]
+			if "operation_counts" in output:
+				self.operation_counts = output["operation_counts"]
+			if "reduction_counts" in output:
+				self.reduction_counts = output["reduction_counts"]
+			if "partial" in output:
+				self.partial = output["partial"]
+			if "time_to_best" in output:
+				self.time_to_best = output["time_to_best"]
+			if self.is_randomized and "repetitions" in output:
+				self.achieved_repetitions = output["repetitions"]
+			if "lower_bound" in output:
+				self.lower_bound = output["lower_bound"]
+			if "seed" in output:
+				self.seed = output["seed"]
 		else:
 			self.output = output
 
@@ -136,7 +191,7 @@ def run_single_experiment(evaldata):
 	else:
 		timeout = -1
 	try:
-		result = evaldata.algo(evaldata.input, evaldata.is_randomized, evaldata.repetitions, evaldata.reduce_graph, timeout)
+		result = evaldata.algo(evaldata.input, evaldata.is_randomized, evaldata.repetitions, evaldata.reduce_graph, timeout, count_operations=gs.COUNT_OPERATIONS, anytime=gs.ANYTIME, patience=gs.REPETITION_PATIENCE, time_budget=gs.REPETITION_TIME_BUDGET, report_lower_bound=gs.REPORT_LOWER_BOUND)
 		t_end = time.time()
 		t_diff = t_end - t_start
 		evaldata.set_results(result, t_diff)
@@ -146,6 +201,42 @@ def run_single_experiment(evaldata):
 		evaldata.set_failed(t_diff)
 	return evaldata
 	
+def replay_single_experiment(evaldata):
+	'''
+	Reconstructs the best triangulation of a randomized experiment from the seed of its best repetition.
+	Only this repetition is run again, the number of repetitions is passed on since it also configures
+	each repetition of some algorithms, e.g. the minimizations of EGPLUS.
+	The EvalData may also be loaded from a json file, see StatisticsManager.load_evaldata_from_json,
+	then the algorithm is looked up by its name with get_algorithm.
+
+	Return:
+		The triangulation result of the replayed repetition.
+
+	Raises:
+		ParameterMissingException : if the experiment has no seed, e.g. since it is not randomized
+	'''
+	if evaldata.seed == None:
+		raise gdo.ParameterMissingException("Missing parameters for replay: seed")
+	algo = evaldata.algo
+	if type(algo) is str:
+		algo = get_algorithm(algo)
+	return algo(evaldata.input, True, evaldata.repetitions, evaldata.reduce_graph, seed=evaldata.seed)
+
+def get_algorithm(name):
+	'''
+	Looks up a triangulate_* function by its name, as stored by EvalData.to_dict
+
+	Return:
+		The function of one of ALGORITHM_MODULES with this name.
+
+	Raises:
+		ParameterMissingException : if there is no such function
+	'''
+	for module in ALGORITHM_MODULES:
+		if name.startswith("triangulate_") and hasattr(module, name):
+			return getattr(module, name)
+	raise gdo.ParameterMissingException("Wrong parameter: algo: "+name)
+	
 def run_subset_of_experiments(algo, randomized, repetitions, reduce_graph, timelimit, datadir, filename, result_filename):
 	'''
 	Run a specified algorithm on all graphs of a single dataset-file
@@ -105,6 +105,22 @@ def load_evaldata_from_json(basedir, filename):
 				evaldata.out_mean = data["output mean"]
 			if "output variance" in data:
 				evaldata.out_var = data["output variance"]
+			if "running_time_breakdown" in data:
+				evaldata.running_time_breakdown = data["running_time_breakdown"]
+			if "operation_counts" in data:
+				evaldata.operation_counts = data["operation_counts"]
+			if "reduction_counts" in data:
+				evaldata.reduction_counts = data["reduction_counts"]
+			if "partial" in data:
+				evaldata.partial = data["partial"]
+			if "time_to_best" in data:
+				evaldata.time_to_best = data["time_to_best"]
+			if "achieved_repetitions" in data:
+				evaldata.achieved_repetitions = data["achieved_repetitions"]
+			if "lower_bound" in data:
+				evaldata.lower_bound = data["lower_bound"]
+			if "seed" in data:
+				evaldata.seed = data["seed"]
 			evaldataset.append(evaldata)
 	return evaldataset
 	
@@ -277,6 +293,7 @@ def compute_statistics(graphclass, density_class=None, algo=None):
 			mvo = "N/A"
 
 		success = 100*float(len([data.output for data in evaldata if data.output >= 0]))/float(len([data.output for data in evaldata]))
+		mean_operation_counts = aggregate_operation_counts(evaldata)
 
 		newstats = {
 			"algorithm" : algo_name,
@@ -297,12 +314,30 @@ def compute_statistics(graphclass, density_class=None, algo=None):
 		for key in newstats:
 			if not isinstance(newstats[key], str) and np.isnan(newstats[key]):
 				newstats[key] = "N/A"
+		if not mean_operation_counts == None:
+			newstats["mean operation counts"] = mean_operation_counts
 
 		stats.append(newstats)
 	write_stats_to_file(datadir, stats)
 
 	return (columns, stats)
 	
+def aggregate_operation_counts(evaldata):
+	'''
+	Computes the mean count of each operation over all successful experiments that counted operations
+
+	Args:
+		evaldata : a list of EvalData
+
+	Return:
+		a dict {operation : mean count}, or None if no experiment counted operations
+	'''
+	all_counts = [data.operation_counts for data in evaldata if data.output >= 0 and not data.operation_counts == None]
+	if len(all_counts) == 0:
+		return None
+	operations = set([operation for counts in all_counts for operation in counts])
+	return {operation : np.mean([counts.get(operation, 0) for counts in all_counts]) for operation in sorted(operations)}
+
 def write_stats_to_file(datadir, stats):
 	with open(datadir+"/stats.json", 'w') as statsfile:
 		json.dump(stats, statsfile, cls=meta.My_JSON_Encoder)
@@ -19,18 +19,34 @@ MAXCLIQUE_SETTINGS = [4]#[3, 4, 5]
 # algorithm parameters:
 # defines the number of randomized repetitions for randomized algorithms:
 RANDOMIZED_REPETITIONS = [3, 5, 10]
+# if set to a value > 0, the randomized repetitions stop as soon as the best size has not improved for this number of repetitions,
+# or has reached the lower bound of the fill-in:
+REPETITION_PATIENCE = 0
+# if set to a value > 0, the randomized algorithms run repetitions for this many seconds instead of a fixed number of repetitions:
+REPETITION_TIME_BUDGET = -1
 
 # experiment settings:
 # defines the maximum time in second before an algorithm is stopped without result:
 TIMELIMIT = 4
 # defines the number of threads used for parallel experiments:
 MAX_NUM_THREADS = 10
+# if set to True, the algorithms count their characteristic operations (e.g. has_path calls) during the experiments:
+COUNT_OPERATIONS = False
+# if set to True, the randomized algorithms and MT return the best triangulation found until the time limit instead of failing:
+ANYTIME = False
+# if set to True, all algorithms compute a lower bound for the size of a minimum triangulation, which is stored with the results.
+# Otherwise, the lower bound is only stored if it was computed anyway, i.e. by MT or for adaptive repetitions:
+REPORT_LOWER_BOUND = False
 # defines all algorithms, this is used by some of the experiment and evaluation scripts:
-BASE_ALGO_CODES = ["EG", "EGPLUS", "SMS", "LexM", "MCSM", "CMT", "MT"]
+BASE_ALGO_CODES = ["EG", "EGMD", "EGMF", "EGAMD", "EGND", "EGPLUS", "SMS", "LexM", "MCSM", "CMT", "MT"]
 
 # plotting settings:
 PLT_ALGO_COLORS = {
 	"EG" : 'b',
+	"EGMD" : '#1f77b4', # light blue
+	"EGMF" : '#17becf', # cyan
+	"EGAMD" : '#7f7fff', # violet
+	"EGND" : '#8c564b', # brown
 	"EGPLUS" : 'c',
 	"SMS" : 'g',
 	"LexM" : 'm', 
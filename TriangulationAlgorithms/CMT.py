@@ -10,35 +10,17 @@ import time
 import copy
 
 from TriangulationAlgorithms import TriangulationAlgorithm as ta
+from TriangulationAlgorithms import Tracer
+from TriangulationAlgorithms import CompactGraph
 
-def triangulate_CMT(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1):
-	algo = Algorithm_CMT(G, reduce_graph, timeout)
+def triangulate_CMT(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, **kwargs):
+	algo = Algorithm_CMT(G, reduce_graph, timeout, **kwargs)
 	if not randomized:
 		algo.run()
-		return {
-			"H" : algo.get_triangulated(),
-			"size" : len(algo.get_triangulation_edges()),
-			"mean" : len(algo.get_triangulation_edges()),
-			"variance" : 0,
-			"repetitions" : 1
-			}
+		return ta.TriangulationResult(G, algo.get_triangulation_edges(), profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.fill_lower_bound)
 	else:
-		H_opt = None
-		size_opt = None
-		all_sizes = []
-		for i in range(repetitions):
-			algo.run_randomized()
-			all_sizes.append(len(algo.get_triangulation_edges()))
-			if H_opt == None or len(algo.get_triangulation_edges()) < size_opt:
-				H_opt = algo.get_triangulated()
-				size_opt = len(algo.get_triangulation_edges())
-		return {
-			"H" : H_opt,
-			"size" : size_opt,
-			"mean" : np.mean(all_sizes),
-			"variance" : np.var(all_sizes),
-			"repetitions" : repetitions
-			}
+		(F_opt, alpha_opt, all_sizes) = algo.run_repetitions(repetitions)
+		return ta.TriangulationResult(G, F_opt, np.mean(all_sizes), np.var(all_sizes), len(all_sizes), profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.fill_lower_bound, seed=algo.seed_opt)
 
 class Algorithm_CMT(ta.TriangulationAlgorithm):
 	'''
@@ -51,42 +33,27 @@ class Algorithm_CMT(ta.TriangulationAlgorithm):
 		G : a graph in netwokx format
 	'''
 	
-	def __init__(self, G, reduce_graph=True, timeout=-1):
+	def __init__(self, G, reduce_graph=True, timeout=-1, **kwargs):
 		logging.info("=== CMT.Algorithm_CMT.init ===")
-		super().__init__(G, reduce_graph, timeout)
+		super().__init__(G, reduce_graph, timeout, **kwargs)
 
-	def run(self):
-		for C in self.component_subgraphs:
-			# get triangulation for each connected component of the reduced graph G_c:
-			logging.debug("Next component: "+str(C.nodes()))
-
-			F = self.get_edges_of_inverse_graph(C)
-			logging.debug("possible chord edges of this component: "+str(F))
-
-			self.edges_of_triangulation += self.minimize_triangulation(C, F, False)
-		
-		self.H = self.G.copy()
-		self.H.add_edges_from(self.edges_of_triangulation)
+	def triangulate(self, C, randomized=False):
+		'''
+		Computes a minimal triangulation of C by minimizing the triangulation of C into a complete graph
 		
-		if not nx.is_chordal(self.H):
-			raise ta.TriangulationNotSuccessfulException("Resulting graph is somehow not chordal!")
-
-	def run_randomized(self):
-		self.edges_of_triangulation = []
-		for C in self.component_subgraphs:
-			# get triangulation for each connected component of the reduced graph G_c:
-			logging.debug("Next component: "+str(C.nodes()))
+		Args:
+			C : a graph in CompactGraph format
+			randomized : if set to True, the order in which removeable edges are removed is randomized
 			
-			F = self.get_edges_of_inverse_graph(C)
-			#logging.debug("possible chord edges of this component: "+str(F))
+		Returns:
+			F : a set of edges s.t. C + F is a minimal triangulation C.
+		'''
+		logging.debug("Next component: %s", C.labels)
 
-			self.edges_of_triangulation += self.minimize_triangulation(C, F, True)
-		
-		self.H = self.G.copy()
-		self.H.add_edges_from(self.edges_of_triangulation)
-		
-		if not nx.is_chordal(self.H):
-			raise ta.TriangulationNotSuccessfulException("Resulting graph is somehow not chordal!")
+		F = self.get_edges_of_inverse_graph(C)
+		logging.debug("possible chord edges of this component: %s", F)
+
+		return self.minimize_triangulation(C, F, randomized)
 
 	def minimize_triangulation(self, G, F, randomized, T=None):
 		'''
@@ -96,7 +63,7 @@ class Algorithm_CMT(ta.TriangulationAlgorithm):
 		Mezzini, Moscarini: Simple algorithms for minimal triangulation of a graph and backward selection of a decomposable Markov network (see above)
 		
 		Args:
-			G : a graph
+			G : a graph in CompactGraph format or in networkx format
 			F : a set of edges, s.t. G + F is chordal
 			randomized : if set to True, get_removeable_edge is randomized
 			T : a pre-initialized database of removeable edges. If G + F is not a full graph, it is required to specify T!
@@ -105,13 +72,26 @@ class Algorithm_CMT(ta.TriangulationAlgorithm):
 			F_prime : a subset of F, s.t. G + F_prime is minimal chordal
 		'''
 		logging.info("=== CMT.minimize_triangulation ===")
+
+		if not isinstance(G, CompactGraph.CompactGraph):
+			# relabel the nodes to indices, minimize, and map the result back to the original labels:
+			CG = CompactGraph.CompactGraph(G)
+			T_indexed = None
+			if not T == None:
+				T_indexed = {}
+				for edge in T:
+					T_indexed[CG.index[edge[0]], CG.index[edge[1]]] = set(CG.get_indexed_edges(T[edge]))
+			F_prime = self.minimize_triangulation(CG, CG.get_indexed_edges(F), randomized, T_indexed)
+			return CG.get_labeled_edges(F_prime)
 		
 		F_prime = copy.deepcopy(F)
 		H = G.copy()
 		H.add_edges_from(F_prime)
 
 		# initialize set V_F of all nodes that are endpoint of some edge in F:
-		V_F = list(set([v for e in F_prime for v in e]))
+		V_F = set([v for e in F_prime for v in e])
+		counting = not self.operation_counts == None
+		tracer = Tracer.TRACER
 		
 		# initialize T: all edges e with len(T[e]) == 0 are removeable
 		if T == None:
@@ -126,56 +106,90 @@ class Algorithm_CMT(ta.TriangulationAlgorithm):
 			if self.timeout > 0 and time.time() > self.timeout:
 				raise ta.TimeLimitExceededException("Time Limit Exceeded!")
 				
-			logging.debug("Consider removeable edge "+str(edge_uv))
+			if not tracer == None:
+				tracer.event("remove", edge=(G.labels[edge_uv[0]], G.labels[edge_uv[1]]))
 			u = edge_uv[0]
 			v = edge_uv[1]
+			if counting:
+				self.count_operation("get_common_neighborhood", len(T)+1)
 			for edge_rs in T:
 				r = edge_rs[0]
 				s = edge_rs[1]
 				cn_of_rs_cap_VF = [n for n in self.get_common_neighborhood(H,[r,s]) if n in V_F]
 				if u in cn_of_rs_cap_VF and v in cn_of_rs_cap_VF:
 					T[edge_rs].add(edge_uv)
+					if counting:
+						self.count_operation("T_updates")
 			cn_of_uv_cap_VF = [n for n in self.get_common_neighborhood(H,[u,v]) if n in V_F]
 			for x in cn_of_uv_cap_VF:
 				if (u,x) in F_prime:
 					for e in [e for e in T[(u,x)] if v in e]:
 						T[(u,x)].discard(e)
+						if counting:
+							self.count_operation("T_updates")
 				# edges here are tuples, order is required for equality
 				if (x,u) in F_prime:
 					for e in [e for e in T[(x,u)] if v in e]:
 						T[(x,u)].discard(e)
+						if counting:
+							self.count_operation("T_updates")
 				if (v,x) in F_prime:
 					for e in [e for e in T[(v,x)] if u in e]:
 						T[(v,x)].discard(e)
+						if counting:
+							self.count_operation("T_updates")
 				if (x,v) in F_prime:
 					for e in [e for e in T[(x,v)] if u in e]:
 						T[(x,v)].discard(e)
+						if counting:
+							self.count_operation("T_updates")
 			F_prime.remove(edge_uv)
 			H.remove_edges_from([edge_uv])
 			edge_uv = self.get_removeable_edge(F_prime, T, randomized)
 
 		return F_prime
 		
+	def get_removeable_edge_database(self, G, F):
+		'''
+		Initializes the database T of removeable edges for a triangulation G + F that is not a complete graph.
+		For each edge e in F, T[e] contains all pairs of non-adjacent nodes in the common neighborhood of e in G + F,
+		the common neighborhoods are computed by intersecting the bitsets of the endpoints.
+
+		Args:
+			G : a graph in CompactGraph format
+			F : a set of edges between indices of G, s.t. G + F is chordal
+
+		Returns:
+			T : a dict {edge: set of edges} as required by minimize_triangulation.
+				Since minimize_triangulation modifies T, each minimization of the same triangulation needs its own copy of T.
+		'''
+		bits = list(G.bits)
+		for (u, v) in F:
+			bits[u] |= 1 << v
+			bits[v] |= 1 << u
+		T = {}
+		for e in F:
+			common = bits[e[0]] & bits[e[1]]
+			Te = set()
+			for x in CompactGraph.iterate_bits(common):
+				# the nodes of the common neighborhood after x that are not adjacent to x:
+				for y in CompactGraph.iterate_bits(common & ~bits[x] & ~((2 << x) - 1)):
+					Te.add((x, y))
+			T[e] = Te
+		return T
+
 	def get_edges_of_inverse_graph(self, G):
 		'''
 		computes all edges that are not in G
 
 		Args:
-			G : a graph in networkx format
+			G : a graph in CompactGraph format
 
 		Returns:
 			F : a set of edges s.t. no edge from F is in G and G + F is a complete graph
 		'''
 
-		F = []
-		E = [e for e in G.edges()]
-		V = list(G.nodes())
-		for i in range(len(G.nodes())):
-			for j in range(i+1, len(G.nodes())):
-				e = (V[i],V[j])
-				if e not in E:
-					F.append(e)
-		return F
+		return G.get_non_edges()
 
 	def get_removeable_edge(self, F, T, randomized):
 		'''
@@ -208,17 +222,4 @@ class Algorithm_CMT(ta.TriangulationAlgorithm):
 		Computes the common neighborhood of V in G, that is:
 			NC(V') = {w in V(G) | forall v in V': w in N(v)}
 		'''
-		neighbor_count = {}
-		
-		for i in range(len(V)):
-			for w in G.neighbors(V[i]):
-				if not w in neighbor_count:
-					neighbor_count[w] = 0
-				neighbor_count[w] += 1
-		
-		common_neighbothood = []
-		for w in neighbor_count:
-			if neighbor_count[w] == len(V):
-				common_neighbothood.append(w)
-				
-		return common_neighbothood
\ No newline at end of file
+		return [w for w in CompactGraph.iterate_bits(G.get_common_neighbors(V))]
@@ -0,0 +1,418 @@
+#!usr/bin/python
+# -*- coding: utf-8 -*-
+
+import bisect
+
+import networkx as nx
+
+class CompactGraph:
+	'''
+	Integer-indexed graph representation that is used internally by all triangulation algorithms.
+	The nodes are relabeled to 0,...,n-1, and the adjacency of each node is stored
+	as a sorted list of neighbor indices and as a python-int bitset.
+	Edges that are computed on a CompactGraph are mapped back to the original node labels with get_labeled_edges.
+
+	Args:
+		G : a graph in networkx format
+		nodes : an optional list of the nodes of G that defines the relabeling. Defaults to the node order of G.
+
+	Attributes:
+		labels : a list that maps each index to the original label of the node
+		index : a dict that maps each original node label to its index
+		adj : a list that contains for each node the sorted list of its neighbors
+		bits : a list that contains for each node a bitset of its neighbors, i.e. bit j of bits[i] is set iff i and j are adjacent
+	'''
+	def __init__(self, G=None, nodes=None):
+		if G == None:
+			self.labels = []
+			self.index = {}
+			self.adj = []
+			self.bits = []
+			return
+		if nodes == None:
+			nodes = [n for n in G]
+		self.labels = list(nodes)
+		self.index = {self.labels[i] : i for i in range(len(self.labels))}
+		self.adj = []
+		self.bits = []
+		for v in self.labels:
+			neighbors = sorted([self.index[u] for u in G.neighbors(v) if u in self.index and not u == v])
+			b = 0
+			for u in neighbors:
+				b |= 1 << u
+			self.adj.append(neighbors)
+			self.bits.append(b)
+
+	def __len__(self):
+		return len(self.labels)
+
+	def __iter__(self):
+		return iter(range(len(self.labels)))
+
+	def __contains__(self, v):
+		return 0 <= v < len(self.labels)
+
+	def nodes(self):
+		return range(len(self.labels))
+
+	def neighbors(self, v):
+		return self.adj[v]
+
+	def degree(self, v):
+		return len(self.adj[v])
+
+	def has_edge(self, u, v):
+		return (self.bits[u] >> v) & 1 == 1
+
+	def edges(self):
+		return [(u, v) for u in range(len(self.adj)) for v in self.adj[u] if u < v]
+
+	def number_of_edges(self):
+		return sum([len(a) for a in self.adj]) // 2
+
+	def add_edge(self, u, v):
+		if u == v or self.has_edge(u, v):
+			return
+		bisect.insort(self.adj[u], v)
+		bisect.insort(self.adj[v], u)
+		self.bits[u] |= 1 << v
+		self.bits[v] |= 1 << u
+
+	def add_edges_from(self, edges):
+		'''
+		Adds a list of edges. Fewer edges than nodes are inserted one by one,
+		otherwise the new neighbors of each node are collected first, such that each adjacency list is only sorted once
+		and each bitset is only updated once, e.g. for the fill edges of a whole triangulation
+		'''
+		if len(edges) < len(self.adj):
+			for (u, v) in edges:
+				self.add_edge(u, v)
+			return
+		new_neighbors = {}
+		for (u, v) in edges:
+			if u == v or self.has_edge(u, v):
+				continue
+			if u not in new_neighbors:
+				new_neighbors[u] = set()
+			if v not in new_neighbors:
+				new_neighbors[v] = set()
+			new_neighbors[u].add(v)
+			new_neighbors[v].add(u)
+		for u in new_neighbors:
+			self.adj[u] += new_neighbors[u]
+			self.adj[u].sort()
+			mask = bytearray((len(self.adj) + 7) // 8)
+			for v in new_neighbors[u]:
+				mask[v >> 3] |= 1 << (v & 7)
+			self.bits[u] |= int.from_bytes(mask, "little")
+
+	def remove_edge(self, u, v):
+		if not self.has_edge(u, v):
+			return
+		self.adj[u].remove(v)
+		self.adj[v].remove(u)
+		self.bits[u] &= ~(1 << v)
+		self.bits[v] &= ~(1 << u)
+
+	def remove_edges_from(self, edges):
+		for (u, v) in edges:
+			self.remove_edge(u, v)
+
+	def copy(self):
+		C = CompactGraph()
+		C.labels = self.labels
+		C.index = self.index
+		C.adj = [list(a) for a in self.adj]
+		C.bits = list(self.bits)
+		return C
+
+	def subgraph(self, nodes):
+		'''
+		Constructs the induced subgraph on a set of nodes as a new CompactGraph.
+		The nodes of the subgraph are relabeled to 0,...,len(nodes)-1 in the given order,
+		their labels refer to the labels of the original graph.
+
+		Args:
+			nodes : a list of indices of this graph
+
+		Returns:
+			S : the induced subgraph as a CompactGraph
+		'''
+		S = CompactGraph()
+		position = {nodes[i] : i for i in range(len(nodes))}
+		S.labels = [self.labels[v] for v in nodes]
+		S.index = {S.labels[i] : i for i in range(len(nodes))}
+		for v in nodes:
+			neighbors = sorted([position[u] for u in self.adj[v] if u in position])
+			b = 0
+			for u in neighbors:
+				b |= 1 << u
+			S.adj.append(neighbors)
+			S.bits.append(b)
+		return S
+
+	def get_biconnected_components(self):
+		'''
+		Computes the blocks (maximal 2-connected subgraphs and bridges) of the graph
+		with an iterative version of the algorithm by Hopcroft and Tarjan, running time in O(n+m)
+			Hopcroft, Tarjan: Algorithm 447: efficient algorithms for graph manipulation
+			https://dl.acm.org/doi/10.1145/362248.362272
+
+		Returns:
+			blocks : a list of blocks, each given as a list of nodes.
+				Bridges are blocks with two nodes, isolated nodes are not contained in any block.
+		'''
+		n = len(self.adj)
+		dfs_index = [-1]*n
+		low = [0]*n
+		parent = [-1]*n
+		blocks = []
+		counter = 0
+		for root in range(n):
+			if dfs_index[root] >= 0:
+				continue
+			dfs_index[root] = counter
+			low[root] = counter
+			counter += 1
+			node_stack = [root]
+			# the dfs stack contains pairs of nodes and the position of the next neighbor to visit:
+			dfs_stack = [[root, 0]]
+			while len(dfs_stack) > 0:
+				entry = dfs_stack[-1]
+				v = entry[0]
+				neighbors = self.adj[v]
+				advanced = False
+				while entry[1] < len(neighbors):
+					w = neighbors[entry[1]]
+					entry[1] += 1
+					if dfs_index[w] < 0:
+						parent[w] = v
+						dfs_index[w] = counter
+						low[w] = counter
+						counter += 1
+						node_stack.append(w)
+						dfs_stack.append([w, 0])
+						advanced = True
+						break
+					elif not w == parent[v] and dfs_index[w] < low[v]:
+						low[v] = dfs_index[w]
+				if advanced:
+					continue
+				dfs_stack.pop()
+				if len(dfs_stack) > 0:
+					u = dfs_stack[-1][0]
+					if low[v] < low[u]:
+						low[u] = low[v]
+					if low[v] >= dfs_index[u]:
+						# u separates the subtree of v from the rest of the graph:
+						block = [u]
+						w = None
+						while not w == v:
+							w = node_stack.pop()
+							block.append(w)
+						blocks.append(block)
+		return blocks
+
+	def get_connected_components(self, nodes=None):
+		'''
+		Computes the connected components of the subgraph induced by a set of nodes with a breadth-first search, running time in O(n+m)
+
+		Args:
+			nodes : a list of nodes, by default all nodes
+
+		Returns:
+			components : a list of components, each given as a sorted list of nodes, ordered by their smallest node
+		'''
+		n = len(self.adj)
+		if nodes == None:
+			allowed = [True]*n
+		else:
+			allowed = [False]*n
+			for v in nodes:
+				allowed[v] = True
+		components = []
+		for root in range(n):
+			if not allowed[root]:
+				continue
+			allowed[root] = False
+			component = [root]
+			i = 0
+			while i < len(component):
+				for w in self.adj[component[i]]:
+					if allowed[w]:
+						allowed[w] = False
+						component.append(w)
+				i += 1
+			components.append(sorted(component))
+		return components
+
+	def is_clique(self, nodes):
+		'''
+		Checks if a set of nodes is pairwise adjacent
+		'''
+		mask = 0
+		for v in nodes:
+			mask |= 1 << v
+		for v in nodes:
+			if not (self.bits[v] | (1 << v)) & mask == mask:
+				return False
+		return True
+
+	def get_common_neighbors(self, nodes):
+		'''
+		Computes the set of nodes that are adjacent to all nodes in a given set, as a bitset
+		'''
+		common = -1
+		for v in nodes:
+			common &= self.bits[v]
+		if common < 0:
+			return 0
+		return common
+
+	def has_path(self, source, target, nodes=-1):
+		'''
+		Checks if there is a path from source to target in the subgraph induced by a set of nodes
+
+		Args:
+			source : the start node
+			target : the target node
+			nodes : a bitset of the nodes that may be used by the path, source and target are always allowed.
+				By default, all nodes are allowed.
+
+		Returns:
+			True, if such a path exists, otherwise False
+		'''
+		if source == target:
+			return True
+		allowed = nodes | (1 << target)
+		target_bit = 1 << target
+		reached = 1 << source
+		frontier = reached
+		while frontier:
+			new = 0
+			for v in iterate_bits(frontier):
+				new |= self.bits[v]
+			new &= allowed & ~reached
+			if new & target_bit:
+				return True
+			reached |= new
+			frontier = new
+		return False
+
+	def get_non_edges(self):
+		'''
+		Computes all pairs of distinct nodes that are not adjacent, i.e. the edges of the complement graph.
+		'''
+		return [(u, v) for u in range(len(self.adj)) for v in range(u+1, len(self.adj)) if not (self.bits[u] >> v) & 1]
+
+	def is_chordal(self):
+		'''
+		Checks if the graph is chordal by testing if the reverse of a maximum cardinality search ordering
+		is a perfect elimination ordering.
+			Tarjan, Yannakakis: Simple linear-time algorithms to test chordality of graphs
+			https://epubs.siam.org/doi/10.1137/0213035
+		'''
+		return self.is_perfect_elimination_ordering(self.get_mcs_ordering())
+
+	def get_mcs_ordering(self):
+		'''
+		Maximum cardinality search with weight buckets, running time in O(n+m)
+
+		Returns:
+			ordering : a list of all nodes in elimination order, i.e. the reverse of the order in which they are visited
+		'''
+		n = len(self.adj)
+		weight = [0]*n
+		numbered = [False]*n
+		buckets = [set(range(n))]
+		max_weight = 0
+		visit_order = []
+		for i in range(n):
+			while max_weight > 0 and len(buckets[max_weight]) == 0:
+				max_weight -= 1
+			v = buckets[max_weight].pop()
+			numbered[v] = True
+			visit_order.append(v)
+			for u in self.adj[v]:
+				if not numbered[u]:
+					buckets[weight[u]].discard(u)
+					weight[u] += 1
+					if weight[u] == len(buckets):
+						buckets.append(set())
+					buckets[weight[u]].add(u)
+					if weight[u] > max_weight:
+						max_weight = weight[u]
+		visit_order.reverse()
+		return visit_order
+
+	def is_perfect_elimination_ordering(self, ordering):
+		'''
+		Checks if an ordering of the nodes is a perfect elimination ordering,
+		i.e. if each node together with its neighbors that are eliminated later forms a clique.
+		For each node only the inclusion of its later neighbors in the neighborhood of its first later neighbor is tested.
+
+		Args:
+			ordering : a list of all nodes in elimination order
+
+		Returns:
+			True, if ordering is a perfect elimination ordering, otherwise False
+		'''
+		position = [0]*len(self.adj)
+		for i in range(len(ordering)):
+			position[ordering[i]] = i
+		for v in ordering:
+			later_neighbors = [u for u in self.adj[v] if position[u] > position[v]]
+			if len(later_neighbors) > 1:
+				parent = min(later_neighbors, key=lambda x: position[x])
+				mask = 0
+				for u in later_neighbors:
+					if not u == parent:
+						mask |= 1 << u
+				if not self.bits[parent] & mask == mask:
+					return False
+		return True
+
+	def get_labeled_edges(self, edges):
+		'''
+		Maps a list of edges between indices to a list of edges between the original node labels
+		'''
+		return [(self.labels[u], self.labels[v]) for (u, v) in edges]
+
+	def get_indexed_edges(self, edges):
+		'''
+		Maps a list of edges between original node labels to a list of edges between indices
+		'''
+		return [(self.index[u], self.index[v]) for (u, v) in edges]
+
+	def get_labeled_ordering(self, alpha):
+		'''
+		Maps an ordering {index: position} to an ordering {label: position}
+		'''
+		return {self.labels[v] : alpha[v] for v in alpha}
+
+	def to_networkx(self):
+		'''
+		Constructs a networkx graph with the nodes 0,...,n-1 that is isomorphic to this graph
+		'''
+		G = nx.Graph()
+		G.add_nodes_from(range(len(self.adj)))
+		G.add_edges_from(self.edges())
+		return G
+
+def iterate_bits(b):
+	'''
+	Iterates the indices of all set bits of a bitset in increasing order
+	'''
+	while b:
+		low = b & -b
+		yield low.bit_length() - 1
+		b ^= low
+
+def count_bits(b):
+	'''
+	Counts the set bits of a bitset
+	'''
+	return bin(b).count("1")
+
+if hasattr(int, "bit_count"):
+	count_bits = int.bit_count
@@ -0,0 +1,170 @@
+#!usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''
+Dense graph backend for the triangulation algorithms.
+
+For graphs with a high density, the adjacency of a CompactGraph is stored as a NumPy boolean matrix,
+such that the saturation of neighborhoods in the elimination game, the reachability sweeps of LEX M and MCS-M
+and the verification of perfect elimination orderings are computed with vectorized row operations instead of per-pair edge lookups.
+The algorithms that support the backend use it if dense_backend is set to True,
+or if it is set to "auto" and the component is dense according to is_dense.
+'''
+
+import numpy as np
+
+# components with at least this density are triangulated with the dense backend if dense_backend is "auto":
+DENSITY_THRESHOLD = 0.3
+# smaller components are always triangulated with the sparse representation, since their bitsets fit into a few machine words:
+MIN_NODES = 64
+
+class DenseGraph:
+	'''
+	Adjacency matrix representation of a CompactGraph with the same node indices
+
+	Args:
+		C : a graph in CompactGraph format
+
+	Attributes:
+		matrix : a boolean NumPy array of shape (n, n), matrix[u, v] is True iff u and v are adjacent
+	'''
+	def __init__(self, C):
+		n = len(C)
+		self.matrix = np.zeros((n, n), dtype=bool)
+		for v in C:
+			self.matrix[v, C.adj[v]] = True
+
+	def __len__(self):
+		return self.matrix.shape[0]
+
+	def add_edges_from(self, edges):
+		if len(edges) == 0:
+			return
+		endpoints = np.array(edges, dtype=np.intp)
+		self.matrix[endpoints[:,0], endpoints[:,1]] = True
+		self.matrix[endpoints[:,1], endpoints[:,0]] = True
+
+	def is_perfect_elimination_ordering(self, ordering):
+		'''
+		Checks if an ordering of the nodes is a perfect elimination ordering, as CompactGraph.is_perfect_elimination_ordering,
+		but with one vectorized row comparison for each node
+
+		Args:
+			ordering : a list of all nodes in elimination order
+
+		Returns:
+			True, if ordering is a perfect elimination ordering, otherwise False
+		'''
+		permutation = np.array(ordering, dtype=np.intp)
+		permuted = self.matrix[np.ix_(permutation, permutation)]
+		for i in range(len(ordering)-1):
+			later_neighbors = permuted[i, i+1:]
+			j = later_neighbors.argmax()
+			if later_neighbors[j]:
+				parent = i + 1 + j
+				if (permuted[i, parent+1:] & ~permuted[parent, parent+1:]).any():
+					return False
+		return True
+
+	def get_fill_edges(self, ordering):
+		'''
+		Computes the fill edges of the elimination game for an ordering.
+		The rows of the matrix are permuted into elimination order, and each eliminated node only adds its later neighbors
+		to the row of its first later neighbor, since all later neighbors of a node are adjacent in the filled graph
+		to its first later neighbor (see the follower function of Tarjan and Yannakakis).
+		The running time is in O(n^2) row operations, independent of the number of fill edges.
+
+		Args:
+			ordering : a list of all nodes in elimination order
+
+		Returns:
+			F : a list of fill edges (u, v) with u < v, ordered by the position of their first eliminated node,
+				then by the position of the other node
+		'''
+		n = len(ordering)
+		permutation = np.array(ordering, dtype=np.intp)
+		original = self.matrix[np.ix_(permutation, permutation)]
+		filled = original.copy()
+		for i in range(n-1):
+			later_neighbors = filled[i, i+1:]
+			j = later_neighbors.argmax()
+			if later_neighbors[j]:
+				parent = i + 1 + j
+				filled[parent, parent+1:] |= filled[i, parent+1:]
+		(rows, columns) = np.nonzero(np.triu(filled & ~original, 1))
+		F = []
+		for k in range(len(rows)):
+			u = ordering[rows[k]]
+			v = ordering[columns[k]]
+			if u < v:
+				F.append((u, v))
+			else:
+				F.append((v, u))
+		return F
+
+	def get_reachable_nodes(self, v, weight, unnumbered):
+		'''
+		Computes all unnumbered nodes u that are reachable from v by a path whose inner nodes are unnumbered
+		and have a smaller weight than u, as needed by LEX M and MCS-M.
+		The nodes are processed by increasing weight in a single sweep: before the nodes of a weight class are checked,
+		the search from v is extended by all lighter nodes it touches, so each node enters the search at most once.
+
+		Args:
+			v : the node that is numbered in the current step
+			weight : an integer NumPy array with the weight of each node, e.g. the rank of the label of each node in LEX M
+			unnumbered : a boolean NumPy array that marks the unnumbered nodes, v is ignored
+
+		Returns:
+			reached : a boolean NumPy array that marks all reachable nodes u
+		'''
+		candidates = unnumbered.copy()
+		candidates[v] = False
+		candidate_nodes = np.flatnonzero(candidates)
+		reached = np.zeros(len(weight), dtype=bool)
+		if len(candidate_nodes) == 0:
+			return reached
+		# group the candidates by weight:
+		candidate_nodes = candidate_nodes[np.argsort(weight[candidate_nodes], kind="stable")]
+		candidate_weights = weight[candidate_nodes]
+		boundaries = np.flatnonzero(np.diff(candidate_weights)) + 1
+		classes = np.split(candidate_nodes, boundaries)
+		# the nodes that are adjacent to v or to a node of the search:
+		touched = self.matrix[v].copy()
+		searched = np.zeros(len(weight), dtype=bool)
+		allowed = np.zeros(len(weight), dtype=bool)
+		for k in range(len(classes)):
+			if k > 0:
+				# the lighter nodes may be used as inner nodes of paths to the current class:
+				lighter = classes[k-1]
+				allowed[lighter] = True
+				frontier = lighter[touched[lighter]]
+				while len(frontier) > 0:
+					searched[frontier] = True
+					touched |= self.matrix[frontier].any(axis=0)
+					frontier = np.flatnonzero(touched & allowed & ~searched)
+			reached[classes[k]] = touched[classes[k]]
+		return reached
+
+def is_dense(C):
+	'''
+	Checks if a graph is large and dense enough to be triangulated with the dense backend
+	'''
+	n = len(C)
+	if n < MIN_NODES:
+		return False
+	return 2 * C.number_of_edges() >= DENSITY_THRESHOLD * n * (n-1)
+
+def use_dense_backend(C, dense_backend="auto"):
+	'''
+	Decides if a component is triangulated with the dense backend
+
+	Args:
+		C : a graph in CompactGraph format
+		dense_backend : True, False or "auto", see TriangulationAlgorithm
+
+	Returns:
+		True, if the dense backend is used for C
+	'''
+	if dense_backend == "auto":
+		return is_dense(C)
+	return dense_backend == True
@@ -7,162 +7,607 @@ import networkx as nx
 import random
 import numpy as np
 import time
+import heapq
+import concurrent.futures
 
 from TriangulationAlgorithms import TriangulationAlgorithm as ta
+from TriangulationAlgorithms import CompactGraph
+from TriangulationAlgorithms import DenseGraph
+from TriangulationAlgorithms import Tracer
 from TriangulationAlgorithms import CMT
 
-def triangulate_EG(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1):
-	algo = Algorithm_EliminationGame(G, reduce_graph, timeout)
+def triangulate_EG(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, **kwargs):
+	algo = Algorithm_EliminationGame(G, reduce_graph, timeout, **kwargs)
 	if not randomized:
 		algo.run()
-		return {
-			"H" : algo.get_triangulated(),
-			"size" : len(algo.get_triangulation_edges()),
-			"mean" : len(algo.get_triangulation_edges()),
-			"variance" : 0,
-			"repetitions" : 1
-			}
+		return ta.TriangulationResult(G, algo.get_triangulation_edges(), profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.fill_lower_bound)
 	else:
-		H_opt = None
-		size_opt = None
-		all_sizes = []
-		for i in range(repetitions):
-			algo.run_randomized()
-			all_sizes.append(len(algo.get_triangulation_edges()))
-			if H_opt == None or len(algo.get_triangulation_edges()) < size_opt:
-				H_opt = algo.get_triangulated()
-				size_opt = len(algo.get_triangulation_edges())
-		return {
-			"H" : H_opt,
-			"size" : size_opt,
-			"mean" : np.mean(all_sizes),
-			"variance" : np.var(all_sizes),
-			"repetitions" : repetitions
-			}
+		(F_opt, alpha_opt, all_sizes) = algo.run_repetitions(repetitions)
+		return ta.TriangulationResult(G, F_opt, np.mean(all_sizes), np.var(all_sizes), len(all_sizes), profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.fill_lower_bound, seed=algo.seed_opt)
+
+def triangulate_EGMD(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, **kwargs):
+	'''
+	run Elimination Game with a greedy minimum degree ordering
+	'''
+	return triangulate_EG(G, randomized, repetitions, reduce_graph, timeout, ordering="min_degree", **kwargs)
+
+def triangulate_EGMF(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, **kwargs):
+	'''
+	run Elimination Game with a greedy minimum fill ordering
+	'''
+	return triangulate_EG(G, randomized, repetitions, reduce_graph, timeout, ordering="min_fill", **kwargs)
+
+def triangulate_EGAMD(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, **kwargs):
+	'''
+	run Elimination Game with an approximate minimum degree ordering
+	'''
+	return triangulate_EG(G, randomized, repetitions, reduce_graph, timeout, ordering="amd", **kwargs)
+
+def triangulate_EGND(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, **kwargs):
+	'''
+	run Elimination Game with a nested dissection ordering
+	'''
+	return triangulate_EG(G, randomized, repetitions, reduce_graph, timeout, ordering="nested_dissection", **kwargs)
 	
-def triangulate_EGPLUS(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1):
+def triangulate_EGPLUS(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, **kwargs):
 	'''
 	run Elimination Game, but minimize the result using CMT
 	'''
-	algo = Algorithm_EliminationGame(G, reduce_graph, timeout)
-	minimizer = CMT.Algorithm_CMT(G, False, timeout)
+	algo = Algorithm_EliminationGamePlus(G, reduce_graph, timeout, minimizations=repetitions, **kwargs)
 	if not randomized:
 		algo.run()
-		F = algo.get_triangulation_edges()
-		
-		# initialize database of removable edges:
-		H = G.copy()
-		H.add_edges_from(F)
-		T = {}
-		for e in F:
-			Te = []
-			common_neighborhood = [n for n in H.nodes if (n,e[0]) in H.edges() and (n,e[1]) in H.edges()]
-			for i in range(len(common_neighborhood)):
-				for j in range(i+1, len(common_neighborhood)):
-					if (common_neighborhood[i], common_neighborhood[j]) not in H.edges():
-						Te.append((common_neighborhood[i], common_neighborhood[j]))
-			T[e] = set(Te)
-		
-		F_prime = minimizer.minimize_triangulation(G, algo.get_triangulation_edges(), False, T)
-		H_prime = G.copy()
-		H_prime.add_edges_from(F_prime)
-		
-		if not nx.is_chordal(H):
-			raise ta.TriangulationNotSuccessfulException("Resulting graph is somehow not chordal!")
-			
-		return {
-			"H" : H_prime,
-			"size" : len(F_prime),
-			"mean" : len(F_prime),
-			"variance" : 0,
-			"repetitions" : 1
-			}
+		return ta.TriangulationResult(G, algo.get_triangulation_edges(), profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.fill_lower_bound)
 	else:
-		H_opt = None
-		size_opt = None
-		all_sizes = []
-		for i in range(repetitions):
-			algo.run_randomized()
-			F = algo.get_triangulation_edges()
-			
-			# initialize database of removable edges:
-			H = G.copy()
-			H.add_edges_from(F)
-			T = {}
-			for e in F:
-				Te = []
-				common_neighborhood = [n for n in H.nodes if (n,e[0]) in H.edges() and (n,e[1]) in H.edges()]
-				for i in range(len(common_neighborhood)):
-					for j in range(i+1, len(common_neighborhood)):
-						if (common_neighborhood[i], common_neighborhood[j]) not in H.edges():
-							Te.append((common_neighborhood[i], common_neighborhood[j]))
-				T[e] = set(Te)
-			
-			for j in range(repetitions):
-				F_prime = minimizer.minimize_triangulation(G, algo.get_triangulation_edges(), True, T)
-				H_prime = G.copy()
-				H_prime.add_edges_from(F_prime)
-				
-				all_sizes.append(len(F_prime))
-				if H_opt == None or len(F_prime) < size_opt:
-					H_opt = H_prime
-					size_opt = len(F_prime)
-		return {
-			"H" : H_opt,
-			"size" : size_opt,
-			"mean" : np.mean(all_sizes),
-			"variance" : np.var(all_sizes),
-			"repetitions" : repetitions
-			}
+		(F_opt, alpha_opt, all_sizes) = algo.run_repetitions(repetitions)
+		return ta.TriangulationResult(G, F_opt, np.mean(all_sizes), np.var(all_sizes), len(all_sizes), profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.fill_lower_bound, seed=algo.seed_opt)
 	
 class Algorithm_EliminationGame(ta.TriangulationAlgorithm):
-	def __init__(self, G, reduce_graph=True, timeout=-1):
+	'''
+	Args (in addition to TriangulationAlgorithm):
+		ordering : the heuristic that computes the elimination ordering if no ordering is given to triangulate,
+			one of SUPPORTED_ORDERINGS. By default, the nodes are eliminated in the order of the graph (or in random order if randomized).
+	'''
+	SUPPORTED_ORDERINGS = ["min_degree", "min_fill", "amd", "nested_dissection"]
+	# parts of the nested dissection with at most this many nodes are ordered by minimum degree:
+	NESTED_DISSECTION_LEAF_SIZE = 16
+	
+	def __init__(self, G, reduce_graph=True, timeout=-1, ordering=None, **kwargs):
 		logging.info("=== EG.Algorithm_EliminationGame.init ===")
-		super().__init__(G, reduce_graph, timeout)
+		if not ordering == None and ordering not in self.SUPPORTED_ORDERINGS:
+			logging.warning("Ordering "+str(ordering)+" is not supported, using the order of the graph instead.")
+			ordering = None
+		self.ordering = ordering
+		super().__init__(G, reduce_graph, timeout, **kwargs)
 	
-	def triangulate(self, G, randomized=False, alpha=None):
+	def triangulate(self, C, randomized=False, alpha=None):
 		'''
-		The elimination game algorithm for computing a triangulation algorithm
+		The elimination game algorithm for computing a triangulation algorithm.
+		Instead of eliminating the nodes from a copy of the graph, the fill edges of the ordering are computed
+		with the fill-in algorithm based on the follower function by Tarjan and Yannakakis, running time in O(n+m+|F|):
+			Tarjan, Yannakakis: Simple linear-time algorithms to test chordality of graphs, test acyclicity of hypergraphs, and selectively reduce acyclic hypergraphs
+			https://epubs.siam.org/doi/10.1137/0213035
+		The nodes are processed in elimination order. For each node w, the walks from its earlier eliminated neighbors
+		along the followers visit exactly the earlier eliminated neighbors of w in C + F,
+		where the follower of a node is its first eliminated later neighbor in C + F.
 		
 		Args:
-			G : the input graph in networkx format
+			C : the input graph in CompactGraph format
 			alpha : an ordering of the nodes that defines the order in which the nodes are processed, as a dict {node: position}
-			randomized : if no ordering alpha is specified and randomized is set to True, the order of the nodes is shuffled
+			randomized : if no ordering alpha is specified and randomized is set to True, the order of the nodes is shuffled,
+				or the ties of the ordering heuristic are broken randomly
 	
 		Returns:
-			F : a set of edges such that G + F is a minimum triangulation of G
+			F : a set of edges such that C + F is a minimum triangulation of C.
+				The edges (u, v) with u < v are ordered by the position of their first eliminated node, then by the position of the other node.
+		
+		If the dense backend is used for C, the same fill edges are computed on an adjacency matrix, see DenseGraph.get_fill_edges.
 		'''
 		logging.info("=== elimination_game_triangulation ===")
-		logging.debug("Alpha: "+str(alpha))
+		tracer = Tracer.TRACER
+		if not tracer == None:
+			tracer.event("start", algorithm="EG", n=len(C), labels=C.labels, ordering=None if alpha == None else [C.labels[v] for v in sorted(alpha, key=lambda v: alpha[v])])
 		
+		if alpha == None and not self.ordering == None:
+			if self.ordering == "min_degree":
+				alpha = self.get_min_degree_ordering(C, randomized)
+			elif self.ordering == "min_fill":
+				alpha = self.get_min_fill_ordering(C, randomized)
+			elif self.ordering == "amd":
+				alpha = self.get_amd_ordering(C, randomized)
+			else:
+				alpha = self.get_nested_dissection_ordering(C, randomized)
 		if alpha == None:
-			all_nodes = [n for n in G]
+			all_nodes = [n for n in C]
 			if randomized:
 				random.shuffle(all_nodes)
-			self.alpha = {}
+			self.component_alpha = {}
 			i = 0
 			for n in all_nodes:
-				self.alpha[n] = i
+				self.component_alpha[n] = i
 				i += 1
 		else:
 			all_nodes = sorted([n for n in alpha.keys()], key=lambda x: alpha[x])
-			self.alpha = alpha
-		G_temp = G.copy()
+			self.component_alpha = alpha
+		if DenseGraph.use_dense_backend(C, self.dense_backend):
+			F = DenseGraph.DenseGraph(C).get_fill_edges(all_nodes)
+			if not tracer == None:
+				# the same events as on the sparse backend, each fill edge before the elimination of its later node:
+				position = {all_nodes[i] : i for i in range(len(all_nodes))}
+				fill_edges = {w : [] for w in all_nodes}
+				for (u, v) in F:
+					if position[u] < position[v]:
+						fill_edges[v].append(u)
+					else:
+						fill_edges[u].append(v)
+				for w in all_nodes:
+					for x in fill_edges[w]:
+						tracer.event("fill", edge=(C.labels[x], C.labels[w]))
+					tracer.event("eliminate", node=C.labels[w])
+			return F
+		n = len(all_nodes)
+		position = [0 for v in C]
+		for i in range(n):
+			position[all_nodes[i]] = i
+		follower = [v for v in C]
+		# index[x] is the position of the last node whose walk visited x:
+		index = [-1 for v in C]
+		# the fill edges, grouped by their first eliminated node:
+		fill_edges = [[] for v in C]
+		for i in range(n):
+			# check timeout:
+			if self.timeout > 0 and time.time() > self.timeout:
+				raise ta.TimeLimitExceededException("Time Limit Exceeded!")
+
+			w = all_nodes[i]
+			index[w] = i
+			w_bits = C.bits[w]
+			for v in C.adj[w]:
+				if position[v] < i:
+					x = v
+					while index[x] < i:
+						index[x] = i
+						if not (w_bits >> x) & 1:
+							if x < w:
+								fill_edges[x].append((x, w))
+							else:
+								fill_edges[x].append((w, x))
+							if not tracer == None:
+								tracer.event("fill", edge=(C.labels[x], C.labels[w]))
+						x = follower[x]
+					if follower[x] == x:
+						follower[x] = w
+			if not tracer == None:
+				tracer.event("eliminate", node=C.labels[w])
+		
 		F = []
-		for node in all_nodes:
+		for x in all_nodes:
+			F += fill_edges[x]
+		return F
+
+	def get_min_degree_ordering(self, C, randomized=False):
+		'''
+		Computes an elimination ordering by repeatedly eliminating a node of minimum degree in the elimination graph.
+		The elimination graph is stored as bitsets, the nodes are kept in a heap with lazy deletion of outdated entries.
+		
+		Args:
+			C : the input graph in CompactGraph format
+			randomized : if set to True, ties between nodes of equal degree are broken randomly, otherwise by the smaller index
+		
+		Returns:
+			alpha : the ordering as a dict {node: position}
+		'''
+		bits = list(C.bits)
+		degree = [CompactGraph.count_bits(b) for b in bits]
+		heap = [(degree[v], random.random() if randomized else v, v) for v in C]
+		heapq.heapify(heap)
+		eliminated = [False for v in C]
+		alpha = {}
+		while len(heap) > 0:
+			(d, tiebreak, v) = heapq.heappop(heap)
+			if eliminated[v] or not d == degree[v]:
+				continue
+			# check timeout:
+			if self.timeout > 0 and time.time() > self.timeout:
+				raise ta.TimeLimitExceededException("Time Limit Exceeded!")
+			alpha[v] = len(alpha)
+			eliminated[v] = True
+			# make the neighborhood of v a clique and remove v:
+			neighbors = bits[v]
+			for u in CompactGraph.iterate_bits(neighbors):
+				bits[u] = (bits[u] | neighbors) & ~((1 << u) | (1 << v))
+				degree[u] = CompactGraph.count_bits(bits[u])
+				heapq.heappush(heap, (degree[u], random.random() if randomized else u, u))
+		return alpha
+	
+	def get_min_fill_ordering(self, C, randomized=False):
+		'''
+		Computes an elimination ordering by repeatedly eliminating a node whose elimination adds the fewest fill edges.
+		The fill values are only computed once for all nodes and are then updated incrementally after each elimination:
+		the neighbors of the eliminated node change their neighborhood, all other nodes only lose the pairs of neighbors that become adjacent.
+		
+		Args:
+			C : the input graph in CompactGraph format
+			randomized : if set to True, ties between nodes of equal fill are broken randomly, otherwise by the smaller index
+		
+		Returns:
+			alpha : the ordering as a dict {node: position}
+		'''
+		bits = list(C.bits)
+		def get_fill(u):
+			# each non-adjacent pair of neighbors of u is counted twice:
+			missing = 0
+			for w in CompactGraph.iterate_bits(bits[u]):
+				missing += CompactGraph.count_bits(bits[u] & ~bits[w]) - 1
+			return missing // 2
+		fill = [get_fill(v) for v in C]
+		heap = [(fill[v], random.random() if randomized else v, v) for v in C]
+		heapq.heapify(heap)
+		eliminated = [False for v in C]
+		alpha = {}
+		while len(heap) > 0:
+			(f, tiebreak, v) = heapq.heappop(heap)
+			if eliminated[v] or not f == fill[v]:
+				continue
 			# check timeout:
 			if self.timeout > 0 and time.time() > self.timeout:
 				raise ta.TimeLimitExceededException("Time Limit Exceeded!")
+			alpha[v] = len(alpha)
+			eliminated[v] = True
+			neighbors = bits[v]
+			# the new neighbors of each neighbor of v:
+			new_neighbors = {}
+			for u in CompactGraph.iterate_bits(neighbors):
+				new_neighbors[u] = neighbors & ~bits[u] & ~(1 << u)
+			# update the fill values of the neighbors of v:
+			for u in CompactGraph.iterate_bits(neighbors):
+				old_neighbors = bits[u]
+				# the neighbors of u that are not adjacent to v lose their missing edge to v:
+				others = old_neighbors & ~neighbors & ~(1 << v)
+				fill[u] -= CompactGraph.count_bits(others)
+				# the pairs of old neighbors of u that become adjacent:
+				filled = 0
+				for w in CompactGraph.iterate_bits(old_neighbors & neighbors):
+					filled += CompactGraph.count_bits(new_neighbors[w] & old_neighbors)
+				fill[u] -= filled // 2
+				# the pairs of a new neighbor and an old neighbor of u that is not adjacent to v:
+				for w in CompactGraph.iterate_bits(new_neighbors[u]):
+					fill[u] += CompactGraph.count_bits(others & ~bits[w])
+			# make the neighborhood of v a clique and remove v:
+			candidates = 0
+			for u in CompactGraph.iterate_bits(neighbors):
+				if new_neighbors[u]:
+					candidates |= bits[u]
+				bits[u] = (bits[u] | neighbors) & ~((1 << u) | (1 << v))
+				heapq.heappush(heap, (fill[u], random.random() if randomized else u, u))
+			# the other nodes lose the fill edges between their neighbors:
+			for x in CompactGraph.iterate_bits(candidates & ~neighbors & ~(1 << v)):
+				common = bits[x] & neighbors
+				if common & (common - 1):
+					filled = 0
+					for w in CompactGraph.iterate_bits(common):
+						filled += CompactGraph.count_bits(new_neighbors[w] & common)
+					if filled > 0:
+						fill[x] -= filled // 2
+						heapq.heappush(heap, (fill[x], random.random() if randomized else x, x))
+		return alpha
+	
+	def get_amd_ordering(self, C, randomized=False):
+		'''
+		Computes an approximate minimum degree ordering on the quotient graph, similar to
+			Amestoy, Davis, Duff: An approximate minimum degree ordering algorithm
+			https://epubs.siam.org/doi/10.1137/S0895479894278952
+		Instead of adding the fill edges, each eliminated node becomes an element that represents the clique of its remaining neighbors,
+		and elements that are adjacent to a newly eliminated node are absorbed by it.
+		The exact degree is replaced by the upper bound of Amestoy, Davis and Duff, which only needs the sizes of the elements.
+		Supervariable detection and aggressive absorption are not used.
+		
+		Args:
+			C : the input graph in CompactGraph format
+			randomized : if set to True, ties between nodes of equal approximate degree are broken randomly, otherwise by the smaller index
+		
+		Returns:
+			alpha : the ordering as a dict {node: position}
+		'''
+		# the neighbors of each variable that are variables and that are elements:
+		variable_neighbors = [set(C.adj[v]) for v in C]
+		element_neighbors = [set() for v in C]
+		# the variables of each element that is not absorbed:
+		element_variables = {}
+		degree = [len(C.adj[v]) for v in C]
+		heap = [(degree[v], random.random() if randomized else v, v) for v in C]
+		heapq.heapify(heap)
+		eliminated = [False for v in C]
+		num_remaining = len(C)
+		alpha = {}
+		while len(heap) > 0:
+			(d, tiebreak, p) = heapq.heappop(heap)
+			if eliminated[p] or not d == degree[p]:
+				continue
+			# check timeout:
+			if self.timeout > 0 and time.time() > self.timeout:
+				raise ta.TimeLimitExceededException("Time Limit Exceeded!")
+			alpha[p] = len(alpha)
+			eliminated[p] = True
+			num_remaining -= 1
+			# p becomes an element that absorbs all its adjacent elements:
+			absorbed = element_neighbors[p]
+			Lp = set(variable_neighbors[p])
+			for e in absorbed:
+				Lp |= element_variables.pop(e)
+			Lp.discard(p)
+			element_variables[p] = Lp
+			# the number of variables of each other element that are not in Lp:
+			external = {}
+			for i in Lp:
+				for e in element_neighbors[i]:
+					if e in element_variables and not e == p:
+						if not e in external:
+							external[e] = len(element_variables[e])
+						external[e] -= 1
+			for i in Lp:
+				element_neighbors[i] -= absorbed
+				element_neighbors[i].add(p)
+				# the edges inside of Lp are represented by the element p:
+				variable_neighbors[i] -= Lp
+				variable_neighbors[i].discard(p)
+				bound = len(variable_neighbors[i]) + len(Lp) - 1
+				for e in element_neighbors[i]:
+					if not e == p:
+						bound += external[e]
+				degree[i] = min(num_remaining - 1, degree[i] + len(Lp) - 1, bound)
+				heapq.heappush(heap, (degree[i], random.random() if randomized else i, i))
+		return alpha
+	
+	def get_nested_dissection_ordering(self, C, randomized=False):
+		'''
+		Computes a nested dissection ordering, similar to
+			George: Nested dissection of a regular finite element mesh
+			https://epubs.siam.org/doi/10.1137/0710032
+		The graph is split recursively by separators from BFS level structures (see get_level_separator),
+		the nodes of each separator are ordered after the nodes of the parts it separates.
+		Parts with at most NESTED_DISSECTION_LEAF_SIZE nodes, or without a separator, are ordered by minimum degree.
+		If num_workers > 1 and the graph consists of a single component, the top levels of the dissection are computed first
+		and the remaining parts are ordered concurrently in a pool of worker processes.
+		If randomized, each part seeds the random generator from one seed of this call and its position in the dissection tree,
+		such that the ordering does not depend on the number of workers.
+		
+		Args:
+			C : the input graph in CompactGraph format
+			randomized : if set to True, the start nodes of the level structures and the ties of the minimum degree orderings are chosen randomly
+		
+		Returns:
+			alpha : the ordering as a dict {node: position}
+		'''
+		seed = None
+		if randomized:
+			seed = random.getrandbits(64)
+			state = random.getstate()
+		if self.num_workers <= 1 or not len(self.component_subgraphs) == 1:
+			ordering = self.get_dissection_order(C, randomized, seed)
+		else:
+			# split the largest parts until there is a part for each worker, the separators stay at their place in the ordering:
+			items = [(True, [v for v in C], "")]
+			while sum([1 for (is_part, nodes, path) in items if is_part]) < self.num_workers:
+				parts = [i for i in range(len(items)) if items[i][0] and len(items[i][1]) > self.NESTED_DISSECTION_LEAF_SIZE]
+				if len(parts) == 0:
+					break
+				i = max(parts, key=lambda j: len(items[j][1]))
+				(is_part, nodes, path) = items[i]
+				S = C.subgraph(nodes)
+				if not seed == None:
+					random.seed(str(seed)+path)
+				dissection = self.get_level_separator(S, randomized)
+				if dissection == None:
+					items[i] = (False, [nodes[v] for v in self.get_dissection_order(S, randomized, seed, path)], path)
+					continue
+				(subparts, separator) = dissection
+				items[i:i+1] = [(True, [nodes[v] for v in subparts[j]], path+"."+str(j)) for j in range(len(subparts))] + [(False, [nodes[v] for v in separator], path)]
+			logging.info("EG.get_nested_dissection_ordering: "+str(len(items))+" parts with "+str(self.num_workers)+" workers")
+			worker_algorithm = self.get_worker_copy()
+			with concurrent.futures.ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+				futures = {}
+				for i in range(len(items)):
+					(is_part, nodes, path) = items[i]
+					if is_part:
+						futures[i] = executor.submit(get_dissection_order_of_part, worker_algorithm, C.subgraph(nodes), randomized, seed, path)
+				try:
+					ordering = []
+					for i in range(len(items)):
+						(is_part, nodes, path) = items[i]
+						if is_part:
+							ordering += [nodes[v] for v in futures[i].result()]
+						else:
+							ordering += nodes
+				except Exception:
+					for future in futures.values():
+						future.cancel()
+					raise
+		if randomized:
+			# continue with the state after the seed of this call was drawn:
+			random.setstate(state)
+		return {ordering[i] : i for i in range(len(ordering))}
+	
+	def get_dissection_order(self, C, randomized=False, seed=None, path=""):
+		'''
+		Computes the nested dissection ordering of a graph.
+		Each part is dissected as a new induced subgraph, such that the bitsets only contain the nodes of the part.
 
-			all_neighbors = [n for n in G_temp.neighbors(node)]
-			for i in range(0, len(all_neighbors)):
-				for j in range(i+1, len(all_neighbors)):
-					edge_between_neighbors = (all_neighbors[i], all_neighbors[j])
-					if edge_between_neighbors not in G_temp.edges():
-						G_temp.add_edges_from([edge_between_neighbors])
-						F.append(edge_between_neighbors)
-						logging.debug("Added edge: "+str(edge_between_neighbors))
-			G_temp.remove_node(node)
-			logging.debug("removed node: "+str(node))
-			
-		return F
\ No newline at end of file
+		Args:
+			C : the input graph in CompactGraph format
+			randomized : if set to True, the ordering is randomized
+			seed : if set, the random generator is seeded with this value and the path before the graph is dissected
+			path : the position of C in the dissection tree, the i-th part of a graph extends its path by "."+str(i)
+
+		Returns:
+			ordering : the nodes in elimination order
+		'''
+		# check timeout:
+		if self.timeout > 0 and time.time() > self.timeout:
+			raise ta.TimeLimitExceededException("Time Limit Exceeded!")
+		if not seed == None:
+			random.seed(str(seed)+path)
+		dissection = None
+		if len(C) > self.NESTED_DISSECTION_LEAF_SIZE:
+			dissection = self.get_level_separator(C, randomized)
+		if dissection == None:
+			alpha = self.get_min_degree_ordering(C, randomized)
+			return sorted(alpha, key=lambda v: alpha[v])
+		(parts, separator) = dissection
+		ordering = []
+		for i in range(len(parts)):
+			ordering += [parts[i][v] for v in self.get_dissection_order(C.subgraph(parts[i]), randomized, seed, path+"."+str(i))]
+		return ordering + separator
+	
+	def get_level_separator(self, C, randomized=False):
+		'''
+		Splits a graph by a separator.
+		If the graph is disconnected, its components are returned with an empty separator.
+		Otherwise, a level structure is built by breadth-first search from a pseudo-peripheral node, as proposed by
+			Gibbs, Poole, Stockmeyer: An algorithm for reducing the bandwidth and profile of a sparse matrix
+			https://epubs.siam.org/doi/10.1137/0713023
+		and the smallest inner level that leaves at most two thirds of the nodes on each side is chosen as separator (or the middle level).
+		Afterwards, separator nodes without neighbors on one side are moved to the other side.
+
+		Args:
+			C : the input graph in CompactGraph format
+			randomized : if set to True, the breadth-first search starts at a random node
+
+		Returns:
+			(parts, separator) : a list of parts, each given as a list of nodes, and the separator as a list of nodes,
+				or None if the graph has no level structure with an inner level
+		'''
+		nodes = [v for v in C]
+		mask = (1 << len(nodes)) - 1
+		def get_levels(start):
+			levels = [[start]]
+			reached = 1 << start
+			frontier = reached
+			while True:
+				new = 0
+				for v in CompactGraph.iterate_bits(frontier):
+					new |= C.bits[v]
+				new &= mask & ~reached
+				if new == 0:
+					return (levels, reached)
+				levels.append(list(CompactGraph.iterate_bits(new)))
+				reached |= new
+				frontier = new
+		start = random.choice(nodes) if randomized else nodes[0]
+		(levels, reached) = get_levels(start)
+		if not reached == mask:
+			# split into the connected components:
+			parts = []
+			remaining = mask
+			while remaining:
+				(component_levels, component) = get_levels((remaining & -remaining).bit_length() - 1)
+				parts.append(list(CompactGraph.iterate_bits(component)))
+				remaining &= ~component
+			return (parts, [])
+		# search a pseudo-peripheral node by restarting from a node of minimum degree in the last level, as long as the depth grows:
+		while True:
+			start = min(levels[-1], key=lambda v: CompactGraph.count_bits(C.bits[v] & mask))
+			(new_levels, reached) = get_levels(start)
+			if len(new_levels) <= len(levels):
+				break
+			levels = new_levels
+		if len(levels) < 3:
+			return None
+		n = len(nodes)
+		best = None
+		before = len(levels[0])
+		for i in range(1, len(levels)-1):
+			after = n - before - len(levels[i])
+			if 3*max(before, after) <= 2*n and (best == None or len(levels[i]) < len(levels[best])):
+				best = i
+			before += len(levels[i])
+		if best == None:
+			before = 0
+			best = 1
+			while best < len(levels) - 2 and 2*(before + len(levels[best-1])) < n:
+				before += len(levels[best-1])
+				best += 1
+		first_mask = 0
+		for level in levels[:best]:
+			for v in level:
+				first_mask |= 1 << v
+		second_mask = mask & ~first_mask
+		for v in levels[best]:
+			second_mask &= ~(1 << v)
+		# a separator node that has no neighbor on one side can be moved to the other side:
+		separator = []
+		for v in levels[best]:
+			if not C.bits[v] & second_mask:
+				first_mask |= 1 << v
+			elif not C.bits[v] & first_mask:
+				second_mask |= 1 << v
+			else:
+				separator.append(v)
+		tracer = Tracer.TRACER
+		if not tracer == None:
+			tracer.event("separator", n=n, separator=[C.labels[v] for v in separator])
+		parts = [list(CompactGraph.iterate_bits(first_mask)), list(CompactGraph.iterate_bits(second_mask))]
+		return ([part for part in parts if len(part) > 0], separator)
+
+class Algorithm_EliminationGamePlus(Algorithm_EliminationGame):
+	'''
+	Elimination Game, followed by the minimization of the triangulation with CMT.
+	Each run computes the triangulation of Elimination Game and minimizes it, such that the randomized runs
+	can be repeated, seeded and replayed by run_repetitions like the runs of the other algorithms.
+	
+	Args (in addition to Algorithm_EliminationGame):
+		minimizations : the number of randomized minimizations of the triangulation of each randomized run, the smallest one is kept
+	'''
+	
+	def __init__(self, G, reduce_graph=True, timeout=-1, minimizations=1, **kwargs):
+		logging.info("=== EG.Algorithm_EliminationGamePlus.init ===")
+		self.minimizations = minimizations
+		super().__init__(G, reduce_graph, timeout, **kwargs)
+		self.minimizer = CMT.Algorithm_CMT(G, False, timeout)
+	
+	def run(self, randomized=False):
+		wall_start = time.perf_counter()
+		super().run(randomized)
+		# the operations of the minimization are counted together with the operations of the elimination game:
+		self.minimizer.operation_counts = self.operation_counts
+		F = self.CG.get_indexed_edges(self.get_triangulation_edges())
+		
+		# initialize database of removable edges once for all minimizations of this triangulation:
+		with ta.measure_phase(self.phase_times, "removeable_edge_database"):
+			T = self.minimizer.get_removeable_edge_database(self.CG, F)
+		
+		F_opt = None
+		for i in range(self.minimizations if randomized else 1):
+			with ta.measure_phase(self.phase_times, "minimize"):
+				F_prime = self.minimizer.minimize_triangulation(self.CG, F, randomized, {e : set(T[e]) for e in T} if randomized else T)
+			self.verify_component(self.CG, F_prime)
+			if F_opt == None or len(F_prime) < len(F_opt):
+				F_opt = F_prime
+		
+		self.H = None
+		self.edges_of_triangulation = self.CG.get_labeled_edges(F_opt)
+		# the elimination ordering is no perfect elimination ordering of the minimized triangulation:
+		self.alpha = {}
+		self.time_to_best = time.perf_counter() - wall_start
+	
+	def get_worker_copy(self):
+		worker_algorithm = super().get_worker_copy()
+		# the workers only triangulate components, the minimization runs in this process:
+		worker_algorithm.minimizer = None
+		return worker_algorithm
+	
+def get_dissection_order_of_part(algorithm, S, randomized=False, seed=None, path=""):
+	'''
+	Computes the nested dissection ordering of a part of the graph in a worker process,
+	used by Algorithm_EliminationGame.get_nested_dissection_ordering
+
+	Args:
+		algorithm : an instance of Algorithm_EliminationGame
+		S : the induced subgraph of the part in CompactGraph format
+		randomized : if set to True, the ordering is randomized
+		seed : the seed of the dissection, see Algorithm_EliminationGame.get_dissection_order
+		path : the position of S in the dissection tree
+
+	Returns:
+		ordering : the nodes of S in elimination order
+	'''
+	return algorithm.get_dissection_order(S, randomized, seed, path)
@@ -4,45 +4,26 @@
 import logging
 
 import networkx as nx
-import random
 import numpy as np
 import time
 
 from TriangulationAlgorithms import TriangulationAlgorithm as ta
+from TriangulationAlgorithms import Tracer
+from TriangulationAlgorithms import DenseGraph
+from TriangulationAlgorithms import graph_meta
 
-def triangulate_LexM(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1):
-	algo = Algorithm_LexM(G, reduce_graph, timeout)
+def triangulate_LexM(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, clique_tree=False, **kwargs):
+	algo = Algorithm_LexM(G, reduce_graph, timeout, **kwargs)
 	if not randomized:
 		algo.run()
-			
-		return {
-			"H" : algo.get_triangulated(),
-			"size" : len(algo.get_triangulation_edges()),
-			"alpha" : algo.get_alpha(), 
-			"mean" : len(algo.get_triangulation_edges()),
-			"variance" : 0,
-			"repetitions" : 1
-			}
+		result = ta.TriangulationResult(G, algo.get_triangulation_edges(), alpha=algo.get_alpha(), profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.fill_lower_bound)
 	else:
-		H_opt = None
-		alpha_opt = None
-		size_opt = None
-		all_sizes = []
-		for i in range(repetitions):
-			algo.run_randomized()
-			all_sizes.append(len(algo.get_triangulation_edges()))
-			if H_opt == None or len(algo.get_triangulation_edges()) < size_opt:
-				H_opt = algo.get_triangulated()
-				alpha_opt = algo.get_alpha()
-				size_opt = len(algo.get_triangulation_edges())
-		return {
-			"H" : H_opt,
-			"size" : size_opt,
-			"alpha" : alpha_opt, 
-			"mean" : np.mean(all_sizes),
-			"variance" : np.var(all_sizes),
-			"repetitions" : repetitions
-			}
+		(F_opt, alpha_opt, all_sizes) = algo.run_repetitions(repetitions)
+		result = ta.TriangulationResult(G, F_opt, np.mean(all_sizes), np.var(all_sizes), len(all_sizes), alpha_opt, profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.fill_lower_bound, seed=algo.seed_opt)
+	if clique_tree:
+		(result.cliques, result.clique_parent, result.separators) = algo.get_clique_tree()
+		result.profile = algo.get_profile()
+	return result
 
 class Algorithm_LexM(ta.TriangulationAlgorithm):
 	'''
@@ -55,9 +36,9 @@ class Algorithm_LexM(ta.TriangulationAlgorithm):
 		alpha : the corresponding minimal elimination ordering of G 
 	'''
 	
-	def __init__(self, G, reduce_graph=True, timeout=-1):
+	def __init__(self, G, reduce_graph=True, timeout=-1, **kwargs):
 		logging.info("=== LexM.Algorithm_LexM.init ===")
-		super().__init__(G, reduce_graph, timeout)
+		super().__init__(G, reduce_graph, timeout, **kwargs)
 		self.alpha = {}
 
 	def get_alpha(self):
@@ -72,99 +53,103 @@ class Algorithm_LexM(ta.TriangulationAlgorithm):
 		and the corresponding minimal triangulation H(G, alpha)
 		
 		Args:
-			C : a graph in networkx format
-			randomized : if true, the algorithm get_maxlex_node is randomized.
+			C : a graph in CompactGraph format
+			randomized : if true, the node with maximum label is chosen at random among all nodes with this label
 		
 		Returns:
 			F : a set of edges s.t. C + F is a minimal triangulation C.
+		
+		The lexicographic labels are kept as classes of a partition refinement, see graph_meta.LabelPartition,
+		such that a node with the maximum label is found in O(1). In each step, the nodes that get a new label are computed
+		by a single search from the numbered node that processes the reached nodes by increasing label class,
+		see get_reachable_nodes, so the running time is in O(nm).
+		If the dense backend is used for C, this search is a reachability sweep over the label classes, see DenseGraph.get_reachable_nodes.
 		'''
 		logging.info("=== triangulate_LEX_M ===")
 		
 		F = []
 		n = len(C)
-		nodelabels = {node : [] for node in C}
+		labels = graph_meta.LabelPartition(n)
+		numbered = [False]*n
+		counting = not self.operation_counts == None
+		tracer = Tracer.TRACER
+		if not tracer == None:
+			tracer.event("start", algorithm="LEX_M", n=n, labels=C.labels)
 		
-		all_unnumbered_vertices = [n for n in C if n not in self.alpha]
-		if randomized:
-			random.shuffle(all_unnumbered_vertices)
+		dense = DenseGraph.use_dense_backend(C, self.dense_backend)
+		if dense:
+			D = DenseGraph.DenseGraph(C)
+			unnumbered = np.ones(len(C), dtype=bool)
 		
 		for i in range(n,0, -1):
 			# check timeout:
 			if self.timeout > 0 and time.time() > self.timeout:
 				raise ta.TimeLimitExceededException("Time Limit Exceeded!")
 
-			logging.debug("Iteration: "+str(i))
-			node_v = self.get_maxlex_node(C, nodelabels, randomized)
-			logging.debug("max lex node: "+str(node_v))
-			self.alpha[node_v] = i
-			all_unnumbered_vertices.remove(node_v)
-			S = []
-			logging.debug("all unnumbered nodes:")
-			logging.debug([str(n)+": "+str(nodelabels[n]) for n in all_unnumbered_vertices])
-			for node_u in all_unnumbered_vertices:
-				smallerlex_nodes = [n for n in all_unnumbered_vertices if list_lexicographic_is_less_than(nodelabels[n], nodelabels[node_u])]+[node_v, node_u]
-				logging.debug("start Node "+str(node_v)+" label: "+str(nodelabels[node_v]))
-				logging.debug("target Node "+str(node_u)+" label: "+str(nodelabels[node_u]))
-				if nx.has_path(C.subgraph(smallerlex_nodes),node_v, node_u):
-					logging.debug("Add target node "+str(node_u)+" to set S")
-					S.append(node_u)
+			node_v = labels.get_max_node(randomized)
+			(ranks, num_labels) = labels.get_ranks()
+			if not tracer == None:
+				tracer.event("number", iteration=i, node=C.labels[node_v], label=ranks[labels.nodeclass[node_v]])
+			self.component_alpha[node_v] = i
+			numbered[node_v] = True
+			labels.remove(node_v)
+			if counting:
+				self.count_operation("reachability_sweep")
+			if dense:
+				unnumbered[node_v] = False
+				reached = D.get_reachable_nodes(node_v, np.array(ranks)[labels.nodeclass], unnumbered)
+				S = np.flatnonzero(reached).tolist()
+			else:
+				S = self.get_reachable_nodes(C, node_v, labels.nodeclass, ranks, num_labels, numbered)
+			labels.refine(S)
 			for node_u in S:
-				nodelabels[node_u].append(i)
-				if (node_v, node_u) not in C.edges():
+				if not C.has_edge(node_v, node_u):
 					F.append((node_v, node_u))
-					logging.debug("added edge: "+str((node_v, node_u)))
-			logging.debug("End of iteration. all node labels:")
-			logging.debug([str(n)+": "+str(nodelabels[n]) for n in C])		
+					if not tracer == None:
+						tracer.event("fill", edge=(C.labels[node_v], C.labels[node_u]))
 		
 		return F
-		
-	def get_maxlex_node(self, G, nodelabels, randomized=False):
+
+	def get_reachable_nodes(self, C, node_v, nodeclass, ranks, num_labels, numbered):
 		'''
-		Get an unnumbered vertex v of lexicograpohically maximum label from G
-	
+		Computes all unnumbered nodes u that are reachable from node_v by a path whose inner nodes are unnumbered
+		and have a smaller label than u.
+		The search processes the reached nodes by increasing label class: a node that is reached from a node of class j
+		gets processed in class j if its own label is not larger, otherwise it is one of the nodes u and gets processed in its own class.
+		Since the classes are processed in increasing order, each node is reached first by a path with the smallest possible
+		maximum label of its inner nodes, so each node and each edge is processed at most once, in O(n+m).
+
 		Args:
-			G : a graph in networkx format
-			randomized : if set to True and if there are multiple nodes with the max lex. label, one of these is returned at random
-	
+			C : a graph in CompactGraph format
+			node_v : the node that is numbered in the current step
+			nodeclass : a list with the label class of each node
+			ranks : a list with the rank of each label class, see graph_meta.LabelPartition.get_ranks
+			num_labels : the number of label classes
+			numbered : a list that marks the numbered nodes, including node_v
+
 		Returns:
-			v : an unnumbered vertex v of lexicograpohically maximum label from G
+			S : a sorted list of the reachable nodes u
 		'''
-		logging.info("=== get_maxlex_node ===")
-			
-		current_max_label = ''
-		current_best_node = None
-		nodes = [n for n in G]
-		if randomized:
-			random.shuffle(nodes)
-		for node in G: 
-			if (node not in self.alpha) and ((current_best_node == None) or (list_lexicographic_is_less_than(current_max_label, nodelabels[node]))):
-				current_best_node = node
-				current_max_label = nodelabels[node]
-		return current_best_node
-	
-def list_lexicographic_is_less_than(list_1, list_2):
-	'''
-	computes a lexicographic ordering relation of two lists
-	if list_1 < list_2 returns True
-	otherwise false
-		
-	Args:
-		list_1 : a list of integers
-		list_2 : a list of integers
-
-	Return:
-		True, if list_1 < list_2 as defined above, otherwise False
-	'''
-	#logging.info("=== list_lexicographic_is_less_than ===")
-		
-	n = min(len(list_1), len(list_2))
-	for i in range(n):
-		if list_1[i] < list_2[i]:
-			return True
-		elif list_1[i] > list_2[i]:
-			return False
-	if len(list_1) < len(list_2):
-		return True
-	elif len(list_1) > len(list_2):
-		return False
-	return False
+		S = []
+		reached = list(numbered)
+		# the reached nodes that are not processed yet, for each label class:
+		reach = [[] for j in range(num_labels)]
+		for node_u in C.adj[node_v]:
+			if not reached[node_u]:
+				reached[node_u] = True
+				S.append(node_u)
+				reach[ranks[nodeclass[node_u]]].append(node_u)
+		for j in range(num_labels):
+			while len(reach[j]) > 0:
+				node_w = reach[j].pop()
+				for node_z in C.adj[node_w]:
+					if not reached[node_z]:
+						reached[node_z] = True
+						rank = ranks[nodeclass[node_z]]
+						if rank > j:
+							S.append(node_z)
+							reach[rank].append(node_z)
+						else:
+							reach[j].append(node_z)
+		S.sort()
+		return S
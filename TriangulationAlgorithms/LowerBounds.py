@@ -0,0 +1,163 @@
+#!usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''
+Lower bounds for the minimum fill-in, i.e. the number of edges of a minimum triangulation.
+
+All bounds are computed for a single component in CompactGraph format.
+The fill edges of a triangulation of a graph that lie in an induced subgraph triangulate this subgraph,
+so the bounds of the components of a TriangulationAlgorithm (blocks, atoms and reduced graphs)
+add up to a lower bound for the whole graph, since two components never share a pair of non-adjacent nodes.
+'''
+
+import logging
+
+import networkx as nx
+
+from TriangulationAlgorithms import CompactGraph
+from TriangulationAlgorithms import graph_meta
+
+# components whose cycle basis has at most this size get the cycle packing bound from all of their chordless cycles:
+MAX_CYCLE_BASIS_SIZE = 8
+# larger components get the cycle packing bound from chordless cycles that are searched one after another,
+# if they have at most this number of nodes:
+MAX_CYCLE_SEARCH_NODES = 1000
+
+def get_fill_lower_bound(C):
+	'''
+	Computes the best lower bound of this module for a component
+
+	Args:
+		C : a graph in CompactGraph format
+
+	Returns:
+		bound : a lower bound for the number of fill edges of each triangulation of C
+	'''
+	logging.info("=== LowerBounds.get_fill_lower_bound ===")
+	if C.is_chordal():
+		return 0
+	bound = max(1, get_neighborhood_bound(C), get_cycle_packing_bound(C))
+	logging.debug("Lower bound of the fill-in: "+str(bound))
+	return bound
+
+def get_neighborhood_bound(C):
+	'''
+	Lower bound from the neighborhoods of the nodes, which refines the minimum degree bound:
+	the first node of a perfect elimination ordering of a triangulation is simplicial, so all non-adjacent pairs
+	of its neighbors are fill edges. Hence the minimum number of non-adjacent pairs in the neighborhood of a node
+	is a lower bound, and it is at most d*(d-1)/2 for a node of minimum degree d.
+
+	Args:
+		C : a graph in CompactGraph format
+
+	Returns:
+		bound : the minimum number of non-adjacent pairs of neighbors of a node
+	'''
+	bound = None
+	for v in C:
+		neighbors = C.bits[v]
+		degree = len(C.adj[v])
+		# each edge between two neighbors is counted twice:
+		neighbor_edges = sum([CompactGraph.count_bits(C.bits[u] & neighbors) for u in C.adj[v]]) // 2
+		missing = degree*(degree-1)//2 - neighbor_edges
+		if bound == None or missing < bound:
+			bound = missing
+			if bound == 0:
+				break
+	if bound == None:
+		return 0
+	return bound
+
+def get_cycle_packing_bound(C):
+	'''
+	Lower bound from a packing of chordless cycles: a chordless cycle of length k needs at least k-3 fill edges,
+	and the fill edges of cycles that share at most one node are disjoint.
+	If the cycle basis of C is small, the packing is chosen greedily by decreasing length from all chordless cycles of C
+	(see graph_meta.Basic_Cycle_Constructor), otherwise it consists of node disjoint cycles found by get_disjoint_chordless_cycles.
+
+	Args:
+		C : a graph in CompactGraph format
+
+	Returns:
+		bound : the sum of k-3 over all cycles of the packing
+	'''
+	G = C.to_networkx()
+	if len(nx.cycle_basis(G)) <= MAX_CYCLE_BASIS_SIZE:
+		cycles = graph_meta.Basic_Cycle_Constructor(G).get_all_cycles_from_cyclebasis()
+		packing = []
+		for cycle in sorted(cycles, key=len, reverse=True):
+			if all([len(set(cycle) & set(other)) <= 1 for other in packing]):
+				packing.append(cycle)
+	elif len(C) <= MAX_CYCLE_SEARCH_NODES:
+		packing = get_disjoint_chordless_cycles(C)
+	else:
+		return 0
+	return sum([len(cycle)-3 for cycle in packing])
+
+def get_disjoint_chordless_cycles(C):
+	'''
+	Constructs a set of node disjoint chordless cycles: a chordless cycle is searched in the graph,
+	its nodes are removed, and this is repeated until the remaining graph is chordal.
+
+	Args:
+		C : a graph in CompactGraph format
+
+	Returns:
+		cycles : a list of chordless cycles, each as a list of nodes
+	'''
+	cycles = []
+	remaining = (1 << len(C)) - 1
+	while not C.subgraph([v for v in CompactGraph.iterate_bits(remaining)]).is_chordal():
+		cycle = find_chordless_cycle(C, remaining)
+		if cycle == None:
+			break
+		cycles.append(cycle)
+		for v in cycle:
+			remaining &= ~(1 << v)
+	return cycles
+
+def find_chordless_cycle(C, remaining):
+	'''
+	Searches a chordless cycle of length at least 4 in an induced subgraph.
+	Each chordless cycle contains a node v with two non-adjacent neighbors p and w on the cycle,
+	and the rest of the cycle is a path from p to w that avoids all other neighbors of v.
+	For each node v and neighbor p, a breadth-first search from p in the subgraph without the other neighbors of v
+	finds such a path to the first reachable neighbor w of v that is not adjacent to p.
+	Since the path is a shortest path and w is only adjacent to its last node, the cycle is chordless.
+
+	Args:
+		C : a graph in CompactGraph format
+		remaining : a bitset of the nodes of the induced subgraph
+
+	Returns:
+		cycle : a list of the nodes of a chordless cycle, or None if the subgraph is chordal
+	'''
+	for v in CompactGraph.iterate_bits(remaining):
+		neighbors = C.bits[v] & remaining
+		allowed = remaining & ~neighbors & ~(1 << v)
+		for p in CompactGraph.iterate_bits(neighbors):
+			# the neighbors of v that are not adjacent to p, each pair is only considered once:
+			targets = neighbors & ~C.bits[p] & ~((1 << (p+1)) - 1)
+			if targets == 0:
+				continue
+			predecessor = {p : None}
+			visited = 1 << p
+			frontier = [p]
+			while len(frontier) > 0:
+				next_frontier = []
+				for x in frontier:
+					reached = C.bits[x] & targets
+					if reached:
+						w = (reached & -reached).bit_length() - 1
+						path = [w]
+						while not x == None:
+							path.append(x)
+							x = predecessor[x]
+						return [v] + path
+					new_nodes = C.bits[x] & allowed & ~visited
+					visited |= new_nodes
+					for y in CompactGraph.iterate_bits(new_nodes):
+						predecessor[y] = x
+						next_frontier.append(y)
+				frontier = next_frontier
+	return None
@@ -9,39 +9,21 @@ import numpy as np
 import time
 
 from TriangulationAlgorithms import TriangulationAlgorithm as ta
+from TriangulationAlgorithms import Tracer
+from TriangulationAlgorithms import DenseGraph
 
-def triangulate_MCSM(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1):
-	algo = Algorithm_MCSM(G, reduce_graph, timeout)
+def triangulate_MCSM(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, clique_tree=False, **kwargs):
+	algo = Algorithm_MCSM(G, reduce_graph, timeout, **kwargs)
 	if not randomized:
 		algo.run()
-		return {
-			"H" : algo.get_triangulated(),
-			"size" : len(algo.get_triangulation_edges()),
-			"alpha" : algo.get_alpha(), 
-			"mean" : len(algo.get_triangulation_edges()),
-			"variance" : 0,
-			"repetitions" : 1
-			}
+		result = ta.TriangulationResult(G, algo.get_triangulation_edges(), alpha=algo.get_alpha(), profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.fill_lower_bound)
 	else:
-		H_opt = None
-		alpha_opt = None
-		size_opt = None
-		all_sizes = []
-		for i in range(repetitions):
-			algo.run_randomized()
-			all_sizes.append(len(algo.get_triangulation_edges()))
-			if H_opt == None or len(algo.get_triangulation_edges()) < size_opt:
-				H_opt = algo.get_triangulated()
-				alpha_opt = algo.get_alpha()
-				size_opt = len(algo.get_triangulation_edges())
-		return {
-			"H" : H_opt,
-			"size" : size_opt,
-			"alpha" : alpha_opt, 
-			"mean" : np.mean(all_sizes),
-			"variance" : np.var(all_sizes),
-			"repetitions" : repetitions
-			}
+		(F_opt, alpha_opt, all_sizes) = algo.run_repetitions(repetitions)
+		result = ta.TriangulationResult(G, F_opt, np.mean(all_sizes), np.var(all_sizes), len(all_sizes), alpha_opt, profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.fill_lower_bound, seed=algo.seed_opt)
+	if clique_tree:
+		(result.cliques, result.clique_parent, result.separators) = algo.get_clique_tree()
+		result.profile = algo.get_profile()
+	return result
 
 class Algorithm_MCSM(ta.TriangulationAlgorithm):
 	'''
@@ -54,9 +36,9 @@ class Algorithm_MCSM(ta.TriangulationAlgorithm):
 		alpha : the corresponding minimal elimination ordering of G 
 	'''
 	
-	def __init__(self, G, reduce_graph=True, timeout=-1):
+	def __init__(self, G, reduce_graph=True, timeout=-1, **kwargs):
 		logging.info("=== LexM.Algorithm_LexM.init ===")
-		super().__init__(G, reduce_graph, timeout)
+		super().__init__(G, reduce_graph, timeout, **kwargs)
 		self.alpha = {}
 
 	def get_alpha(self):
@@ -71,53 +53,136 @@ class Algorithm_MCSM(ta.TriangulationAlgorithm):
 		and the corresponding minimal triangulation H(G, alpha)
 		
 		Args:
-			C : a graph in networkx format
-			randomized : 
+			C : a graph in CompactGraph format
+			randomized : if true, the node with maximum weight is chosen at random among all nodes with this weight
 		
 		Returns:
 			F : a set of edges s.t. C + F is a minimal triangulation C.
+			
+		Additionally, all nodes whose weight is not larger than the weight of the previously numbered node are stored
+		in self.separator_generators. For each such node x, the set of its neighbors in C + F that are numbered before x
+		is a minimal separator of C + F (see Berry, Pogorelcnik, Simonet: An introduction to clique minimal separator decomposition).
+		
+		The unnumbered nodes are kept in buckets by weight, such that a node with maximum weight is found in O(1).
+		In each step, the nodes whose weight is increased are computed by a single search from the numbered node
+		that processes the reached nodes by increasing weight, see get_reachable_nodes, so the running time is in O(nm).
+		If the dense backend is used for C, this search is a reachability sweep over the weights, see DenseGraph.get_reachable_nodes.
 		'''
 		logging.info("=== triangulate_MCS_M ===")
 		
 		F = []
-		unnumbered_nodes = [n for n in C.nodes()]
-		if randomized:
-			random.shuffle(unnumbered_nodes)
-			
-		weight = {n : 0 for n in unnumbered_nodes}
+		self.separator_generators = []
+		previous_weight = -1
 		n = len(C)
+		weight = [0]*n
+		numbered = [False]*n
+		# the unnumbered nodes of each weight, and the position of each node in its bucket:
+		buckets = [[v for v in C]]
+		bucket_position = [v for v in C]
+		max_weight = 0
+		dense = DenseGraph.use_dense_backend(C, self.dense_backend)
+		if dense:
+			D = DenseGraph.DenseGraph(C)
+			unnumbered = np.ones(len(C), dtype=bool)
+			weights = np.zeros(len(C), dtype=int)
+		counting = not self.operation_counts == None
+		tracer = Tracer.TRACER
+		if not tracer == None:
+			tracer.event("start", algorithm="MCS_M", n=n, labels=C.labels)
 		for i in range(n,0, -1):
 			# check timeout:
 			if self.timeout > 0 and time.time() > self.timeout:
 				raise ta.TimeLimitExceededException("Time Limit Exceeded!")
 
-			logging.debug("Iteration: "+str(i))
-			logging.debug("all unnumbered nodes:")
-			logging.debug([str(n)+": "+str(weight[n]) for n in unnumbered_nodes])
-			
 			# get node with maximum weight:
-			node_v = unnumbered_nodes[0]
-			maxweight = weight[node_v]
-			for n in unnumbered_nodes:
-				if weight[n] > maxweight:
-					node_v = n
-					maxweight = weight[node_v]
-			self.alpha[node_v] = i
-			unnumbered_nodes.remove(node_v)
-			S = []
-			for node_u in unnumbered_nodes:
-				if not node_u == node_v:
-					unnumbered_lowerweight_nodes = [node_x for node_x in unnumbered_nodes if weight[node_x] < weight[node_u]]
-					if nx.has_path(C.subgraph(unnumbered_lowerweight_nodes+[node_v, node_u]),node_v, node_u):
-						logging.debug("Add target node "+str(node_u)+" to set S")
-						S.append(node_u)
+			while len(buckets[max_weight]) == 0:
+				max_weight -= 1
+			if randomized:
+				node_v = buckets[max_weight][random.randrange(len(buckets[max_weight]))]
+			else:
+				node_v = buckets[max_weight][-1]
+			self.remove_from_bucket(buckets, bucket_position, weight, node_v)
+			if max_weight <= previous_weight:
+				self.separator_generators.append(node_v)
+			previous_weight = max_weight
+			if not tracer == None:
+				tracer.event("number", iteration=i, node=C.labels[node_v], weight=max_weight)
+			self.component_alpha[node_v] = i
+			numbered[node_v] = True
+			if counting:
+				self.count_operation("reachability_sweep")
+			if dense:
+				unnumbered[node_v] = False
+				reached = D.get_reachable_nodes(node_v, weights, unnumbered)
+				S = np.flatnonzero(reached).tolist()
+			else:
+				S = self.get_reachable_nodes(C, node_v, weight, max_weight, numbered)
 			for node_u in S:
+				self.remove_from_bucket(buckets, bucket_position, weight, node_u)
 				weight[node_u] += 1
-				if not (node_v, node_u) in C.edges():
+				if weight[node_u] == len(buckets):
+					buckets.append([])
+				bucket_position[node_u] = len(buckets[weight[node_u]])
+				buckets[weight[node_u]].append(node_u)
+				if weight[node_u] > max_weight:
+					max_weight = weight[node_u]
+				if dense:
+					weights[node_u] += 1
+				if not C.has_edge(node_v, node_u):
 					F.append((node_v, node_u))
-					
-			logging.debug("End of iteration. all node labels:")
-			logging.debug([str(n)+": "+str(weight[n]) for n in C])		
+					if not tracer == None:
+						tracer.event("fill", edge=(C.labels[node_v], C.labels[node_u]))
 		
 		return F
-		
\ No newline at end of file
+
+	def remove_from_bucket(self, buckets, bucket_position, weight, node_u):
+		'''
+		Removes a node from the bucket of its weight in O(1), by moving the last node of the bucket to its position
+		'''
+		bucket = buckets[weight[node_u]]
+		node_w = bucket.pop()
+		if not node_w == node_u:
+			bucket[bucket_position[node_u]] = node_w
+			bucket_position[node_w] = bucket_position[node_u]
+
+	def get_reachable_nodes(self, C, node_v, weight, max_weight, numbered):
+		'''
+		Computes all unnumbered nodes u that are reachable from node_v by a path whose inner nodes are unnumbered
+		and have a smaller weight than u.
+		The search processes the reached nodes by increasing weight: a node that is reached from a node of weight j
+		gets processed with weight j if its own weight is not larger, otherwise it is one of the nodes u and gets processed with its own weight.
+		Since the weights are processed in increasing order, each node is reached first by a path with the smallest possible
+		maximum weight of its inner nodes, so each node and each edge is processed at most once, in O(n+m).
+
+		Args:
+			C : a graph in CompactGraph format
+			node_v : the node that is numbered in the current step
+			weight : a list with the weight of each node
+			max_weight : the maximum weight of an unnumbered node
+			numbered : a list that marks the numbered nodes, including node_v
+
+		Returns:
+			S : a sorted list of the reachable nodes u
+		'''
+		S = []
+		reached = list(numbered)
+		# the reached nodes that are not processed yet, for each weight:
+		reach = [[] for j in range(max_weight+1)]
+		for node_u in C.adj[node_v]:
+			if not reached[node_u]:
+				reached[node_u] = True
+				S.append(node_u)
+				reach[weight[node_u]].append(node_u)
+		for j in range(max_weight+1):
+			while len(reach[j]) > 0:
+				node_w = reach[j].pop()
+				for node_z in C.adj[node_w]:
+					if not reached[node_z]:
+						reached[node_z] = True
+						if weight[node_z] > j:
+							S.append(node_z)
+							reach[weight[node_z]].append(node_z)
+						else:
+							reach[j].append(node_z)
+		S.sort()
+		return S
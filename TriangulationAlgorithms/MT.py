@@ -10,75 +10,114 @@ import time
 from TriangulationAlgorithms import TriangulationAlgorithm as ta
 from TriangulationAlgorithms import LEX_M
 
-def triangulate_MT(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1):
-	algo = Algorithm_MinimumTriangulation(G, reduce_graph, timeout)
+def triangulate_MT(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, **kwargs):
+	algo = Algorithm_MinimumTriangulation(G, reduce_graph, timeout, **kwargs)
 	algo.run()
-	return {
-		"H" : algo.get_triangulated(),
-		"size" : len(algo.get_triangulation_edges()),
-		"mean" : len(algo.get_triangulation_edges()),
-		"variance" : 0,
-		"repetitions" : 1
-		}
+	return ta.TriangulationResult(G, algo.get_triangulation_edges(), profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.get_fill_lower_bound())
 
 class Algorithm_MinimumTriangulation(ta.TriangulationAlgorithm):
-	def __init__(self, G, reduce_graph=True, timeout=-1):
+	'''
+	Args (in addition to TriangulationAlgorithm):
+		anytime_grace : in anytime mode, the minimal triangulation of LEX M that is returned for a component whose minimum triangulation
+			was not found may still be computed after the time limit, until at most anytime_grace seconds after the time limit.
+			This bounds the time by which a run can exceed the time limit.
+			If LEX M exceeds this extended time limit as well, the TimeLimitExceededException is raised.
+	'''
+	# the twin rule does not preserve the size of a minimum triangulation:
+	SUPPORTED_REDUCTION_RULES = ["simplicial"]
+
+	def __init__(self, G, reduce_graph=True, timeout=-1, anytime_grace=1.0, **kwargs):
 		logging.info("=== MT.Algorithm_MinimumTriangulation.init ===")
-		super().__init__(G, reduce_graph, timeout)
+		# the time limit of LEX M in anytime mode, the time limit is extended by the grace period:
+		self.lexm_timeout = -1
+		if timeout > 0:
+			self.lexm_timeout = timeout + anytime_grace
+		super().__init__(G, reduce_graph, timeout, **kwargs)
+
+	def run(self, randomized=False):
+		# the lower bounds of the components are computed before the triangulation, such that the worker processes get them as well:
+		self.get_fill_lower_bound()
+		super().run(randomized)
 		
 	def triangulate(self, C, randomized=False):
 		'''
 		Find a minimum triangulation of a graph
 		
 		Args:
-			C : a graph in networkx format
+			C : a graph in CompactGraph format
 			randomized : has no effect
 			
 		Return:
-			F : a set of edges such that C + F is a minimum triangulation
+			F : a set of edges such that C + F is a minimum triangulation,
+				or the minimal triangulation of LEX M if the time limit is exceeded in anytime mode
 		'''
 		logging.info("=== MT.triangulate ===")
+		counting = not self.operation_counts == None
 
-		if nx.is_chordal(C):
+		if counting:
+			self.count_operation("is_chordal")
+		if C.is_chordal():
 			logging.debug("Component is already chordal")
 			return []
 	
-		# use LEX-M to determine the size of a minimal triangulation to have an upper bound for the minimum triangulation
-		lexm_triang = LEX_M.triangulate_LexM(C)
-		size_minimal = lexm_triang["size"]
+		# use LEX-M to determine the size of a minimal triangulation to have an upper bound for the minimum triangulation.
+		# in anytime mode, the upper bound may be computed until the end of the grace period (see anytime_grace),
+		# such that it can be returned if the search exceeds the time limit
+		lexm_timeout = self.timeout
+		if self.anytime:
+			lexm_timeout = self.lexm_timeout
+		lexm = LEX_M.Algorithm_LexM(C.to_networkx(), reduce_graph=False, timeout=lexm_timeout)
+		# the operations of LEX M are counted together with the operations of MT:
+		lexm.operation_counts = self.operation_counts
+		F_minimal = lexm.triangulate(C)
+		minimal_ready = time.time()
+		size_minimal = len(F_minimal)
 		logging.debug("size of minimal: "+str(size_minimal))
 		
 		F = []
-		# iterate through all subsets of chord edges by increasing set size.
-		# for each subset, check if self.G + additional edges is chordal
-		# return first set of edges that makes self.G chordal. this is a minimum triangulation.
-		k = 1
+		# iterate through all subsets of chord edges of this component by increasing set size.
+		# for each subset, check if C + additional edges is chordal
+		# return first set of edges that makes C chordal. this is a minimum triangulation.
+		# smaller sets than the lower bound of the fill-in cannot make C chordal, and if the bound is
+		# the size of the minimal triangulation, it is already a minimum triangulation:
+		chordedge_candidates = C.get_non_edges()
+		k = max(1, self.get_component_fill_lower_bound(C))
+		logging.debug("lower bound: "+str(k))
 		found_minimum = False
-		#print (self.chordedge_candidates)
 		while not found_minimum and k < size_minimal:
 			# check timeout:
 			if self.timeout > 0 and time.time() > self.timeout:
+				if self.anytime:
+					logging.info("MT.triangulate: time limit exceeded, return the minimal triangulation of LEX M")
+					self.component_partial = True
+					self.component_ready = minimal_ready
+					return F_minimal
 				raise ta.TimeLimitExceededException("Time Limit Exceeded!")
 
 			logging.debug("Current iteration: consider edgesets of size "+str(k))
-			edgesets_size_k = itertools.combinations(self.chordedge_candidates, k)
+			edgesets_size_k = itertools.combinations(chordedge_candidates, k)
 			k_edgeset = 0
 			for edgeset in edgesets_size_k:
-				#print (edgeset)
 				k_edgeset += 1
 				if k_edgeset%10000 == 0:
 					# check timeout every 10k sets:
 					if self.timeout > 0 and time.time() > self.timeout:
+						if self.anytime:
+							logging.info("MT.triangulate: time limit exceeded, return the minimal triangulation of LEX M")
+							self.component_partial = True
+							self.component_ready = minimal_ready
+							return F_minimal
 						raise ta.TimeLimitExceededException("Time Limit Exceeded!")
 				H = C.copy()
 				H.add_edges_from(edgeset)
-				if nx.is_chordal(H):
+				if counting:
+					self.count_operation("is_chordal")
+				if H.is_chordal():
 					F += [e for e in edgeset]
 					found_minimum = True
 					break
 			k += 1
 		if not found_minimum:
-			F += [e for e in lexm_triang["H"].edges() if e not in C.edges()]
+			F += F_minimal
 			
 		return F
-		
\ No newline at end of file
@@ -9,40 +9,21 @@ import numpy as np
 import time
 
 from TriangulationAlgorithms import TriangulationAlgorithm as ta
+from TriangulationAlgorithms import Tracer
 
-def triangulate_SMS(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1):
-	algo = Algorithm_SMS(G, reduce_graph, timeout)
+def triangulate_SMS(G, randomized=False, repetitions=1, reduce_graph=True, timeout=-1, **kwargs):
+	algo = Algorithm_SMS(G, reduce_graph, timeout, **kwargs)
 	if not randomized:
 		algo.run()
-		return {
-			"H" : algo.get_triangulated(),
-			"size" : len(algo.get_triangulation_edges()),
-			"mean" : len(algo.get_triangulation_edges()),
-			"variance" : 0,
-			"repetitions" : 1
-			}
+		return ta.TriangulationResult(G, algo.get_triangulation_edges(), profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.fill_lower_bound)
 	else:
-		H_opt = None
-		size_opt = None
-		all_sizes = []
-		for i in range(repetitions):
-			algo.run_randomized()
-			all_sizes.append(len(algo.get_triangulation_edges()))
-			if H_opt == None or len(algo.get_triangulation_edges()) < size_opt:
-				H_opt = algo.get_triangulated()
-				size_opt = len(algo.get_triangulation_edges())
-		return {
-			"H" : H_opt,
-			"size" : size_opt,
-			"mean" : np.mean(all_sizes),
-			"variance" : np.var(all_sizes),
-			"repetitions" : repetitions
-			}
+		(F_opt, alpha_opt, all_sizes) = algo.run_repetitions(repetitions)
+		return ta.TriangulationResult(G, F_opt, np.mean(all_sizes), np.var(all_sizes), len(all_sizes), profile=algo.get_profile(), operation_counts=algo.get_operation_counts(), reduction_counts=algo.get_reduction_counts(), partial=algo.partial, time_to_best=algo.time_to_best, lower_bound=algo.fill_lower_bound, seed=algo.seed_opt)
 	
 class Algorithm_SMS(ta.TriangulationAlgorithm):
-	def __init__(self, G, reduce_graph=True, timeout=-1):
+	def __init__(self, G, reduce_graph=True, timeout=-1, **kwargs):
 		logging.info("=== SMS.Algorithm_SMS.init ===")
-		super().__init__(G, reduce_graph, timeout)
+		super().__init__(G, reduce_graph, timeout, **kwargs)
 
 	def triangulate(self, C, randomized=False):
 		'''
@@ -50,7 +31,7 @@ class Algorithm_SMS(ta.TriangulationAlgorithm):
 		to construct a minimal triangulation
 		
 		Args:
-			C : a graph in networkx format
+			C : a graph in CompactGraph format
 			randomized : if true, the algorithm to find a minimal separator is randomized.
 		
 		Returns:
@@ -61,10 +42,12 @@ class Algorithm_SMS(ta.TriangulationAlgorithm):
 		F = []
 		G_prime = C.copy()
 		
-		self.node_processing_order = [i for i in range(len(C.nodes()))]#[n for n in G.nodes()]
+		self.node_processing_order = [i for i in range(len(C))]
 		if randomized:
 			random.shuffle(self.node_processing_order)
-		logging.debug("Node processing order: "+str(self.node_processing_order))
+		tracer = Tracer.TRACER
+		if not tracer == None:
+			tracer.event("start", algorithm="SMS", n=len(C), labels=C.labels, node_processing_order=[C.labels[v] for v in self.node_processing_order])
 		
 		finished = False
 		while not finished:
@@ -72,21 +55,19 @@ class Algorithm_SMS(ta.TriangulationAlgorithm):
 			if self.timeout > 0 and time.time() > self.timeout:
 				raise ta.TimeLimitExceededException("Time Limit Exceeded!")
 
-			logging.debug("Next iteration")
-			logging.debug("edges of G_prime: "+str(G_prime.edges()))
 			separator = self.get_minimal_separator(G_prime)
 			if separator == None:
 				finished = True
 			else:
 				edges_to_add = []
-				logging.debug("saturate separator "+str(separator))
 				for i_u in range(len(separator)):
 					for i_v in range(i_u+1, len(separator)):
-						logging.debug("saturate pair "+str(separator[i_u])+","+str(separator[i_v]))
 						if not G_prime.has_edge(separator[i_u], separator[i_v]):
 							edges_to_add.append((separator[i_u], separator[i_v]))
 							F.append((separator[i_u], separator[i_v]))
 				G_prime.add_edges_from(edges_to_add)
+				if not tracer == None:
+					tracer.event("saturate", separator=[C.labels[v] for v in separator], fill=C.get_labeled_edges(edges_to_add))
 		return F
 			
 	def get_minimal_separator(self, G):
@@ -96,27 +77,26 @@ class Algorithm_SMS(ta.TriangulationAlgorithm):
 		see https://cstheory.stackexchange.com/questions/29464/algorithms-for-computing-the-minimal-vertex-separator-of-a-graph
 		
 		Args:
-			G : a graph in networkx format.
+			G : a graph in CompactGraph format.
 			## randomized : if true, the order in which the nodes are processed gets shuffled
 		
 		Return:
 			S : a set of nodes that form a minimal separator of G, if such a set exists that is not a clique. If every minimal separator of G is a clique, returns None
 		'''
 		logging.info("=== get_minimal_separator ===")
+		counting = not self.operation_counts == None
+		tracer = Tracer.TRACER
 		
 		for k in range(len(self.node_processing_order)):
-			i = self.node_processing_order[k]
-			u = list(G.nodes())[i]
-			neighbors_of_u = list(G.neighbors(u))
-			for j in self.node_processing_order[k+1:]:
-				v = list(G.nodes())[j]
-				logging.debug("Consider pair: "+str(u)+", "+str(v))
+			u = self.node_processing_order[k]
+			for v in self.node_processing_order[k+1:]:
 				# construct S as set of all nodes that are neighbors of u and reachable from v:
 				S = []
-				marked = {n : False for n in G.nodes()}
-				if v in neighbors_of_u:
-					logging.debug(str(u)+" and "+str(v)+" are adjacent, no separator exists")
-				else:
+				marked = [False for n in G]
+				# if u and v are adjacent, no separator exists:
+				if not G.has_edge(u, v):
+					if counting:
+						self.count_operation("bfs")
 					bfs_stack = [v]
 					marked[v] = True
 					while not len(bfs_stack) == 0:
@@ -124,21 +104,16 @@ class Algorithm_SMS(ta.TriangulationAlgorithm):
 						for n in G.neighbors(w):
 							if not marked[n]:
 								marked[n] = True
-								if n in neighbors_of_u:
-									logging.debug("Add "+str(n)+" to separator set")
+								if G.has_edge(u, n):
 									S.append(n)
 								else:
 									bfs_stack.append(n)
-					logging.debug("Seperator: "+str(S))
 				if len(S) > 1:
-					S_graph = G.subgraph(S)
-					logging.debug(S_graph.nodes())
-					logging.debug(S_graph.edges())
-					if len(S_graph.edges()) < (len(S)*(len(S)-1))/2:
-						logging.debug(str(S) + " is a minimal seperator of G")
+					is_clique = G.is_clique(S)
+					if not tracer == None:
+						tracer.event("separator", u=G.labels[u], v=G.labels[v], separator=[G.labels[x] for x in S], clique=is_clique)
+					if not is_clique:
 						return S
-					else:
-						logging.debug(str(S) + " is a clique")
-		logging.debug("No non-clique minimal seperator of G found")
+		if not tracer == None:
+			tracer.event("separator", separator=None)
 		return None
-		
\ No newline at end of file
@@ -0,0 +1,81 @@
+#!usr/bin/python
+# -*- coding: utf-8 -*-
+
+'''
+Structured tracing of the hot loops of the triangulation algorithms.
+
+Tracing is disabled by default. In this case the hot loops only check if TRACER is None,
+so no strings or lists get constructed for the trace.
+If tracing is enabled with enable_tracing, the algorithms write events like
+the chosen node of an iteration or the added fill edges as one JSON object per line to a file.
+Nodes are given by their labels in the input graph, such that the events of different components can be told apart.
+'''
+
+import logging
+import json
+import os
+
+# the active tracer, or None if tracing is disabled:
+TRACER = None
+
+class Tracer:
+	'''
+	Writes structured events to a file, one JSON object per line
+
+	Args:
+		filename : the path of the trace file, an existing file gets overwritten
+	'''
+	def __init__(self, filename):
+		self.filename = filename
+		# the file is line buffered, such that no buffered events get duplicated in forked worker processes:
+		self.file = open(filename, 'w', buffering=1)
+
+	def event(self, name, **data):
+		'''
+		Writes a single event
+
+		Args:
+			name : the type of the event, e.g. "fill" or "number"
+			data : the attributes of the event, all values that are not JSON serializable are converted to strings
+		'''
+		entry = {"event" : name, "pid" : os.getpid()}
+		entry.update(data)
+		self.file.write(json.dumps(entry, default=str)+"\n")
+
+	def close(self):
+		self.file.close()
+
+def enable_tracing(filename):
+	'''
+	Starts writing trace events of all algorithms to a file
+
+	Args:
+		filename : the path of the trace file
+
+	Returns:
+		the active Tracer
+	'''
+	global TRACER
+	disable_tracing()
+	logging.info("Write trace to "+filename)
+	TRACER = Tracer(filename)
+	return TRACER
+
+def disable_tracing():
+	'''
+	Stops tracing and closes the trace file
+	'''
+	global TRACER
+	if not TRACER == None:
+		TRACER.close()
+	TRACER = None
+
+def read_trace(filename):
+	'''
+	Loads all events of a trace file
+
+	Returns:
+		a list of dicts, one for each event
+	'''
+	with open(filename) as tracefile:
+		return [json.loads(line) for line in tracefile if len(line.strip()) > 0]
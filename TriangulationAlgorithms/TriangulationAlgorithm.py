@@ -2,6 +2,11 @@
 # -*- coding: utf-8 -*-
 
 import logging
+import random
+import copy
+import time
+import contextlib
+import concurrent.futures
 
 import networkx as nx
 try:
@@ -13,6 +18,11 @@ except ImportError:
 else:
 	import matplotlib.pyplot as plt
 
+from TriangulationAlgorithms import CompactGraph
+from TriangulationAlgorithms import DenseGraph
+from TriangulationAlgorithms import graph_meta
+from TriangulationAlgorithms import LowerBounds
+
 class TriangulationNotSuccessfulException(Exception):
 	'''
 	Custom error type that gets thrown
@@ -26,100 +36,899 @@ class TimeLimitExceededException(Exception):
 	when a time limit was set and is exceeded.
 	'''
 
+class TriangulationResult:
+	'''
+	Lightweight result of a triangulation algorithm, as returned by the functions triangulate_*.
+	It stores the edges of the (best) triangulation and a reference to the input graph,
+	the triangulated graph H is only constructed when it is requested by get_triangulated.
+	For compatibility with the former result dicts, all values can be accessed as result["size"], result["H"], etc.
+
+	Args:
+		G : the input graph
+		edges : the list of edges of the (best) triangulation
+		mean : the mean size of the triangulations over all repetitions, defaults to the size of edges
+		variance : the variance of the sizes of the triangulations over all repetitions
+		repetitions : the number of repetitions
+		alpha : the elimination ordering of the (best) triangulation, if the algorithm constructs one
+		profile : the running time breakdown of the algorithm, see TriangulationAlgorithm.get_profile
+		operation_counts : the counts of the characteristic operations of the algorithm, if they were counted
+		reduction_counts : the number of nodes removed by each reduction rule, if reduction rules were applied
+		partial : True, if the time limit was exceeded in anytime mode and the result is only the best triangulation found until then,
+			i.e. fewer repetitions were run than requested, or the minimum triangulation of MT was not found
+		time_to_best : the wall time in seconds from the start of the run (or of all repetitions) until the returned triangulation was found
+		lower_bound : a lower bound for the size of a minimum triangulation of G, if the algorithm computed one (see LowerBounds)
+		seed : the seed of the best repetition of a randomized algorithm, the triangulation can be replayed
+			by running the algorithm again with this seed (see TriangulationAlgorithm.replay)
+		cliques : the maximal cliques of the triangulated graph, if they were requested (see TriangulationAlgorithm.get_clique_tree)
+		clique_parent : the index of the parent of each clique in a clique tree, or None for the roots
+		separators : the separator of each clique and its parent in the clique tree, or None for the roots
+
+	Attributes:
+		size : the number of edges of the (best) triangulation
+		H : the triangulated graph G + edges, None until get_triangulated is called
+	'''
+	__slots__ = ["G", "edges", "size", "mean", "variance", "repetitions", "alpha", "profile", "operation_counts", "reduction_counts", "partial", "time_to_best", "lower_bound", "seed", "cliques", "clique_parent", "separators", "H"]
+	
+	def __init__(self, G, edges, mean=None, variance=0, repetitions=1, alpha=None, profile=None, operation_counts=None, reduction_counts=None, partial=False, time_to_best=None, lower_bound=None, seed=None, cliques=None, clique_parent=None, separators=None):
+		self.G = G
+		self.edges = edges
+		self.size = len(edges)
+		if mean == None:
+			mean = self.size
+		self.mean = mean
+		self.variance = variance
+		self.repetitions = repetitions
+		self.alpha = alpha
+		self.profile = profile
+		self.operation_counts = operation_counts
+		self.reduction_counts = reduction_counts
+		self.partial = partial
+		self.time_to_best = time_to_best
+		self.lower_bound = lower_bound
+		self.seed = seed
+		self.cliques = cliques
+		self.clique_parent = clique_parent
+		self.separators = separators
+		self.H = None
+
+	def get_triangulated(self):
+		if self.H == None:
+			if self.profile == None:
+				self.H = get_triangulated_graph(self.G, self.edges)
+			else:
+				with measure_phase(self.profile["phases"], "H_construction"):
+					self.H = get_triangulated_graph(self.G, self.edges)
+		return self.H
+
+	def get_triangulation_edges(self):
+		return self.edges
+
+	def get_triangulation_size(self):
+		return self.size
+
+	def keys(self):
+		return [key for key in self.__slots__ if key == "H" or not getattr(self, key) == None]
+
+	def __contains__(self, key):
+		return key in self.keys()
+
+	def __getitem__(self, key):
+		if key == "H":
+			return self.get_triangulated()
+		if key not in self.keys():
+			raise KeyError(key)
+		return getattr(self, key)
+
+	def get(self, key, default=None):
+		if key in self.keys():
+			return self[key]
+		return default
+
 class TriangulationAlgorithm:
 	'''
 	Superclass for all triangulation algorithms
 
 	Args:
 		G : the graph to triangulate
-		reduce_graph : if set to True, all single-vertex-seperators get removed from the graph,
-						and a subgraph for each component gets constructed
+		reduce_graph : if set to True, all nodes that do not lie on a cycle get removed from the graph,
+						and a subgraph for each component gets constructed, see get_relevant_components
 		timeout : if timeout is set to a value > 0, it specifies the maximum time in seconds the algorithm
 						is allowed to run before it gets terminated
+		decompose_atoms : if set to True, each component is further decomposed along its clique minimal separators,
+						and a subgraph for each atom that is not a clique gets constructed
+		reduction_rules : a list of reduction rules ("simplicial", "twin") that are applied to each component
+						before the triangulation, see apply_reduction_rules
+		num_workers : if set to a value > 1, the components are triangulated concurrently in a pool of
+						at most num_workers worker processes, and the repetitions of run_repetitions are run concurrently
+		verification : the check that the result is chordal, see verify_component:
+						"auto" checks the elimination ordering of the algorithm if there is one, otherwise runs MCS,
+						"mcs" always runs MCS, "lexbfs" always runs LEX BFS (see graph_meta.LEX_BFS), "none" skips the check
+		count_operations : if set to True, the algorithm counts its characteristic operations, see count_operation
+		dense_backend : if set to True, the algorithms that support it (EG, LEX M, MCS-M) use an adjacency matrix for each component,
+						if set to "auto", only for dense components (see DenseGraph.is_dense)
+		anytime : if set to True, an exceeded time limit does not discard the work done so far:
+						run_repetitions returns the best triangulation of the finished repetitions,
+						and MT returns the minimal triangulation of LEX M for components whose minimum triangulation was not found,
+						LEX M may exceed the time limit by a grace period (see MT.Algorithm_MinimumTriangulation).
+						Such results are marked as partial.
+		patience : if set to a value > 0, run_repetitions stops as soon as the best size has not improved for patience repetitions
+		time_budget : if set to a value > 0, run_repetitions runs repetitions until time_budget seconds are spent,
+						instead of a fixed number of repetitions
+						If patience or time_budget is set, run_repetitions also stops as soon as the best size reaches get_fill_lower_bound.
+		seed : if set, run_repetitions only replays the repetition with this seed, e.g. the seed of the best repetition of an earlier run
+		report_lower_bound : if set to True, run and run_repetitions compute the lower bound of get_fill_lower_bound,
+						such that it is reported with the results. Otherwise, it is only computed if needed, e.g. for adaptive repetitions or by MT.
 
 	Attributes:
 		G : the original graph
-		component_subgraphs : a list of graphs in networkx format
+		CG : the original graph as CompactGraph, i.e. with nodes relabeled to 0,...,n-1
+		component_subgraphs : a list of graphs in CompactGraph format
 			if G was reduced, this contains each component of the reduced G as a graph.
-			otherwise, it contains only G
-		H : the triangulated graph
+			if G was decomposed into atoms, this contains each atom of G that is not a clique.
+			otherwise, it contains only CG
+		H : the triangulated graph, only constructed on the first call of get_triangulated after a run
 		edges_of_triangulation : the set of edges that are added to G to achieve H
 		alpha : a dict {node: int} that contains a perfect elimination ordering, if one gets constructed
+		component_alpha : a dict {index: int} that contains the elimination ordering of the last triangulated component,
+			if one gets constructed by the method triangulate
+		reduced_nodes : a list of tuples (rule, node, representative, block) of all nodes removed by reduction rules, in order of removal,
+			where block is the set of nodes of the component in which a twin and its representative were found, otherwise None
+		reduction_counts : a dict that contains the number of nodes removed by each reduction rule, None if no reduction rules were applied
+		phase_times : a dict {phase: {"wall": float, "cpu": float, "calls": int}} with the accumulated running times
+			of all phases of the algorithm, see get_profile
+		component_times : a list that contains the accumulated wall time and cpu time [wall, cpu] for each component
+		num_runs : the number of runs since the initialization
+		partial : True, if the last run (or the last call of run_repetitions) was stopped by the time limit in anytime mode
+		time_to_best : the wall time in seconds until the triangulation of the last run (or the best repetition) was found
+		fill_lower_bound : a lower bound for the size of a minimum triangulation of G, None until get_fill_lower_bound is called
+		component_fill_lower_bounds : a dict that contains the lower bound of each component for which it was computed,
+			with the tuple of the labels of the component as key, see get_component_fill_lower_bound
+		seed_opt : the seed of the best repetition of the last call of run_repetitions
+		operation_counts : a dict {operation: int} with the accumulated counts of all runs if operations are counted, otherwise None
 	'''
-	def __init__(self, G, reduce_graph=True, timeout=-1):
+	# reduction rules that preserve the objective of the algorithm:
+	SUPPORTED_REDUCTION_RULES = ["simplicial", "twin"]
+	SUPPORTED_VERIFICATIONS = ["auto", "mcs", "lexbfs", "none"]
+
+	def __init__(self, G, reduce_graph=True, timeout=-1, decompose_atoms=False, reduction_rules=None, num_workers=1, verification="auto", count_operations=False, dense_backend="auto", anytime=False, patience=0, time_budget=-1, seed=None, report_lower_bound=False):
 		self.G = G
-		self.component_subgraphs = [G]
+		self.timeout = timeout
+		self.num_workers = num_workers
+		self.dense_backend = dense_backend
+		self.anytime = anytime
+		self.partial = False
+		self.time_to_best = None
+		self.patience = patience
+		self.time_budget = time_budget
+		self.fill_lower_bound = None
+		self.component_fill_lower_bounds = {}
+		self.report_lower_bound = report_lower_bound
+		self.seed = seed
+		self.seed_opt = None
+		if verification not in self.SUPPORTED_VERIFICATIONS:
+			logging.warning("Verification "+str(verification)+" is not supported, using auto instead.")
+			verification = "auto"
+		self.verification = verification
+		self.phase_times = {}
+		self.num_runs = 0
+		if count_operations:
+			self.operation_counts = {}
+		else:
+			self.operation_counts = None
+		with measure_phase(self.phase_times, "graph_conversion"):
+			self.CG = CompactGraph.CompactGraph(G)
+		self.component_subgraphs = [self.CG]
+		self.reduced_nodes = []
+		self.reduction_counts = None
 		if reduce_graph:
-			self.get_relevant_components()
-			self.get_chordedge_candidates()
+			with measure_phase(self.phase_times, "reduction"):
+				self.get_relevant_components()
+		if not reduction_rules == None:
+			with measure_phase(self.phase_times, "reduction_rules"):
+				self.apply_reduction_rules(reduction_rules)
+		if decompose_atoms:
+			with measure_phase(self.phase_times, "atom_decomposition"):
+				self.decompose_into_atoms()
+		self.component_times = [[0.0, 0.0] for C in self.component_subgraphs]
 			
 		self.H = None
+		self.triangulated = False
 		self.edges_of_triangulation = []
 		self.alpha = {}
-		self.timeout = timeout
+		self.component_alpha = {}
+		self.component_partial = False
+		self.component_ready = None
+
+	def triangulate(self, C, randomized=False):
+		'''
+		Computes a triangulation of a single component. Implemented by each triangulation algorithm.
+
+		Args:
+			C : a graph in CompactGraph format
+			randomized : if set to True, the algorithm is randomized
+
+		Returns:
+			F : a set of edges between indices of C such that C + F is chordal
+				In anytime mode, an algorithm may return a non-optimal triangulation after the time limit is exceeded,
+				it then sets component_partial to True, and may set component_ready to the value of time.time()
+				at which this triangulation was found.
+		'''
+		raise NotImplementedError
 
-	def run(self):
+	def run(self, randomized=False):
+		self.H = None
+		self.triangulated = False
+		self.edges_of_triangulation = []
 		self.alpha = {}
-		for C in self.component_subgraphs:
-			# get triangulation for each connected component of the reduced graph G_c:
-			self.edges_of_triangulation += self.triangulate(C)
-		
-		self.H = self.G.copy()
-		self.H.add_edges_from(self.edges_of_triangulation)
-		
-		if not nx.is_chordal(self.H):
-			raise ta.TriangulationNotSuccessfulException("Resulting graph is somehow not chordal!")
+		self.partial = False
+		self.num_runs += 1
+		wall_start = time.perf_counter()
+		# the clock time of the start, to compare with the times at which the partial results of the components were found:
+		clock_start = time.time()
+		# the latest time at which the result of a component was found:
+		ready = None
+		# get triangulation for each component of the reduced graph:
+		with measure_phase(self.phase_times, "triangulate"):
+			results = self.triangulate_components(randomized)
+		with measure_phase(self.phase_times, "verification"):
+			self.verify_triangulation(results)
+		for i in range(len(self.component_subgraphs)):
+			C = self.component_subgraphs[i]
+			(F, component_alpha, component_time, component_counts, component_partial, component_ready) = results[i]
+			if component_partial:
+				self.partial = True
+			if ready == None or component_ready > ready:
+				ready = component_ready
+			self.component_times[i][0] += component_time[0]
+			self.component_times[i][1] += component_time[1]
+			if not component_counts == None:
+				for operation in component_counts:
+					self.count_operation(operation, component_counts[operation])
+			# map the edges and the ordering of the component back to the original node labels:
+			self.edges_of_triangulation += C.get_labeled_edges(F)
+			self.alpha.update(C.get_labeled_ordering(component_alpha))
+		with measure_phase(self.phase_times, "reinsertion"):
+			self.edges_of_triangulation += self.get_reinserted_edges()
+		self.triangulated = True
+		if self.partial:
+			# the result was found when the partial result of the last component was found, not when the run ends:
+			self.time_to_best = ready - clock_start
+		else:
+			self.time_to_best = time.perf_counter() - wall_start
+		if self.report_lower_bound:
+			self.get_fill_lower_bound()
 			
 	def run_randomized(self):
-		self.edges_of_triangulation = []
-		self.alpha = {}
-		for C in self.component_subgraphs:
-			# get triangulation for each connected component of the reduced graph G_c:
-			self.edges_of_triangulation += self.triangulate(C, randomized=True)
-		
-		self.H = self.G.copy()
-		self.H.add_edges_from(self.edges_of_triangulation)
-		
-		if not nx.is_chordal(self.H):
-			raise ta.TriangulationNotSuccessfulException("Resulting graph is somehow not chordal!")
+		self.run(randomized=True)
+
+	def run_seeded(self, seed):
+		'''
+		Runs the randomized algorithm after seeding the random generator, such that the run can be replayed with the same seed.
+		The state of the random generator is restored afterwards, such that the seeds of the repetitions of run_repetitions
+		are drawn from the same sequence as in the worker processes, independent of the runs.
+		'''
+		state = random.getstate()
+		random.seed(seed)
+		try:
+			self.run_randomized()
+		finally:
+			random.setstate(state)
+
+	def replay(self, seed):
+		'''
+		Reconstructs the triangulation of a repetition of run_repetitions from its seed.
+		The seeds of the components are derived from this seed (see triangulate_components),
+		such that the result does not depend on num_workers.
+
+		Args:
+			seed : the seed of the repetition, e.g. seed_opt
+
+		Returns:
+			(F, alpha) : the edges and the elimination ordering of the triangulation of the repetition
+		'''
+		logging.info("TA.replay: replay the repetition with seed "+str(seed))
+		self.run_seeded(seed)
+		return (self.get_triangulation_edges(), self.alpha)
+
+	def run_repetitions(self, repetitions=1):
+		'''
+		Runs the randomized algorithm repeatedly and keeps the smallest triangulation, as used by the randomized triangulate_* functions.
+		Each repetition seeds the random generator with its own seed, which is drawn in this process, see run_seeded.
+		Only the triangulation, the size and the seed of the best repetition are kept, the others can be replayed from their seeds.
+		If seed is set, only the repetition with this seed is replayed.
+		If num_workers > 1, the repetitions are run concurrently in a pool of worker processes, at most num_workers at a time.
+		Each worker gets a copy of the algorithm once, with num_workers = 1 such that its components are triangulated one after another.
+		The running times and operation counts of all repetitions are added to the profile of this algorithm.
+		If a repetition exceeds the time limit, no further repetitions are started.
+		In anytime mode, the best triangulation of the finished repetitions is kept and partial is set to True,
+		otherwise (or if no repetition is finished) the TimeLimitExceededException is raised.
+		If patience or time_budget is set, the number of repetitions is adaptive, see is_converged.
+
+		Args:
+			repetitions : the number of randomized runs, ignored if time_budget is set
+
+		Returns:
+			(F_opt, alpha_opt, all_sizes) : the edges and the elimination ordering of the first smallest triangulation,
+				and the sizes of the triangulations of all finished repetitions in the order of the repetitions
+		'''
+		F_opt = None
+		alpha_opt = None
+		seed_opt = None
+		all_sizes = []
+		partial = False
+		time_to_best = None
+		wall_start = time.perf_counter()
+		# the number of repetitions since the last improvement of the best size:
+		num_without_improvement = 0
+		if not self.seed == None:
+			(F_opt, alpha_opt) = self.replay(self.seed)
+			seed_opt = self.seed
+			partial = self.partial
+			all_sizes.append(len(F_opt))
+			time_to_best = time.perf_counter() - wall_start
+		elif self.num_workers <= 1 or (repetitions <= 1 and not self.time_budget > 0):
+			while (self.time_budget > 0 or len(all_sizes) < repetitions) and not (not F_opt == None and self.is_converged(len(F_opt), num_without_improvement, wall_start)):
+				seed = random.getrandbits(64)
+				try:
+					self.run_seeded(seed)
+				except TimeLimitExceededException:
+					if not self.anytime or F_opt == None:
+						raise
+					logging.info("TA.run_repetitions: time limit exceeded after "+str(len(all_sizes))+" repetitions")
+					partial = True
+					break
+				partial = partial or self.partial
+				all_sizes.append(len(self.get_triangulation_edges()))
+				if F_opt == None or len(self.get_triangulation_edges()) < len(F_opt):
+					F_opt = self.get_triangulation_edges()
+					alpha_opt = self.alpha
+					seed_opt = seed
+					time_to_best = time.perf_counter() - wall_start
+					num_without_improvement = 0
+				else:
+					num_without_improvement += 1
+		else:
+			logging.info("TA.run_repetitions: "+str(repetitions)+" repetitions with "+str(self.num_workers)+" workers")
+			worker_algorithm = copy.copy(self)
+			worker_algorithm.num_workers = 1
+			worker_algorithm.H = None
+			# the size of the triangulation of each finished repetition:
+			sizes = {}
+			# the index of the repetition of each running future:
+			running = {}
+			# the index of the best repetition, i.e. the first one with the smallest size:
+			index_opt = None
+			time_limit_exceeded = False
+			with concurrent.futures.ProcessPoolExecutor(max_workers=self.num_workers, initializer=init_repetition_worker, initargs=(worker_algorithm,)) as executor:
+				num_submitted = 0
+				while True:
+					while len(running) < self.num_workers and not time_limit_exceeded and (self.time_budget > 0 or num_submitted < repetitions) and not (not F_opt == None and self.is_converged(len(F_opt), num_without_improvement, wall_start)):
+						running[executor.submit(run_repetition, random.getrandbits(64))] = num_submitted
+						num_submitted += 1
+					if len(running) == 0:
+						break
+					(done, not_done) = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+					for future in done:
+						i = running.pop(future)
+						try:
+							(F, alpha, seed, phase_times, component_times, operation_counts, repetition_partial) = future.result()
+						except TimeLimitExceededException:
+							if not self.anytime:
+								raise
+							time_limit_exceeded = True
+							partial = True
+							continue
+						self.num_runs += 1
+						for phase in phase_times:
+							if phase not in self.phase_times:
+								self.phase_times[phase] = {"wall": 0.0, "cpu": 0.0, "calls": 0}
+							for key in ["wall", "cpu", "calls"]:
+								self.phase_times[phase][key] += phase_times[phase][key]
+						for j in range(len(component_times)):
+							self.component_times[j][0] += component_times[j][0]
+							self.component_times[j][1] += component_times[j][1]
+						if not operation_counts == None:
+							for operation in operation_counts:
+								self.count_operation(operation, operation_counts[operation])
+						partial = partial or repetition_partial
+						sizes[i] = len(F)
+						if F_opt == None or len(F) < len(F_opt):
+							num_without_improvement = 0
+						else:
+							num_without_improvement += 1
+						if F_opt == None or (len(F), i) < (len(F_opt), index_opt):
+							F_opt = F
+							alpha_opt = alpha
+							seed_opt = seed
+							index_opt = i
+							time_to_best = time.perf_counter() - wall_start
+			if len(sizes) == 0:
+				raise TimeLimitExceededException("Time Limit Exceeded!")
+			all_sizes = [sizes[i] for i in sorted(sizes)]
+		logging.debug("TA.run_repetitions: "+str(len(all_sizes))+" repetitions, best size "+str(len(F_opt)))
+		# the best repetition is kept as the last run:
+		self.H = None
+		self.edges_of_triangulation = F_opt
+		self.alpha = alpha_opt
+		self.triangulated = True
+		self.partial = partial
+		self.time_to_best = time_to_best
+		self.seed_opt = seed_opt
+		if self.report_lower_bound:
+			self.get_fill_lower_bound()
+		return (F_opt, alpha_opt, all_sizes)
+
+	def is_converged(self, size_opt, num_without_improvement, wall_start):
+		'''
+		Checks if the adaptive repetitions of run_repetitions can stop, i.e. if patience or time_budget is set and
+		the best size reaches the lower bound of get_fill_lower_bound, or has not improved for patience repetitions,
+		or the time budget is spent
+
+		Args:
+			size_opt : the best size of the repetitions so far
+			num_without_improvement : the number of repetitions since the last improvement of the best size
+			wall_start : the value of time.perf_counter() at the start of the repetitions
+
+		Returns:
+			True, if no further repetitions are started
+		'''
+		if not self.patience > 0 and not self.time_budget > 0:
+			return False
+		if size_opt <= self.get_fill_lower_bound():
+			return True
+		if self.patience > 0 and num_without_improvement >= self.patience:
+			return True
+		return self.time_budget > 0 and time.perf_counter() - wall_start >= self.time_budget
+
+	def get_fill_lower_bound(self):
+		'''
+		Computes a lower bound for the size of a minimum triangulation of G as the sum of the lower bounds of the components,
+		see LowerBounds.get_fill_lower_bound
+
+		Returns:
+			fill_lower_bound : the lower bound, which is computed once
+		'''
+		if self.fill_lower_bound == None:
+			self.fill_lower_bound = sum([self.get_component_fill_lower_bound(C) for C in self.component_subgraphs])
+		return self.fill_lower_bound
+
+	def get_component_fill_lower_bound(self, C):
+		'''
+		Computes the lower bound of LowerBounds.get_fill_lower_bound for a single component.
+		The bounds are kept in component_fill_lower_bounds, such that the bound of each component is computed once,
+		e.g. by MT during the triangulation and again for the bound of the whole graph.
+
+		Args:
+			C : a component in CompactGraph format
+
+		Returns:
+			fill_lower_bound : the lower bound for the size of a minimum triangulation of C
+		'''
+		key = tuple(C.labels)
+		if key not in self.component_fill_lower_bounds:
+			with measure_phase(self.phase_times, "lower_bound"):
+				self.component_fill_lower_bounds[key] = LowerBounds.get_fill_lower_bound(C)
+		return self.component_fill_lower_bounds[key]
+
+	def triangulate_components(self, randomized=False):
+		'''
+		Triangulates all components, either one after another or concurrently in a pool of worker processes.
+		Each worker gets a copy of the algorithm without the graphs, so the algorithm has to be picklable.
+		If randomized, a seed is drawn for each component in this process and the component is triangulated after seeding
+		the random generator with it, such that the triangulation does not depend on num_workers.
+		If a component exceeds the time limit, all components that have not been started yet are cancelled
+		and the TimeLimitExceededException is raised.
+
+		Args:
+			randomized : if set to True, the algorithm is randomized
+
+		Returns:
+			results : a list that contains a tuple (F, component_alpha, component_time, component_counts, component_partial, component_ready) for each component,
+				in the order of component_subgraphs
+		'''
+		components = self.component_subgraphs
+		# draw the seeds in this process, such that the workers do not share the state of the random generator:
+		seeds = [random.getrandbits(64) if randomized else None for C in components]
+		if self.num_workers <= 1 or len(components) <= 1:
+			state = random.getstate()
+			try:
+				results = []
+				for i in range(len(components)):
+					results.append(triangulate_component(self, components[i], randomized, seeds[i]))
+			finally:
+				# continue with the state after the seeds were drawn, as in the parallel case:
+				random.setstate(state)
+			return results
+		logging.info("TA.triangulate_components: "+str(len(components))+" components with "+str(self.num_workers)+" workers")
+		worker_algorithm = self.get_worker_copy()
+		# submit the largest components first to balance the load of the workers:
+		submission_order = sorted(range(len(components)), key=lambda i: len(components[i]), reverse=True)
+		with concurrent.futures.ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+			futures = {}
+			for i in submission_order:
+				futures[i] = executor.submit(triangulate_component, worker_algorithm, components[i], randomized, seeds[i])
+			try:
+				# collect the results in the order of the components, independent of the order in which they finish:
+				results = [futures[i].result() for i in range(len(components))]
+			except Exception:
+				for future in futures.values():
+					future.cancel()
+				raise
+		return results
+
+	def verify_triangulation(self, results):
+		'''
+		Checks that each component together with the edges of its triangulation is chordal.
+		This suffices for the whole graph, since the components are separated by cliques,
+		and the reinsertion of nodes removed by reduction rules preserves chordality.
+
+		Args:
+			results : a list of tuples (F, component_alpha, component_time, component_counts, component_partial, component_ready), as returned by triangulate_components
+		'''
+		if self.verification == "none":
+			return
+		for i in range(len(self.component_subgraphs)):
+			(F, component_alpha, component_time, component_counts, component_partial, component_ready) = results[i]
+			self.verify_component(self.component_subgraphs[i], F, component_alpha)
+
+	def verify_component(self, C, F, alpha=None):
+		'''
+		Checks if C + F is chordal without constructing a networkx graph, running time in O(n+m+|F|) up to sorting alpha.
+		If verification is set to "auto" and alpha orders all nodes of C, it is checked as a perfect elimination ordering of C + F,
+		on an adjacency matrix if the dense backend is used for C.
+		Otherwise, or if alpha is no perfect elimination ordering, the check uses maximum cardinality search,
+		or lexicographic breadth-first search if verification is set to "lexbfs".
+
+		Args:
+			C : a graph in CompactGraph format
+			F : a set of edges between indices of C
+			alpha : an optional elimination ordering of C as a dict {index: position}
+
+		Raises:
+			TriangulationNotSuccessfulException : if C + F is not chordal
+		'''
+		if self.verification == "none":
+			return
+		if self.verification == "auto" and not alpha == None and len(alpha) == len(C) and DenseGraph.use_dense_backend(C, self.dense_backend):
+			D = DenseGraph.DenseGraph(C)
+			D.add_edges_from(F)
+			if D.is_perfect_elimination_ordering(sorted(alpha, key=lambda v: alpha[v])):
+				return
+		H = C.copy()
+		H.add_edges_from(F)
+		if self.verification == "auto" and not alpha == None and len(alpha) == len(C):
+			if H.is_perfect_elimination_ordering(sorted(alpha, key=lambda v: alpha[v])):
+				return
+		if self.verification == "lexbfs":
+			(lex_bfs_order, is_peo) = graph_meta.LEX_BFS(H, check_peo=True)
+			if not is_peo:
+				raise TriangulationNotSuccessfulException("Resulting graph is somehow not chordal!")
+			return
+		if not H.is_chordal():
+			raise TriangulationNotSuccessfulException("Resulting graph is somehow not chordal!")
+
+	def get_worker_copy(self):
+		'''
+		Constructs a shallow copy of the algorithm that only contains its configuration,
+		such that it can be sent to a worker process to triangulate single components
+		'''
+		worker_algorithm = copy.copy(self)
+		worker_algorithm.G = None
+		worker_algorithm.CG = None
+		worker_algorithm.H = None
+		worker_algorithm.triangulated = False
+		worker_algorithm.component_subgraphs = []
+		worker_algorithm.edges_of_triangulation = []
+		worker_algorithm.alpha = {}
+		worker_algorithm.component_alpha = {}
+		worker_algorithm.component_partial = False
+		worker_algorithm.component_ready = None
+		return worker_algorithm
 	
 	def get_triangulated(self):
+		'''
+		Returns the triangulated graph H = G + edges_of_triangulation of the last run,
+		it is constructed on the first call and kept afterwards
+		'''
+		if self.H == None and self.triangulated:
+			with measure_phase(self.phase_times, "H_construction"):
+				self.H = get_triangulated_graph(self.G, self.edges_of_triangulation)
 		return self.H
 		
 	def get_triangulation_edges(self):
 		return self.edges_of_triangulation
 
+	def get_clique_tree(self):
+		'''
+		Computes the maximal cliques and a clique tree of the triangulated graph of the last run (or of the best repetition)
+		in O(n+m+|F|), see graph_meta.get_clique_tree.
+		The elimination ordering of the run is used if it is a perfect elimination ordering of the whole triangulated graph,
+		as for LEX M and MCS-M on a graph that is triangulated as a single component.
+		Otherwise, e.g. if the graph was reduced, the ordering is computed by maximum cardinality search.
+
+		Returns:
+			(cliques, parent, separators) : the maximal cliques as lists of node labels, the index of the parent of each clique,
+				or None for the roots, and the separator of each clique and its parent, or None for the roots
+		'''
+		with measure_phase(self.phase_times, "clique_tree"):
+			n = len(self.CG)
+			indexed_edges = self.CG.get_indexed_edges(self.edges_of_triangulation)
+			adj = [list(neighbors) for neighbors in self.CG.adj]
+			for (u, v) in indexed_edges:
+				adj[u].append(v)
+				adj[v].append(u)
+			ordering = None
+			if len(self.alpha) == n:
+				ordering = sorted(range(n), key=lambda v: self.alpha[self.CG.labels[v]])
+				# the elimination ordering is a perfect elimination ordering iff its reverse passes the test of LEX BFS:
+				reverse_position = [0]*n
+				for i in range(n):
+					reverse_position[ordering[i]] = n-1-i
+				if not graph_meta.is_reverse_perfect_elimination_ordering(adj, reverse_position):
+					ordering = None
+			if ordering == None:
+				H = self.CG.copy()
+				H.add_edges_from(indexed_edges)
+				ordering = H.get_mcs_ordering()
+			(cliques, parent, separators) = graph_meta.get_clique_tree(adj, ordering)
+			cliques = [[self.CG.labels[v] for v in clique] for clique in cliques]
+			separators = [None if separator == None else [self.CG.labels[v] for v in separator] for separator in separators]
+		return (cliques, parent, separators)
+
 	def get_triangulation_size(self):
 		return len(self.edges_of_triangulation)
 		
+	def get_profile(self):
+		'''
+		Constructs the running time breakdown of the algorithm.
+		If the components are triangulated by worker processes, the cpu time of the phase "triangulate"
+		only contains the time of the main process, while the component times contain the time of the workers.
+
+		Returns:
+			profile : a dict with the entries
+				"phases" : a dict {phase: {"wall": float, "cpu": float, "calls": int}} with the accumulated times of the phases
+					graph_conversion, reduction, reduction_rules, atom_decomposition, chordedge_candidates,
+					triangulate, verification, reinsertion, clique_tree and H_construction (only the phases that were executed)
+				"runs" : the number of runs
+				"num_components" : the number of components
+				"component_sizes" : a list that contains the number of nodes of each component
+				"component_edges" : a list that contains the number of edges of each component
+				"component_times" : a list that contains the accumulated wall time and cpu time [wall, cpu] of each component
+				"reduction_counts" : the number of nodes removed by each reduction rule, see get_reduction_counts
+		'''
+		return {
+			"phases" : {phase : dict(self.phase_times[phase]) for phase in self.phase_times},
+			"runs" : self.num_runs,
+			"num_components" : len(self.component_subgraphs),
+			"component_sizes" : [len(C) for C in self.component_subgraphs],
+			"component_edges" : [C.number_of_edges() for C in self.component_subgraphs],
+			"component_times" : [list(t) for t in self.component_times],
+			"reduction_counts" : self.get_reduction_counts()
+			}
+
+	def count_operation(self, operation, k=1):
+		'''
+		Adds k to the counter of an operation. Only called if operations are counted,
+		i.e. the hot loops of the algorithms check if self.operation_counts is None before calling this method:
+			LEX_M, MCS_M : "reachability_sweep"
+			CMT : "get_common_neighborhood", "T_updates"
+			SMS : "bfs"
+			MT : "is_chordal"
+		'''
+		self.operation_counts[operation] = self.operation_counts.get(operation, 0) + k
+
+	def get_operation_counts(self):
+		'''
+		Returns a copy of the accumulated operation counts of all runs, or None if operations are not counted
+		'''
+		if self.operation_counts == None:
+			return None
+		return dict(self.operation_counts)
+
 	def get_relevant_components(self):
+		'''
+		Reduces the graph to the nodes that lie on a cycle, i.e. the nodes of the 2-connected blocks with at least three nodes,
+		and constructs a subgraph for each connected component of the induced subgraph on these nodes.
+		All tree-like parts of the graph are discarded, since no chord edges are required there.
+		Running time in O(n+m).
+		'''
 		logging.info("TA.get_relevant_components")
-		# construct set of possible chord edges:
-		# only consider subgraphs after all separators of size 1 have been removed from graph:
-		cycle_nodes = list(set([n for c in nx.cycle_basis(self.G) for n in c]))
-		single_node_separators = [n for n in self.G.nodes() if n not in cycle_nodes]
-		self.G_c = self.G.subgraph(cycle_nodes)
-		self.component_subgraphs = [self.G_c.subgraph(c) for c in nx.connected_components(self.G_c) if len(c) > 1]
+		self.component_subgraphs = self.get_cycle_components(self.CG)
 		
-		#logging.debug("cycle nodes: "+str(cycle_nodes))
-		#logging.debug("nodes to remove: "+str(single_node_separators))
 		logging.debug("Number of components of the reduced graph: "+str(len(self.component_subgraphs)))
+
+	def get_cycle_components(self, C):
+		'''
+		Computes the connected components of the subgraph of C that is induced by the nodes of its 2-connected blocks
+		with at least three nodes, see get_relevant_components
+
+		Args:
+			C : a graph in CompactGraph format
+
+		Returns:
+			components : a list of subgraphs of C in CompactGraph format, ordered by their smallest node
+		'''
+		cycle_nodes = [v for b in C.get_biconnected_components() if len(b) > 2 for v in b]
+		return [C.subgraph(component) for component in C.get_connected_components(cycle_nodes)]
 	
+	def apply_reduction_rules(self, rules):
+		'''
+		Removes nodes from each component that can be reinserted after the triangulation:
+			"simplicial" : a node whose neighborhood is a clique is never incident to a chord edge of a minimal triangulation.
+				Removing it preserves minimal and minimum triangulations.
+			"twin" : if two adjacent nodes u, v have the same closed neighborhood, they have the same closed neighborhood
+				in every minimal triangulation. Hence v gets removed and reinserted with the chord edges of u.
+				Since the neighborhoods are compared within a component, only the chord edges of u within this component are copied.
+				This preserves minimal triangulations, but not the size of minimum triangulations.
+		The rules are applied repeatedly until no more nodes can be removed.
+		Afterwards, each component is reduced to the nodes that still lie on a cycle again, see get_cycle_components.
+
+		Args:
+			rules : a list of the names of the rules to apply
+		'''
+		logging.info("TA.apply_reduction_rules")
+		for rule in rules:
+			if rule not in self.SUPPORTED_REDUCTION_RULES:
+				logging.warning("Reduction rule "+str(rule)+" is not supported by this algorithm and gets skipped")
+		rules = [rule for rule in rules if rule in self.SUPPORTED_REDUCTION_RULES]
+		self.reduction_counts = {rule : 0 for rule in rules}
+
+		reduced_subgraphs = []
+		for C in self.component_subgraphs:
+			block = frozenset(C.labels)
+			R = C.copy()
+			remaining = [True for v in C]
+			changed = True
+			while changed:
+				changed = False
+				if "simplicial" in rules:
+					candidates = [v for v in R if remaining[v]]
+					while len(candidates) > 0:
+						v = candidates.pop()
+						if remaining[v] and R.is_clique(R.neighbors(v)):
+							neighbors = list(R.neighbors(v))
+							R.remove_edges_from([(v, u) for u in neighbors])
+							remaining[v] = False
+							self.reduced_nodes.append(("simplicial", C.labels[v], None, None))
+							self.reduction_counts["simplicial"] += 1
+							candidates += neighbors
+							changed = True
+				if "twin" in rules:
+					representatives = {}
+					for v in R:
+						if remaining[v]:
+							closed_neighborhood = R.bits[v] | (1 << v)
+							if closed_neighborhood in representatives:
+								u = representatives[closed_neighborhood]
+								R.remove_edges_from([(v, w) for w in list(R.neighbors(v))])
+								remaining[v] = False
+								self.reduced_nodes.append(("twin", C.labels[v], C.labels[u], block))
+								self.reduction_counts["twin"] += 1
+								changed = True
+							else:
+								representatives[closed_neighborhood] = v
+			S = C.subgraph([v for v in C if remaining[v]])
+			reduced_subgraphs += self.get_cycle_components(S)
+		self.component_subgraphs = reduced_subgraphs
+
+		logging.info("Number of nodes removed by reduction rules: "+str(self.reduction_counts))
+		logging.debug("Number of components after reduction: "+str(len(self.component_subgraphs)))
+
+	def get_reinserted_edges(self):
+		'''
+		Reinserts all nodes that were removed by reduction rules in reverse order of removal.
+		Simplicial nodes require no chord edges, twins get the same chord edges as their representative
+		within the component in which they were found.
+
+		Returns:
+			F : the set of chord edges that are incident to reinserted nodes
+		'''
+		fill_neighbors = {}
+		if len(self.reduced_nodes) > 0:
+			for (u, v) in self.edges_of_triangulation:
+				fill_neighbors.setdefault(u, []).append(v)
+				fill_neighbors.setdefault(v, []).append(u)
+		F = []
+		for (rule, v, u, block) in reversed(self.reduced_nodes):
+			if rule == "twin":
+				for x in list(fill_neighbors.get(u, [])):
+					if x not in block:
+						continue
+					F.append((v, x))
+					fill_neighbors.setdefault(v, []).append(x)
+					fill_neighbors[x].append(v)
+		return F
+
+	def get_reduction_counts(self):
+		'''
+		Returns a copy of the number of nodes removed by each reduction rule, or None if no reduction rules were applied
+		'''
+		if self.reduction_counts == None:
+			return None
+		return dict(self.reduction_counts)
+
+	def decompose_into_atoms(self):
+		'''
+		Replaces each component by its atoms, i.e. the maximal subgraphs without a clique minimal separator.
+		No chord edge of a minimal triangulation crosses a clique minimal separator,
+		hence any minimal (minimum) triangulations of the atoms combine to a minimal (minimum) triangulation of the component.
+		Atoms that are cliques require no chord edges and are discarded.
+		'''
+		logging.info("TA.decompose_into_atoms")
+		atom_subgraphs = []
+		for C in self.component_subgraphs:
+			for atom in self.get_atoms(C):
+				if not C.is_clique(atom):
+					atom_subgraphs.append(C.subgraph(atom))
+		self.component_subgraphs = atom_subgraphs
+
+		logging.debug("Number of atoms of the reduced graph: "+str(len(self.component_subgraphs)))
+
+	def get_atoms(self, C):
+		'''
+		Implementation of the algorithm Atoms
+			Berry, Pogorelcnik, Simonet: An introduction to clique minimal separator decomposition
+			https://www.mdpi.com/1999-4893/3/2/197
+		that computes a minimal triangulation H of C with MCS-M, and then checks the minimal separators of H
+		in elimination order. Each minimal separator of H that is a clique in C is a clique minimal separator of C.
+
+		Args:
+			C : a graph in CompactGraph format
+
+		Returns:
+			atoms : a list of atoms of C, each given as a sorted list of nodes
+		'''
+		logging.info("TA.get_atoms")
+		# MCS_M is a subclass of this module, so it can only be imported here:
+		from TriangulationAlgorithms import MCS_M
+
+		mcsm = MCS_M.Algorithm_MCSM(C.to_networkx(), reduce_graph=False, timeout=self.timeout)
+		H = C.copy()
+		H.add_edges_from(mcsm.triangulate(C))
+		alpha = mcsm.component_alpha
+		generators = sorted(mcsm.separator_generators, key=lambda x: alpha[x])
+
+		atoms = []
+		removed = [False for v in C]
+		for x in generators:
+			if removed[x]:
+				continue
+			S = [y for y in H.neighbors(x) if alpha[y] > alpha[x]]
+			if C.is_clique(S):
+				# remove the component of C - S that contains x from the remaining graph:
+				blocked = [removed[v] for v in C]
+				for y in S:
+					blocked[y] = True
+				blocked[x] = True
+				component = [x]
+				i = 0
+				while i < len(component):
+					for w in C.neighbors(component[i]):
+						if not blocked[w]:
+							blocked[w] = True
+							component.append(w)
+					i += 1
+				for v in component:
+					removed[v] = True
+				atoms.append(sorted(component + S))
+		remaining = [v for v in C if not removed[v]]
+		if len(remaining) > 0:
+			atoms.append(remaining)
+		return atoms
+
 	def get_chordedge_candidates(self):
+		'''
+		Constructs the set of possible chord edges, i.e. all pairs of non-adjacent nodes within the same component
+		'''
 		logging.info("TA.get_chordedge_candidates")
-		if self.G_c == None:
-			self.get_relevant_components()
 
 		self.chordedge_candidates = []
-		for c in nx.connected_components(self.G_c):
-			c = list(c)
-			for i in range(len(c)):
-				for j in range(i+1, len(c)):
-					chord_edge = (c[i], c[j])
-					if chord_edge not in self.G.edges():
-						self.chordedge_candidates.append(chord_edge)
+		with measure_phase(self.phase_times, "chordedge_candidates"):
+			for C in self.component_subgraphs:
+				self.chordedge_candidates += C.get_labeled_edges(C.get_non_edges())
 		
 		logging.debug ("chordedge candidates: "+str(self.chordedge_candidates))
+		return self.chordedge_candidates
 
 	def draw_triangulation(self):
 		edges_original = self.G.edges()
@@ -127,10 +936,11 @@ class TriangulationAlgorithm:
 		#pos = nx.shell_layout(self.G)
 		pos = nx.kamada_kawai_layout(self.G)
 		
-		if not self.H == None:
-			nx.draw_networkx_nodes(self.H, pos, node_color='r', node_size=50)
-			nx.draw_networkx_edges(self.H, pos, edgelist=edges_original, width=1, edge_color='black')
-			nx.draw_networkx_edges(self.H, pos, edgelist=self.edges_of_triangulation, width=1, edge_color='blue')
+		H = self.get_triangulated()
+		if not H == None:
+			nx.draw_networkx_nodes(H, pos, node_color='r', node_size=50)
+			nx.draw_networkx_edges(H, pos, edgelist=edges_original, width=1, edge_color='black')
+			nx.draw_networkx_edges(H, pos, edgelist=self.edges_of_triangulation, width=1, edge_color='blue')
 		else:
 			nx.draw_networkx_nodes(self.G, pos, node_color='r', node_size=50)
 			nx.draw_networkx_edges(self.G, pos, edgelist=self.G.edges(), width=1, edge_color='black')
@@ -142,3 +952,101 @@ class TriangulationAlgorithm:
 		plt.axis('off')
 		plt.show()
 		
+
+@contextlib.contextmanager
+def measure_phase(phase_times, phase):
+	'''
+	Context manager that adds the wall time and the cpu time of the enclosed block to the entry of a phase
+
+	Args:
+		phase_times : a dict {phase: {"wall": float, "cpu": float, "calls": int}}
+		phase : the name of the phase
+	'''
+	wall_start = time.perf_counter()
+	cpu_start = time.process_time()
+	try:
+		yield
+	finally:
+		if phase not in phase_times:
+			phase_times[phase] = {"wall": 0.0, "cpu": 0.0, "calls": 0}
+		phase_times[phase]["wall"] += time.perf_counter() - wall_start
+		phase_times[phase]["cpu"] += time.process_time() - cpu_start
+		phase_times[phase]["calls"] += 1
+
+def get_triangulated_graph(G, edges):
+	'''
+	Constructs the graph G + edges as a new networkx graph
+	'''
+	H = G.copy()
+	H.add_edges_from(edges)
+	return H
+
+def triangulate_component(algorithm, C, randomized=False, seed=None):
+	'''
+	Triangulates a single component with the method triangulate of an algorithm,
+	used directly and by the worker processes of TriangulationAlgorithm.triangulate_components
+
+	Args:
+		algorithm : an instance of a subclass of TriangulationAlgorithm
+		C : a graph in CompactGraph format
+		randomized : if set to True, the algorithm is randomized
+		seed : if set, the random generator of the process is seeded with this value before the triangulation
+
+	Returns:
+		(F, component_alpha, component_time, component_counts, component_partial, component_ready) : the edges of the triangulation of C,
+			the elimination ordering of C, if one gets constructed, the wall time and cpu time (wall, cpu) of the triangulation,
+			the operation counts of the triangulation, if operations are counted,
+			True if the triangulation is only the best one found until the time limit (see anytime),
+			and the value of time.time() at which the triangulation was found, by default the end of the triangulation
+	'''
+	if not seed == None:
+		random.seed(seed)
+	# count the operations of this component separately, such that the counts of worker processes can be returned:
+	operation_counts = algorithm.operation_counts
+	if not operation_counts == None:
+		algorithm.operation_counts = {}
+	wall_start = time.perf_counter()
+	cpu_start = time.process_time()
+	algorithm.component_alpha = {}
+	algorithm.component_partial = False
+	algorithm.component_ready = None
+	try:
+		F = algorithm.triangulate(C, randomized)
+		component_time = (time.perf_counter() - wall_start, time.process_time() - cpu_start)
+		component_counts = algorithm.operation_counts
+	finally:
+		algorithm.operation_counts = operation_counts
+	component_ready = algorithm.component_ready
+	if component_ready == None:
+		component_ready = time.time()
+	return (F, algorithm.component_alpha, component_time, component_counts, algorithm.component_partial, component_ready)
+
+# the copy of the algorithm in a worker process of run_repetitions:
+REPETITION_ALGORITHM = None
+
+def init_repetition_worker(algorithm):
+	'''
+	Stores the copy of the algorithm in a worker process of TriangulationAlgorithm.run_repetitions,
+	such that it only gets sent once to each worker instead of once for each repetition
+	'''
+	global REPETITION_ALGORITHM
+	REPETITION_ALGORITHM = algorithm
+
+def run_repetition(seed):
+	'''
+	Runs the randomized algorithm of a worker process of TriangulationAlgorithm.run_repetitions once
+
+	Args:
+		seed : the seed of the random generator of the worker process for this repetition
+
+	Returns:
+		(F, alpha, seed, phase_times, component_times, operation_counts, partial) : the edges and the elimination ordering of the triangulation,
+			the seed, the running times and operation counts of this repetition, and True if the triangulation of a component is partial
+	'''
+	algorithm = REPETITION_ALGORITHM
+	algorithm.phase_times = {}
+	algorithm.component_times = [[0.0, 0.0] for C in algorithm.component_subgraphs]
+	if not algorithm.operation_counts == None:
+		algorithm.operation_counts = {}
+	algorithm.run_seeded(seed)
+	return (algorithm.edges_of_triangulation, algorithm.alpha, seed, algorithm.phase_times, algorithm.component_times, algorithm.operation_counts, algorithm.partial)
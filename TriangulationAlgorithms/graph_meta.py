@@ -4,6 +4,9 @@
 import logging
 
 import networkx as nx
+import random
+
+from TriangulationAlgorithms import Tracer
 
 class Cycle:
 	def __init__(self, cyclenodes):
@@ -37,6 +40,153 @@ class Cycle:
 		# we can simply use the hash-values to compare cycles
 		return hash(str(self.cyclenodes)) == hash(str(other.cyclenodes))
 
+class LabelPartition:
+	'''
+	Partition refinement of the unnumbered nodes of a graph into classes of nodes with equal lexicographic labels,
+	as used by LEX M. The classes are kept in a doubly linked list in increasing order of their labels,
+	and the nodes of each class are a contiguous block of the array order.
+	A node with the maximum label is found in O(1), and adding the current number to the labels of a set of nodes S
+	takes O(|S|), since this only moves the nodes of S into new classes directly above their old classes.
+
+	Args:
+		n : the number of nodes, the nodes are 0,...,n-1 and all start with the empty label
+
+	Attributes:
+		order : a list of the nodes, in which the nodes of each class are the block order[start[c]:end[c]]
+		position : a list that maps each node to its position in order
+		nodeclass : a list that maps each node to its class, numbered nodes keep their last class
+		start, end : lists that contain the block of each class
+		lower, upper : lists that contain the next smaller and the next larger class of each class, or None
+		top, bottom : the classes with the largest and the smallest label, or None if all nodes are numbered
+		free : a list of the classes that became empty, whose numbers are reused for new classes
+	'''
+	def __init__(self, n):
+		self.order = [v for v in range(n)]
+		self.position = [v for v in range(n)]
+		self.nodeclass = [0]*n
+		self.start = [0]
+		self.end = [n]
+		self.lower = [None]
+		self.upper = [None]
+		self.free = []
+		self.top = None
+		self.bottom = None
+		if n > 0:
+			self.top = 0
+			self.bottom = 0
+
+	def get_max_node(self, randomized=False):
+		'''
+		Returns an unnumbered node with the maximum label, if randomized is set to True, a random one of these nodes
+		'''
+		c = self.top
+		if randomized:
+			return self.order[random.randrange(self.start[c], self.end[c])]
+		return self.order[self.start[c]]
+
+	def remove(self, v):
+		'''
+		Removes a numbered node from its class
+		'''
+		c = self.nodeclass[v]
+		self.swap(self.position[v], self.end[c]-1)
+		self.end[c] -= 1
+		if self.start[c] == self.end[c]:
+			self.unlink(c)
+
+	def refine(self, S):
+		'''
+		Adds the current number to the labels of the nodes in S.
+		Since the current number is smaller than all numbers in the labels, the new label of a node in S is larger than
+		its old label, but smaller than all labels that were larger than its old label.
+		So the nodes of S in each class are moved to a new class directly above it.
+
+		Args:
+			S : a list of unnumbered nodes
+		'''
+		order = self.order
+		position = self.position
+		nodeclass = self.nodeclass
+		start = self.start
+		end = self.end
+		new_classes = {}
+		for u in S:
+			c = nodeclass[u]
+			if c in new_classes:
+				d = new_classes[c]
+			else:
+				d = self.add_class_above(c)
+				new_classes[c] = d
+			# the block of d grows to the front, into the block of c:
+			k = start[d] - 1
+			i = position[u]
+			w = order[k]
+			order[i] = w
+			position[w] = i
+			order[k] = u
+			position[u] = k
+			start[d] = k
+			end[c] = k
+			nodeclass[u] = d
+		for c in new_classes:
+			if self.start[c] == self.end[c]:
+				self.unlink(c)
+
+	def get_ranks(self):
+		'''
+		Numbers the classes by increasing label
+
+		Returns:
+			(ranks, num_classes) : a list that maps each class to its rank 0,...,num_classes-1, and the number of classes
+		'''
+		ranks = [0]*len(self.start)
+		num_classes = 0
+		c = self.bottom
+		while not c == None:
+			ranks[c] = num_classes
+			num_classes += 1
+			c = self.upper[c]
+		return (ranks, num_classes)
+
+	def swap(self, i, j):
+		u = self.order[i]
+		v = self.order[j]
+		self.order[i] = v
+		self.order[j] = u
+		self.position[v] = i
+		self.position[u] = j
+
+	def add_class_above(self, c):
+		if len(self.free) > 0:
+			d = self.free.pop()
+			self.start[d] = self.end[c]
+			self.end[d] = self.end[c]
+			self.lower[d] = c
+			self.upper[d] = self.upper[c]
+		else:
+			d = len(self.start)
+			self.start.append(self.end[c])
+			self.end.append(self.end[c])
+			self.lower.append(c)
+			self.upper.append(self.upper[c])
+		if self.upper[c] == None:
+			self.top = d
+		else:
+			self.lower[self.upper[c]] = d
+		self.upper[c] = d
+		return d
+
+	def unlink(self, c):
+		if self.lower[c] == None:
+			self.bottom = self.upper[c]
+		else:
+			self.upper[self.lower[c]] = self.upper[c]
+		if self.upper[c] == None:
+			self.top = self.lower[c]
+		else:
+			self.lower[self.upper[c]] = self.lower[c]
+		self.free.append(c)
+
 def get_post_order(T, root=None):
 	'''
 	Get the post-order of the nodes of a tree
@@ -118,43 +268,136 @@ def compute_perfect_elimination_ordering_planar(G):
 		i += 1
 	return perfect_elimination_ordering
 
-def LEX_BFS(G):
+def LEX_BFS(G, check_peo=False):
 	'''
 	LEXICOGRAPHIC BFS
 	If the input graph is chordal, this computes a perfect elimination ordering of G
+		Rose, Tarjan, Lueker: Algorithmic Aspects of Vertex Elimination on Graphs
+		https://epubs.siam.org/doi/abs/10.1137/0205021
+	The unvisited nodes are kept in a partition refinement (see LabelPartition), in which the visited node
+	moves its unvisited neighbors into new classes directly above their classes, so the running time is in O(n+m).
 
 	Args:
-		G : a graph in networkx format
+		G : a graph in networkx or CompactGraph format
+		check_peo : if set to True, it is also checked in O(n+m) whether the reverse of the order is a perfect elimination ordering,
+				which is the case iff G is chordal
 
 	Return:
 		lex_bfs_order : a dict mapping each node to its position defined by the LEX-BFS
+		is_peo : only if check_peo is True, True if the reverse of lex_bfs_order is a perfect elimination ordering of G
 	'''
 	
 	logging.info("=== LEX_BFS ===")
 	
-	# initialize sigma to contain single set containing all vertices of G:
-	sigma = [[n for n in G]]
-	# initialize output to be empty:
+	nodes = [v for v in G]
+	n = len(nodes)
+	index = {nodes[i] : i for i in range(n)}
+	adj = [[index[u] for u in G.neighbors(v)] for v in nodes]
+	labels = LabelPartition(n)
+	# the position of each node in the output, -1 for unvisited nodes:
+	position = [-1]*n
 	out = []
-	while len(sigma) > 0:
-		# chose a random node from the first set of sigma:
-		node_v = sigma[0].pop()
-		if len(sigma[0]) == 0:
-			sigma.pop()
+	for i in range(n):
+		node_v = labels.get_max_node()
+		labels.remove(node_v)
+		position[node_v] = i
 		out.append(node_v)
-		i = 0
-		while i < len(sigma):
-			# split each set in sigma into neighbors and non-neighbors of v:
-			S = sigma.pop(i)
-			S_adj = [n for n in S if n in G.neighbors(node_v)]
-			S_nonadj = [n for n in S if n not in S_adj]
-			if len(S_adj) > 0:
-				sigma.insert(i, S_adj)
-				i += 1
-			if len(S_nonadj) > 0:
-				sigma.insert(i, S_nonadj)
-				i += 1
-	return {out[i]: i for i in range(len(out))}
+		labels.refine([node_u for node_u in adj[node_v] if position[node_u] < 0])
+	lex_bfs_order = {nodes[out[i]] : i for i in range(n)}
+	if not check_peo:
+		return lex_bfs_order
+	return (lex_bfs_order, is_reverse_perfect_elimination_ordering(adj, position))
+
+def is_reverse_perfect_elimination_ordering(adj, position):
+	'''
+	Checks if the reverse of an order of the nodes is a perfect elimination ordering, in O(n+m):
+	for each node v, its neighbors that come earlier in the order have to be adjacent to the latest of them, its parent.
+	These tests are collected for each parent, such that the neighborhood of each parent is only marked once.
+		Tarjan, Yannakakis: Simple linear-time algorithms to test chordality of graphs
+		https://epubs.siam.org/doi/10.1137/0213035
+
+	Args:
+		adj : a list that contains the list of neighbors of each node 0,...,n-1
+		position : a list that maps each node to its position in the order
+
+	Return:
+		True, if the reverse of the order is a perfect elimination ordering, otherwise False
+	'''
+	n = len(adj)
+	# the earlier neighbors of the children of each node that have to be adjacent to it:
+	required = [[] for v in range(n)]
+	for node_v in range(n):
+		parent = None
+		for node_u in adj[node_v]:
+			if position[node_u] < position[node_v] and (parent == None or position[node_u] > position[parent]):
+				parent = node_u
+		if not parent == None:
+			for node_u in adj[node_v]:
+				if position[node_u] < position[parent]:
+					required[parent].append(node_u)
+	adjacent = [False]*n
+	for node_p in range(n):
+		if len(required[node_p]) == 0:
+			continue
+		for node_u in adj[node_p]:
+			adjacent[node_u] = True
+		if not all([adjacent[node_u] for node_u in required[node_p]]):
+			return False
+		for node_u in adj[node_p]:
+			adjacent[node_u] = False
+	return True
+
+def get_clique_tree(adj, ordering):
+	'''
+	Computes the maximal cliques and a clique tree of a chordal graph from a perfect elimination ordering in O(n+m).
+	Each maximal clique is the set of a node v and its neighbors that are eliminated later, where no child u of v
+	(i.e. v is the first later neighbor of u) has one more later neighbor than v.
+	The clique of a node that is no maximal clique is contained in the clique of such a child.
+	The parent of a clique is the clique that contains the first later neighbor of the last node of the clique,
+	and the separator between them is the set of later neighbors of this node.
+		Blair, Peyton: An introduction to chordal graphs and clique trees
+		https://link.springer.com/chapter/10.1007/978-1-4613-8369-7_1
+
+	Args:
+		adj : a list that contains the list of neighbors of each node 0,...,n-1 of a chordal graph
+		ordering : a list of all nodes in elimination order, which has to be a perfect elimination ordering
+
+	Returns:
+		(cliques, parent, separators) : a list of all maximal cliques, each as a list of nodes,
+			a list with the index of the parent of each clique in the clique tree, or None for the root of each connected component,
+			and a list with the separator of each clique and its parent, or None for the roots
+	'''
+	n = len(adj)
+	position = [0]*n
+	for i in range(len(ordering)):
+		position[ordering[i]] = i
+	later_neighbors = [[u for u in adj[v] if position[u] > position[v]] for v in range(n)]
+	# the first later neighbor of each node, and a child of each node whose clique contains the clique of the node:
+	first_later_neighbor = [None]*n
+	absorbing_child = [None]*n
+	for u in ordering:
+		if len(later_neighbors[u]) > 0:
+			p = min(later_neighbors[u], key=lambda x: position[x])
+			first_later_neighbor[u] = p
+			if absorbing_child[p] == None and len(later_neighbors[u]) == len(later_neighbors[p]) + 1:
+				absorbing_child[p] = u
+	cliques = []
+	# the clique that contains the clique of each node:
+	clique_of = [None]*n
+	for v in ordering:
+		if absorbing_child[v] == None:
+			clique_of[v] = len(cliques)
+			cliques.append([v] + later_neighbors[v])
+		else:
+			clique_of[v] = clique_of[absorbing_child[v]]
+	parent = [None]*len(cliques)
+	separators = [None]*len(cliques)
+	for v in ordering:
+		p = first_later_neighbor[v]
+		if not p == None and not clique_of[p] == clique_of[v]:
+			parent[clique_of[v]] = clique_of[p]
+			separators[clique_of[v]] = later_neighbors[v]
+	return (cliques, parent, separators)
 
 def get_all_cycles(G, min_cycle_length=4, only_chordless_cycles=True):
 	'''
@@ -189,9 +432,9 @@ def get_all_cycles_single_startnode(G, startnode, min_cycle_length=4, only_chord
 		returns the number of added cycles
 	'''
 	logging.info("=== MT_MinimumTriangulation.get_all_cycles_single_startnode ===")
-	logging.debug("Considering start node "+str(startnode))
-
-	logging.debug("Graph "+str(G.edges()))
+	tracer = Tracer.TRACER
+	if not tracer == None:
+		tracer.event("start", algorithm="get_all_cycles_single_startnode", startnode=startnode)
 
 	cycles = []
 	visited = {n : 0 for n in G}
@@ -202,9 +445,7 @@ def get_all_cycles_single_startnode(G, startnode, min_cycle_length=4, only_chord
 	current_dfs_node = startnode		
 	number_of_added_cycles = 0
 	while not current_dfs_node == None:
-		logging.debug("Current node: "+str(current_dfs_node))
 		visited_neighbors = [n for n in G.neighbors(current_dfs_node) if visited[n] == 1]
-		logging.debug("visited neighbors: "+str(visited_neighbors))
 		for node in visited_neighbors:
 			# add new cycle
 			cycle = []
@@ -214,26 +455,21 @@ def get_all_cycles_single_startnode(G, startnode, min_cycle_length=4, only_chord
 				current_cycle_node = predecessors[current_cycle_node]
 			cycle.append(current_cycle_node)
 			if len(cycle) >= min_cycle_length:
-				logging.debug("Found a cycle of length > 3")
-				logging.debug(str(cycle))
 				add_this_cycle = True
 				if only_chordless_cycles:
 					subgraph = G.subgraph(cycle)
 					if len(subgraph.edges()) > len(cycle):
 						add_this_cycle = False
-						logging.debug("Cycle contains a chord!")
+				is_new = False
 				if add_this_cycle:
 					new_cycle = Cycle(cycle)
-					logging.debug("Cycle: "+str(new_cycle))
 					if new_cycle not in cycles:
-						logging.debug("Cycle is new!")
+						is_new = True
 						cycles.append(new_cycle)
 						number_of_added_cycles += 1
-					else:
-						logging.debug("Cycle already exists!")
+				if not tracer == None:
+					tracer.event("cycle", cycle=cycle, accepted=add_this_cycle, new=is_new)
 		unvisited_neighbors = [n for n in G.neighbors(current_dfs_node) if (visited[n] == 0) or (visited[n] == 2 and not n in successors[current_dfs_node])]
-		logging.debug("unvisited neighbors: " +str(unvisited_neighbors))
-		logging.debug("visited successor: "+str([n for n in G.neighbors(current_dfs_node) if visited[n] == 2 and n in successors[current_dfs_node]]))
 		if len(unvisited_neighbors) > 0:
 			visited[current_dfs_node] = 1
 			neighbor = unvisited_neighbors[0]
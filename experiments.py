@@ -31,6 +31,14 @@ from TriangulationAlgorithms import CMT
 ALGORITHMS = {
 	"EG"		: EG.triangulate_EG,
 	"EG_R"		: EG.triangulate_EG,
+	"EGMD"		: EG.triangulate_EGMD,
+	"EGMD_R"	: EG.triangulate_EGMD,
+	"EGMF"		: EG.triangulate_EGMF,
+	"EGMF_R"	: EG.triangulate_EGMF,
+	"EGAMD"		: EG.triangulate_EGAMD,
+	"EGAMD_R"	: EG.triangulate_EGAMD,
+	"EGND"		: EG.triangulate_EGND,
+	"EGND_R"	: EG.triangulate_EGND,
 	"LEXM"		: LEX_M.triangulate_LexM,
 	"LEXM_R"	: LEX_M.triangulate_LexM,
 	"MCSM"		: MCS_M.triangulate_MCSM,
@@ -72,7 +80,7 @@ def fix_filenames(datadir):
 		os.rename(datadir+"/"+filename, datadir+"/"+new_filename)
 
 def run_eval_all(forcenew=False):
-	algo_codes = ["EG", "EG_R", "LEXM", "MCSM", "SMS", "SMS_R", "CMT", "CMT_R", "EGP", "EGP_R", "MT"]
+	algo_codes = ["EG", "EG_R", "EGMD", "EGMF", "EGAMD", "EGND", "LEXM", "MCSM", "SMS", "SMS_R", "CMT", "CMT_R", "EGP", "EGP_R", "MT"]
 
 	threads = []
 
@@ -7,11 +7,18 @@ TESTS
 
 import logging
 import sys
+import os
+import random
+import time
+import shutil
+import tempfile
 
 import networkx as nx
 
 from Evaluation import GraphConstructionAlgorithms as gca
 from Evaluation import GraphDataOrganizer as gdo
+from Evaluation import ExperimentManager as em
+from Evaluation import StatisticsManager as sm
 
 from TriangulationAlgorithms import EG
 from TriangulationAlgorithms import SMS
@@ -19,6 +26,11 @@ from TriangulationAlgorithms import LEX_M
 from TriangulationAlgorithms import MCS_M
 from TriangulationAlgorithms import CMT
 from TriangulationAlgorithms import MT
+from TriangulationAlgorithms import CompactGraph
+from TriangulationAlgorithms import graph_meta
+from TriangulationAlgorithms import LowerBounds
+from TriangulationAlgorithms import TriangulationAlgorithm
+from TriangulationAlgorithms import Tracer
 
 log_format = ('[%(asctime)s] %(levelname)-8s %(name)-12s %(message)s')
 logging.basicConfig(
@@ -44,7 +56,10 @@ for arg in sys.argv[1:]:
 logging.info("Initialization")
 print("Initialization")
 
-TEST_FILEPATH = "test/testgraph.json"
+# files written by the tests are kept in a temporary directory that is removed at the end:
+TEST_DIRECTORY = tempfile.mkdtemp(prefix="triangulation_tests_")
+TEST_FILEPATH = os.path.join(TEST_DIRECTORY, "testgraph.json")
+TEST_TRACEPATH = os.path.join(TEST_DIRECTORY, "trace.jsonl")
 
 # simple graph for testing triangulation algorithms:
 GRAPH_TEST_EDGES = [(0,1), (1,2), (2,3),(3,0)]
@@ -154,6 +169,334 @@ if DO_TEST_GGEN:
 if DO_TEST_ALGO:
 	logging.info("======= TEST TRIANGULATION ALGORITHMS =======")
 	print("TEST TRIANGULATION ALGORITHMS")
+	# ===== Compact graph representation =====
+	logging.info("===== TEST COMPACT GRAPH =====")
+	print("TEST COMPACT GRAPH")
+	compact_graph = CompactGraph.CompactGraph(GRAPH_TEST)
+	compact_edges = compact_graph.get_labeled_edges(compact_graph.edges())
+	logging.debug("Edges of compact graph: "+str(compact_edges))
+	compact_graph_chordal = compact_graph.copy()
+	compact_graph_chordal.add_edge(0, 2)
+	if len(compact_edges) == len(GRAPH_TEST.edges()) and all([GRAPH_TEST.has_edge(u, v) for (u, v) in compact_edges]) and not compact_graph.is_chordal() and compact_graph_chordal.is_chordal():
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Block decomposition =====
+	logging.info("===== TEST BLOCK DECOMPOSITION =====")
+	print("TEST BLOCK DECOMPOSITION")
+	# two cycles of length 4 that share a single node, and a path to a triangle:
+	graph_blocks = GRAPH_TEST.copy()
+	graph_blocks.add_edges_from([(3,4), (4,5), (5,6), (6,3), (6,7), (7,8), (8,9), (9,10), (10,8)])
+	algo_blocks = EG.Algorithm_EliminationGame(graph_blocks)
+	block_nodes = [sorted(C.labels) for C in algo_blocks.component_subgraphs]
+	logging.debug("Blocks: "+str(block_nodes))
+	# the blocks of a component stay together, as in the components of the nodes of a cycle basis:
+	graph_random_blocks = nx.gnp_random_graph(60, 0.04, seed=2)
+	cycle_nodes = set([v for c in nx.cycle_basis(graph_random_blocks) for v in c])
+	components_cycle_basis = [sorted(c) for c in nx.connected_components(graph_random_blocks.subgraph(cycle_nodes))]
+	components_blocks = [sorted(C.labels) for C in EG.Algorithm_EliminationGame(graph_random_blocks).component_subgraphs]
+	if block_nodes == [[0,1,2,3,4,5,6], [8,9,10]] and components_blocks == components_cycle_basis and len(components_blocks) > 1:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Atom decomposition =====
+	logging.info("===== TEST ATOM DECOMPOSITION =====")
+	print("TEST ATOM DECOMPOSITION")
+	# two cycles of length 4 that share the edge (2,3):
+	graph_atoms = GRAPH_TEST.copy()
+	graph_atoms.add_edges_from([(2,4), (4,5), (5,3)])
+	algo_atoms = EG.Algorithm_EliminationGame(graph_atoms, decompose_atoms=True)
+	atom_nodes = sorted([sorted(C.labels) for C in algo_atoms.component_subgraphs])
+	logging.debug("Atoms: "+str(atom_nodes))
+	if atom_nodes == [[0,1,2,3], [2,3,4,5]]:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Reduction rules =====
+	logging.info("===== TEST REDUCTION RULES =====")
+	print("TEST REDUCTION RULES")
+	# node 4 is simplicial, node 5 is a twin of node 2:
+	graph_reduction = GRAPH_TEST.copy()
+	graph_reduction.add_edges_from([(4,0), (4,1), (5,1), (5,2), (5,3)])
+	algo_reduction = LEX_M.Algorithm_LexM(graph_reduction, reduction_rules=["simplicial", "twin"])
+	algo_reduction.run()
+	logging.debug("Nodes removed by reduction rules: "+str(algo_reduction.get_reduction_counts()))
+	# the clique {1,2,7,8} at the cut vertex 1 contains the twins 2, 7 and 8, the chord edge of the cycle {0,1,3,4} must not be copied to them:
+	graph_twin = nx.Graph([(0,1), (0,3), (0,6), (1,2), (1,4), (1,5), (1,7), (1,8), (2,7), (2,8), (3,4), (7,8)])
+	triangulation_twin = MCS_M.triangulate_MCSM(graph_twin, reduction_rules=["twin"])
+	reduction_ok = nx.is_chordal(triangulation_twin["H"]) and triangulation_twin["size"] == 1
+	# the counts of the reduction rules are reported by the result and its profile:
+	reduction_ok = reduction_ok and triangulation_twin["reduction_counts"] == {"twin": 2} and triangulation_twin["profile"]["reduction_counts"] == {"twin": 2}
+	reduction_ok = reduction_ok and "reduction_counts" not in MCS_M.triangulate_MCSM(graph_twin)
+	# a triangulation is minimal iff each chord edge is the only chord of a cycle of length 4:
+	for (graph_reduced, triangulation_reduced) in [(graph_reduction, algo_reduction.get_triangulated()), (graph_twin, triangulation_twin["H"])]:
+		for (u, v) in [e for e in triangulation_reduced.edges() if not graph_reduced.has_edge(*e)]:
+			common_neighbors = set(triangulation_reduced[u]) & set(triangulation_reduced[v])
+			if all([triangulation_reduced.has_edge(x, y) for x in common_neighbors for y in common_neighbors if not x == y]):
+				reduction_ok = False
+	if algo_reduction.get_reduction_counts() == {"simplicial": 1, "twin": 1} and nx.is_chordal(algo_reduction.get_triangulated()) and reduction_ok:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Parallel components =====
+	logging.info("===== TEST PARALLEL COMPONENTS =====")
+	print("TEST PARALLEL COMPONENTS")
+	# three copies of the test graph, connected by bridges:
+	graph_parallel = nx.disjoint_union_all([GRAPH_TEST.copy() for i in range(3)])
+	graph_parallel.add_edges_from([(0, len(GRAPH_TEST)), (len(GRAPH_TEST), 2*len(GRAPH_TEST))])
+	algo_serial = LEX_M.Algorithm_LexM(graph_parallel)
+	algo_serial.run()
+	algo_parallel = LEX_M.Algorithm_LexM(graph_parallel, num_workers=2)
+	algo_parallel.run()
+	if algo_serial.get_triangulation_edges() == algo_parallel.get_triangulation_edges() and algo_serial.get_alpha() == algo_parallel.get_alpha():
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	logging.info("===== TEST PARALLEL REPETITIONS =====")
+	print("TEST PARALLEL REPETITIONS")
+	triangulation_repetitions = MCS_M.triangulate_MCSM(graph_parallel, randomized=True, repetitions=4, num_workers=2)
+	logging.debug("Sizes of parallel repetitions: mean "+str(triangulation_repetitions["mean"])+", variance "+str(triangulation_repetitions["variance"]))
+	profile_repetitions = triangulation_repetitions["profile"]
+	if triangulation_repetitions["size"] == 3 and triangulation_repetitions["mean"] == 3 and profile_repetitions["runs"] == 4 and profile_repetitions["phases"]["triangulate"]["calls"] == 4 and nx.is_chordal(triangulation_repetitions["H"]):
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Seeded repetitions =====
+	logging.info("===== TEST SEEDED REPETITIONS =====")
+	print("TEST SEEDED REPETITIONS")
+	graph_seeded = nx.gnp_random_graph(30, 0.2, seed=1)
+	random.seed(3)
+	triangulation_seeded = LEX_M.triangulate_LexM(graph_seeded, randomized=True, repetitions=4)
+	random.seed(3)
+	triangulation_seeded_parallel = LEX_M.triangulate_LexM(graph_seeded, randomized=True, repetitions=4, num_workers=2)
+	# the best repetition is replayed from its seed alone:
+	triangulation_replayed = LEX_M.triangulate_LexM(graph_seeded, randomized=True, seed=triangulation_seeded["seed"])
+	# a single repetition with parallel components is replayed with and without workers:
+	graph_seeded_components = nx.disjoint_union(nx.gnp_random_graph(20, 0.3, seed=1), nx.gnp_random_graph(20, 0.3, seed=2))
+	triangulation_components = LEX_M.triangulate_LexM(graph_seeded_components, randomized=True, num_workers=2)
+	triangulation_components_replayed = LEX_M.triangulate_LexM(graph_seeded_components, randomized=True, seed=triangulation_components["seed"], num_workers=2)
+	triangulation_components_serial = LEX_M.triangulate_LexM(graph_seeded_components, randomized=True, seed=triangulation_components["seed"])
+	replayed_components = all([triangulation["edges"] == triangulation_components["edges"] and triangulation["alpha"] == triangulation_components["alpha"] for triangulation in [triangulation_components_replayed, triangulation_components_serial]])
+	if triangulation_seeded["edges"] == triangulation_seeded_parallel["edges"] and triangulation_seeded["seed"] == triangulation_seeded_parallel["seed"] and triangulation_replayed["edges"] == triangulation_seeded["edges"] and triangulation_replayed["alpha"] == triangulation_seeded["alpha"] and replayed_components:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	logging.info("===== TEST REPLAY OF STORED EXPERIMENTS =====")
+	print("TEST REPLAY OF STORED EXPERIMENTS")
+	# the experiment is stored and loaded like the results of experiments.py, the algorithm is then given by its name:
+	gdo.write_graphs_to_json([graph_seeded], os.path.join(TEST_DIRECTORY, "input", "replay.json"))
+	graphdata_replay = gdo.load_graphs_from_json(os.path.join(TEST_DIRECTORY, "input", "replay.json"))[0]
+	evaldata_replay = em.run_single_experiment(em.EvalData(LEX_M.triangulate_LexM, graphdata_replay, True, 4, True, -1))
+	evaldata_deterministic = em.run_single_experiment(em.EvalData(LEX_M.triangulate_LexM, graphdata_replay, False, 1, True, -1))
+	em.store_results_json([evaldata_replay, evaldata_deterministic], os.path.join(TEST_DIRECTORY, "results", "replay"))
+	[evaldata_loaded, evaldata_deterministic_loaded] = sm.load_evaldata_from_json(TEST_DIRECTORY, "replay")
+	triangulation_stored = em.replay_single_experiment(evaldata_loaded)
+	try:
+		em.replay_single_experiment(evaldata_deterministic_loaded)
+		replay_refused = False
+	except gdo.ParameterMissingException:
+		replay_refused = True
+	if evaldata_loaded.algo == "triangulate_LexM" and triangulation_stored["size"] == evaldata_replay.output and triangulation_stored["seed"] == evaldata_replay.seed and replay_refused:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Adaptive repetitions =====
+	logging.info("===== TEST ADAPTIVE REPETITIONS =====")
+	print("TEST ADAPTIVE REPETITIONS")
+	# each copy of the test graph needs one fill edge, so the first repetition already reaches the lower bound:
+	triangulation_bound = MCS_M.triangulate_MCSM(graph_parallel, randomized=True, repetitions=10, patience=2)
+	# two chordless 6-cycles with a common edge: every minimal triangulation has 6 fill edges, but the lower bound is 3:
+	graph_patience = nx.cycle_graph(10)
+	graph_patience.add_edge(0, 5)
+	triangulation_patience = LEX_M.triangulate_LexM(graph_patience, randomized=True, repetitions=10, patience=2)
+	triangulation_patience_parallel = LEX_M.triangulate_LexM(graph_patience, randomized=True, repetitions=10, patience=2, num_workers=2)
+	triangulation_budget = LEX_M.triangulate_LexM(graph_patience, randomized=True, time_budget=0.1)
+	logging.debug("Repetitions with time budget: "+str(triangulation_budget["repetitions"]))
+	if triangulation_bound["repetitions"] == 1 and triangulation_bound["size"] == 3 and triangulation_patience["repetitions"] == 3 and triangulation_patience_parallel["repetitions"] < 10 and triangulation_budget["size"] == 6:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Anytime results =====
+	logging.info("===== TEST ANYTIME RESULTS =====")
+	print("TEST ANYTIME RESULTS")
+	# the time limit is already exceeded, such that MT can only return the minimal triangulation of LEX M within the grace period:
+	triangulation_anytime = MT.triangulate_MT(graph_patience, timeout=time.time()-1, anytime=True, anytime_grace=10.0)
+	anytime_ok = triangulation_anytime["partial"] and triangulation_anytime["size"] == 6 and nx.is_chordal(triangulation_anytime["H"])
+	try:
+		MT.triangulate_MT(graph_patience, timeout=time.time()-1)
+		anytime_ok = False
+	except TriangulationAlgorithm.TimeLimitExceededException:
+		pass
+	# LEX M may only exceed the time limit by the grace period:
+	try:
+		MT.triangulate_MT(graph_patience, timeout=time.time()-2, anytime=True, anytime_grace=1.0)
+		anytime_ok = False
+	except TriangulationAlgorithm.TimeLimitExceededException:
+		pass
+	# the time to the partial result is the time until LEX M is finished, not the time until the search is stopped:
+	graph_search = nx.gnp_random_graph(16, 0.3, seed=4)
+	triangulation_search = MT.triangulate_MT(graph_search, timeout=time.time()+0.5, anytime=True)
+	logging.debug("Time to the partial result of MT: "+str(triangulation_search["time_to_best"]))
+	anytime_ok = anytime_ok and triangulation_search["partial"] and triangulation_search["time_to_best"] < 0.25
+	if anytime_ok and not triangulation_repetitions["partial"]:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Verification =====
+	logging.info("===== TEST VERIFICATION =====")
+	print("TEST VERIFICATION")
+	algo_verification = LEX_M.Algorithm_LexM(GRAPH_TEST.copy(), reduce_graph=False)
+	algo_verification.run()
+	verification_ok = True
+	try:
+		# the test graph itself is not chordal:
+		algo_verification.verify_component(algo_verification.CG, [])
+		verification_ok = False
+	except TriangulationAlgorithm.TriangulationNotSuccessfulException:
+		pass
+	algo_verification.verification = "lexbfs"
+	algo_verification.verify_component(algo_verification.CG, [(1, 3)])
+	try:
+		algo_verification.verify_component(algo_verification.CG, [])
+		verification_ok = False
+	except TriangulationAlgorithm.TriangulationNotSuccessfulException:
+		pass
+	algo_verification.verification = "none"
+	algo_verification.verify_component(algo_verification.CG, [])
+	# the reverse of a LEX BFS ordering is a perfect elimination ordering iff the graph is chordal:
+	(lex_bfs_order, lex_bfs_peo) = graph_meta.LEX_BFS(GRAPH_TEST, check_peo=True)
+	(lex_bfs_order_chordal, lex_bfs_peo_chordal) = graph_meta.LEX_BFS(nx.complete_graph(4), check_peo=True)
+	if not sorted(lex_bfs_order.values()) == [0, 1, 2, 3] or lex_bfs_peo or not lex_bfs_peo_chordal:
+		verification_ok = False
+	if verification_ok:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Triangulation result =====
+	logging.info("===== TEST TRIANGULATION RESULT =====")
+	print("TEST TRIANGULATION RESULT")
+	result_lexm = LEX_M.triangulate_LexM(GRAPH_TEST.copy())
+	# the triangulated graph is only constructed on request:
+	result_lazy = result_lexm.H == None
+	H_result = result_lexm["H"]
+	if result_lazy and result_lexm["size"] == 1 and "alpha" in result_lexm and nx.is_chordal(H_result) and len(H_result.edges()) == len(GRAPH_TEST.edges()) + 1:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Clique tree =====
+	logging.info("===== TEST CLIQUE TREE =====")
+	print("TEST CLIQUE TREE")
+	# the triangulated 4-cycle consists of two triangles that are separated by the chord:
+	result_cliques = LEX_M.triangulate_LexM(GRAPH_TEST.copy(), clique_tree=True)
+	chord = set(result_cliques["edges"][0])
+	cliques_ok = len(result_cliques["cliques"]) == 2 and result_cliques["clique_parent"].count(None) == 1
+	cliques_ok = cliques_ok and [set(separator) for separator in result_cliques["separators"] if not separator == None] == [chord]
+	# with a bridge, the graph is reduced and the clique tree is computed from the whole triangulated graph:
+	graph_cliques = graph_patience.copy()
+	graph_cliques.add_edge(0, 10)
+	result_cliques_reduced = MCS_M.triangulate_MCSM(graph_cliques, clique_tree=True)
+	H_cliques = result_cliques_reduced["H"]
+	cliques_ok = cliques_ok and sorted([sorted(clique) for clique in result_cliques_reduced["cliques"]]) == sorted([sorted(clique) for clique in nx.find_cliques(H_cliques)])
+	for i in range(len(result_cliques_reduced["cliques"])):
+		j = result_cliques_reduced["clique_parent"][i]
+		if not j == None and not set(result_cliques_reduced["separators"][i]) == set(result_cliques_reduced["cliques"][i]) & set(result_cliques_reduced["cliques"][j]):
+			cliques_ok = False
+	if cliques_ok and result_cliques_reduced["clique_parent"].count(None) == 1 and "cliques" not in result_lexm:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Profile =====
+	logging.info("===== TEST PROFILE =====")
+	print("TEST PROFILE")
+	profile = result_lexm["profile"]
+	logging.debug("Profile of Lex M: "+str(profile))
+	if all([phase in profile["phases"] for phase in ["reduction", "triangulate", "verification", "H_construction"]]) and profile["component_sizes"] == [4]:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Operation counts =====
+	logging.info("===== TEST OPERATION COUNTS =====")
+	print("TEST OPERATION COUNTS")
+	result_counted = MCS_M.triangulate_MCSM(GRAPH_TEST.copy(), count_operations=True)
+	logging.debug("Operation counts of MCS M: "+str(result_counted["operation_counts"]))
+	if result_counted["operation_counts"].get("reachability_sweep", 0) == len(GRAPH_TEST) and "operation_counts" not in result_lexm:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Tracing =====
+	logging.info("===== TEST TRACING =====")
+	print("TEST TRACING")
+	Tracer.enable_tracing(TEST_TRACEPATH)
+	LEX_M.triangulate_LexM(GRAPH_TEST.copy())
+	Tracer.disable_tracing()
+	trace_events = [e["event"] for e in Tracer.read_trace(TEST_TRACEPATH)]
+	logging.debug("Number of traced events: "+str(len(trace_events)))
+	# the events name the nodes by their labels, such that the components of a reduced graph can be told apart:
+	graph_traced = nx.relabel_nodes(nx.disjoint_union(nx.cycle_graph(5), nx.cycle_graph(5)), lambda v: "n"+str(v))
+	Tracer.enable_tracing(TEST_TRACEPATH)
+	triangulation_traced = LEX_M.triangulate_LexM(graph_traced)
+	Tracer.disable_tracing()
+	traced_fill = [frozenset(e["edge"]) for e in Tracer.read_trace(TEST_TRACEPATH) if e["event"] == "fill"]
+	traced_labels = sorted([e["node"] for e in Tracer.read_trace(TEST_TRACEPATH) if e["event"] == "number"])
+	labels_traced = len(traced_fill) == len(set(traced_fill)) and set(traced_fill) == set([frozenset(e) for e in triangulation_traced["edges"]]) and traced_labels == sorted(graph_traced.nodes())
+	# both backends of elimination game write the same events:
+	traces_eg = []
+	for dense_backend in [False, True]:
+		Tracer.enable_tracing(TEST_TRACEPATH)
+		EG.triangulate_EG(graph_traced, reduce_graph=False, dense_backend=dense_backend)
+		Tracer.disable_tracing()
+		traces_eg.append([(e["event"], e.get("node"), None if not "edge" in e else frozenset(e["edge"])) for e in Tracer.read_trace(TEST_TRACEPATH)])
+	if trace_events.count("number") == len(GRAPH_TEST) and trace_events.count("fill") == 1 and Tracer.TRACER == None and labels_traced and sorted(traces_eg[0], key=str) == sorted(traces_eg[1], key=str):
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	# ===== Fill computation =====
+	logging.info("===== TEST FILL COMPUTATION =====")
+	print("TEST FILL COMPUTATION")
+	graph_fill = nx.convert_node_labels_to_integers(nx.grid_2d_graph(3, 3))
+	compact_fill = CompactGraph.CompactGraph(graph_fill)
+	algo_fill = EG.Algorithm_EliminationGame(graph_fill, reduce_graph=False)
+	fill_alpha = {v : v for v in compact_fill}
+	fill_grid = algo_fill.triangulate(compact_fill, alpha=fill_alpha)
+	fill_cycle = algo_fill.triangulate(CompactGraph.CompactGraph(GRAPH_TEST), alpha={0:0, 1:1, 2:2, 3:3})
+	compact_fill.add_edges_from(fill_grid)
+	logging.debug("Fill edges of the grid: "+str(fill_grid))
+	if fill_cycle == [(1,3)] and compact_fill.is_perfect_elimination_ordering([v for v in range(len(compact_fill))]):
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	logging.info("===== TEST DENSE BACKEND =====")
+	print("TEST DENSE BACKEND")
+	# the dense backend has to compute the same triangulations and orderings as the sparse representation:
+	graph_dense = nx.gnp_random_graph(30, 0.5, seed=3)
+	dense_ok = True
+	for triangulate_dense in [EG.triangulate_EG, LEX_M.triangulate_LexM, MCS_M.triangulate_MCSM]:
+		triangulation_sparse = triangulate_dense(graph_dense, reduce_graph=False, dense_backend=False)
+		triangulation_dense = triangulate_dense(graph_dense, reduce_graph=False, dense_backend=True)
+		if not triangulation_sparse["edges"] == triangulation_dense["edges"] or not triangulation_sparse.get("alpha") == triangulation_dense.get("alpha"):
+			dense_ok = False
+	if dense_ok:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
 	# ===== Elimination Game =====
 	logging.info("===== TEST ELIMINATION GAME =====")
 	print("TEST ELIMINATION GAME")
@@ -166,7 +509,49 @@ if DO_TEST_ALGO:
 	triangulation_eg_r = EG.triangulate_EG(GRAPH_TEST.copy(), randomized=True)
 	logging.debug("Size of triangulation by randomized elimination game: "+str(triangulation_eg_r["size"]))
 	print("ok")
-	
+
+	logging.info("===== TEST ELIMINATION ORDERINGS =====")
+	print("TEST ELIMINATION ORDERINGS")
+	# eliminating the center of a star first fills the whole graph, the heuristics eliminate the leaves first:
+	graph_star = nx.star_graph(6)
+	graph_grid = nx.convert_node_labels_to_integers(nx.grid_2d_graph(6, 6))
+	size_grid = EG.triangulate_EG(graph_grid, reduce_graph=False)["size"]
+	orderings_ok = True
+	for triangulate_ordered in [EG.triangulate_EGMD, EG.triangulate_EGMF, EG.triangulate_EGAMD]:
+		for randomized in [False, True]:
+			triangulation_star = triangulate_ordered(graph_star, randomized=randomized, reduce_graph=False)
+			triangulation_grid = triangulate_ordered(graph_grid, randomized=randomized, reduce_graph=False)
+			logging.debug("Size of triangulation of the grid by "+triangulate_ordered.__name__+": "+str(triangulation_grid["size"]))
+			if not triangulation_star["size"] == 0 or not nx.is_chordal(triangulation_grid["H"]) or triangulation_grid["size"] > size_grid:
+				orderings_ok = False
+	if orderings_ok:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	logging.info("===== TEST NESTED DISSECTION =====")
+	print("TEST NESTED DISSECTION")
+	graph_mesh = nx.convert_node_labels_to_integers(nx.grid_2d_graph(12, 12))
+	algo_nd = EG.Algorithm_EliminationGame(graph_mesh, reduce_graph=False, ordering="nested_dissection")
+	# the first separator of the level structure splits the mesh into two parts:
+	(nd_parts, nd_separator) = algo_nd.get_level_separator(algo_nd.CG)
+	compact_nd = algo_nd.CG.copy()
+	compact_nd.remove_edges_from([(u, v) for u in nd_separator for v in compact_nd.neighbors(u)])
+	separated = len(nd_parts) == 2 and not any([compact_nd.has_path(u, v) for u in nd_parts[0] for v in nd_parts[1][:1]])
+	triangulation_nd = EG.triangulate_EGND(graph_mesh, reduce_graph=False)
+	triangulation_nd_parallel = EG.triangulate_EGND(graph_mesh, reduce_graph=False, num_workers=2)
+	logging.debug("Size of triangulation of the mesh by nested dissection: "+str(triangulation_nd["size"]))
+	# the randomized ordering only depends on the random state, not on the number of workers:
+	algo_nd_parallel = EG.Algorithm_EliminationGame(graph_mesh, reduce_graph=False, ordering="nested_dissection", num_workers=2)
+	random.seed(3)
+	ordering_nd = algo_nd.get_nested_dissection_ordering(algo_nd.CG, randomized=True)
+	random.seed(3)
+	ordering_nd_parallel = algo_nd_parallel.get_nested_dissection_ordering(algo_nd_parallel.CG, randomized=True)
+	if separated and nx.is_chordal(triangulation_nd["H"]) and triangulation_nd["size"] == triangulation_nd_parallel["size"] and ordering_nd == ordering_nd_parallel:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
 	# ===== Elimination Game Plus =====
 	logging.info("===== TEST ELIMINATION GAME PLUS =====")
 	print("TEST ELIMINATION GAME PLUS")
@@ -178,7 +563,32 @@ if DO_TEST_ALGO:
 	print("TEST RANDOMIZED ELIMINATION GAME PLUS")
 	triangulation_egp_r = EG.triangulate_EGPLUS(GRAPH_TEST.copy(), randomized=True)
 	logging.debug("Size of triangulation by randomized elimination game plus: "+str(triangulation_egp_r["size"]))
-	print("ok")
+	# the statistics are taken over the repetitions, each one keeping its smallest minimization:
+	triangulation_egp_repetitions = EG.triangulate_EGPLUS(GRAPH_TEST.copy(), randomized=True, repetitions=3)
+	# the repetitions are run by run_repetitions, so they can be run in parallel and replayed from their seed:
+	graph_egp = nx.gnp_random_graph(30, 0.2, seed=1)
+	random.seed(3)
+	triangulation_egp_seeded = EG.triangulate_EGPLUS(graph_egp, randomized=True, repetitions=3)
+	random.seed(3)
+	triangulation_egp_parallel = EG.triangulate_EGPLUS(graph_egp, randomized=True, repetitions=3, num_workers=2)
+	triangulation_egp_replayed = EG.triangulate_EGPLUS(graph_egp, randomized=True, repetitions=3, seed=triangulation_egp_seeded["seed"])
+	egp_replayed = triangulation_egp_parallel["edges"] == triangulation_egp_seeded["edges"] and triangulation_egp_replayed["edges"] == triangulation_egp_seeded["edges"]
+	if triangulation_egp_repetitions["repetitions"] == 3 and triangulation_egp_repetitions["mean"] == 1 and triangulation_egp_repetitions["size"] == 1 and egp_replayed and nx.is_chordal(triangulation_egp_seeded["H"]):
+		print("ok")
+	else:
+		print("NOT OKAY")
+
+	logging.info("===== TEST REMOVEABLE EDGE DATABASE =====")
+	print("TEST REMOVEABLE EDGE DATABASE")
+	# the chord (0,2) of the 4-cycle is not removeable, since its endpoints have the non-adjacent common neighbors 1 and 3:
+	compact_T = CompactGraph.CompactGraph(GRAPH_TEST)
+	algo_T = CMT.Algorithm_CMT(GRAPH_TEST, False)
+	T_chord = algo_T.get_removeable_edge_database(compact_T, [(0, 2)])
+	T_full = algo_T.get_removeable_edge_database(compact_T, [(0, 2), (1, 3)])
+	if T_chord == {(0, 2) : {(1, 3)}} and T_full == {(0, 2) : set(), (1, 3) : set()} and algo_T.get_removeable_edge_database(compact_T, []) == {}:
+		print("ok")
+	else:
+		print("NOT OKAY")
 
 	# ===== Saturate Minimal Separators =====
 	logging.info("TEST SATURATE MINIMAL SEPARATORS")
@@ -207,6 +617,28 @@ if DO_TEST_ALGO:
 	triangulation_lexm_r = LEX_M.triangulate_LexM(GRAPH_TEST.copy(), randomized=True)
 	logging.debug("Size of triangulation by randomized Lex M: "+str(triangulation_lexm_r["size"]))
 	print("ok")
+
+	# ===== Label partition =====
+	logging.info("===== TEST LABEL PARTITION =====")
+	print("TEST LABEL PARTITION")
+	labels = graph_meta.LabelPartition(5)
+	labels.remove(4)
+	labels.refine([0, 2])
+	top_nodes = set([labels.get_max_node(randomized=True) for i in range(20)])
+	labels.refine([2, 3])
+	(label_ranks, num_labels) = labels.get_ranks()
+	# the classes are {1}, {3}, {0} and {2} by increasing label:
+	ranks_ok = [label_ranks[labels.nodeclass[v]] for v in range(4)] == [2, 0, 3, 1]
+	# the random tie-breaking within the top class leads to different orderings:
+	graph_ties = nx.cycle_graph(12)
+	lexm_alphas = set()
+	for seed in range(5):
+		random.seed(seed)
+		lexm_alphas.add(tuple(sorted(LEX_M.triangulate_LexM(graph_ties, randomized=True, reduce_graph=False)["alpha"].items())))
+	if top_nodes == {0, 2} and labels.get_max_node() == 2 and num_labels == 4 and ranks_ok and len(lexm_alphas) > 1:
+		print("ok")
+	else:
+		print("NOT OKAY")
 	
 	# ===== MCS M =====
 	logging.info("===== TEST MCS M =====")
@@ -236,6 +668,29 @@ if DO_TEST_ALGO:
 	logging.debug("Size of triangulation by randomized CMT: "+str(triangulation_cmt_r["size"]))
 	print("ok")
 
+	# ===== Lower bounds =====
+	logging.info("===== TEST LOWER BOUNDS =====")
+	print("TEST LOWER BOUNDS")
+	# a chordless 6-cycle needs 3 fill edges, two chordless 5-cycles with a common node need 2 each:
+	compact_cycle = CompactGraph.CompactGraph(nx.cycle_graph(6))
+	graph_two_cycles = nx.cycle_graph(5)
+	nx.add_cycle(graph_two_cycles, [0, 5, 6, 7, 8])
+	compact_two_cycles = CompactGraph.CompactGraph(graph_two_cycles)
+	cycles_found = LowerBounds.get_disjoint_chordless_cycles(compact_cycle)
+	# MT starts with edge sets of the size of the lower bound, which is the size of the minimal triangulation here:
+	triangulation_mt_bound = MT.triangulate_MT(nx.cycle_graph(6), count_operations=True)
+	# the bound of each component is computed once, for the search of MT and for the result:
+	algo_mt_bound = MT.Algorithm_MinimumTriangulation(graph_two_cycles)
+	algo_mt_bound.run()
+	bound_computed_once = algo_mt_bound.get_fill_lower_bound() == 4 and len(algo_mt_bound.component_fill_lower_bounds) == 1 and algo_mt_bound.get_profile()["phases"]["lower_bound"]["calls"] == 1
+	# the other algorithms only report the bound on request:
+	triangulation_eg_bound = EG.triangulate_EG(graph_two_cycles, report_lower_bound=True)
+	bound_reported = triangulation_eg_bound["lower_bound"] == 4 and "lower_bound" not in EG.triangulate_EG(graph_two_cycles)
+	if LowerBounds.get_fill_lower_bound(compact_cycle) == 3 and LowerBounds.get_fill_lower_bound(compact_two_cycles) == 4 and len(cycles_found) == 1 and len(cycles_found[0]) == 6 and triangulation_mt_bound["lower_bound"] == 3 and triangulation_mt_bound["operation_counts"]["is_chordal"] == 1 and bound_computed_once and bound_reported:
+		print("ok")
+	else:
+		print("NOT OKAY")
+
 	# ===== Minimum Triangulation =====
 	logging.info("===== TEST MINIMUM TRIANGULATION =====")
 	print("TEST MINIMUM TRIANGULATION")
@@ -257,4 +712,6 @@ if DO_TEST_ALGO:
 	triangulation_ramt = RAMT.triangulate_RAMT(GRAPH_TEST.copy())
 	logging.debug("Size of rand. approx. for minimum triangulation "+str(triangulation_ramt["size"]))
 	print("ok")
-	'''
\ No newline at end of file
+	'''
+
+shutil.rmtree(TEST_DIRECTORY, ignore_errors=True)